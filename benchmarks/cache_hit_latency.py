@@ -0,0 +1,54 @@
+"""Cache-hit latency while the rate limiter and semaphore are saturated.
+
+Every concurrency slot is held and the global rate limit is spent for the
+next ten seconds, so any request that has to wait for either would stall.
+Memory-tier hits are served before both and should stay in microseconds.
+
+    python -m benchmarks.cache_hit_latency [requests]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from esihub import ESIHubClient, ESIHubSlimResponse
+from esihub.core.config import ESIHubConfig
+
+
+async def main(count):
+    config = ESIHubConfig()
+    config.update(
+        {"LOG_LEVEL": "WARNING", "MAX_CONCURRENT_REQUESTS": 4, "LOOP_LAG_INTERVAL": 0}
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    try:
+        body = b'{"players": 31337, "server_version": "2500000"}'
+        await client.cache.set(
+            "GET", "/status/", {}, ESIHubSlimResponse(200, body, {}), {}
+        )
+
+        for _ in range(4):
+            await client.semaphore.acquire()
+        client.rate_limiter.global_remaining = 0
+        client.rate_limiter.global_reset = time.time() + 10
+
+        timings = []
+        for _ in range(count):
+            started = time.perf_counter()
+            response = await client.request("GET", "/status/")
+            response.data
+            timings.append((time.perf_counter() - started) * 1e6)
+
+        timings.sort()
+        print(f"cache hits with saturated limiter and semaphore ({count} requests)")
+        print(f"  median {statistics.median(timings):8.1f} us")
+        print(f"  p99    {timings[int(len(timings) * 0.99) - 1]:8.1f} us")
+        print(f"  max    {timings[-1]:8.1f} us")
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
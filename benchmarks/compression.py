@@ -0,0 +1,129 @@
+"""Transfer compression against a local stand-in ESI server.
+
+Serves one market orders page (1000 orders, like a full ESI page) from a
+local aiohttp server, precompressed with gzip and brotli, and fetches it
+repeatedly with each Accept-Encoding. Reports bytes on the wire vs decoded
+bytes per request, wall time, and the time spent decompressing (in the
+worker pool, off the event loop).
+
+Loopback has no bandwidth cost, so identity is the fastest here; the point
+is the wire bytes against the decompression cost.
+
+    python -m benchmarks.compression [requests]
+"""
+
+import asyncio
+import gzip
+import json
+import random
+import sys
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import ESIHubClient
+from esihub.core.config import ESIHubConfig
+from esihub.core.decoder import brotli
+
+ROUTE = "/markets/{region_id}/orders/"
+
+
+def market_page(count=1000):
+    rng = random.Random(42)
+    return [
+        {
+            "duration": rng.choice([1, 3, 7, 14, 30, 90]),
+            "is_buy_order": rng.random() < 0.5,
+            "issued": f"2026-10-{rng.randint(1, 19):02d}T{rng.randint(0, 23):02d}:"
+            f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z",
+            "location_id": rng.choice([60003760, 60008494, 60011866, 1028858195912]),
+            "min_volume": 1,
+            "order_id": 6000000000 + rng.randint(0, 99999999),
+            "price": round(rng.uniform(0.01, 5e9), 2),
+            "range": rng.choice(["region", "station", "solarsystem", "5", "10"]),
+            "system_id": rng.choice([30000142, 30002187, 30002659, 30002510]),
+            "type_id": rng.randint(18, 60000),
+            "volume_remain": rng.randint(1, 1000000),
+            "volume_total": rng.randint(1, 1000000),
+        }
+        for _ in range(count)
+    ]
+
+
+async def start_server():
+    raw = json.dumps(market_page()).encode()
+    bodies = {"gzip": gzip.compress(raw)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(raw)
+
+    async def orders(request):
+        accepted = request.headers.get("Accept-Encoding", "")
+        for encoding in ("br", "gzip"):
+            if encoding in bodies and encoding in accepted:
+                return web.Response(
+                    body=bodies[encoding],
+                    headers={"Content-Encoding": encoding},
+                    content_type="application/json",
+                )
+        return web.Response(body=raw, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/latest/markets/{region_id}/orders/", orders)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def run(server, encoding, count):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+            "LOG_LEVEL": "WARNING",
+            "CACHE_ENABLED": False,
+            "LOOP_LAG_INTERVAL": 0,
+            "SHARED_TRANSPORT": False,
+            "ACCEPT_ENCODING": encoding,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    try:
+        started = time.perf_counter()
+        for _ in range(count):
+            response = await client.request(
+                "GET", "/markets/10000002/orders/", params={"order_type": "all"}
+            )
+            response.data
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+
+    transfer = client.metrics.transfer_bytes
+    wire = transfer.labels(route=ROUTE, kind="wire")._value.get() / count
+    decoded = transfer.labels(route=ROUTE, kind="decoded")._value.get() / count
+    decompression = client.metrics.decompression_seconds.labels(encoding=encoding)
+    print(
+        f"  {encoding:9} wire {wire / 1024:7.1f} KiB  decoded {decoded / 1024:7.1f} KiB"
+        f"  ratio {decoded / wire:4.1f}x  {elapsed / count * 1000:5.2f} ms/req"
+        f"  decompress {decompression._sum.get() / count * 1000:5.2f} ms/req"
+    )
+
+
+async def main(count):
+    server = await start_server()
+    try:
+        print(f"market orders page, {count} requests per encoding")
+        for encoding in ("identity", "gzip", "br"):
+            if encoding == "br" and brotli is None:
+                print("  br        skipped, brotli is not installed")
+                continue
+            await run(server, encoding, count)
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,116 @@
+"""Per-entry memory cost of cached responses.
+
+Builds the same set of cache entries as ESIHubResponse (what the memory
+tier used to hold) and as detached ESIHubSlimResponse objects, and reports
+the traced allocation size per entry.
+
+    python -m benchmarks.response_memory [entries]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from multidict import CIMultiDict
+
+from esihub.models import ESIHubResponse, ESIHubSlimResponse
+
+HEADERS = CIMultiDict(
+    {
+        "Access-Control-Allow-Credentials": "true",
+        "Access-Control-Allow-Headers": "Content-Type,Authorization,If-None-Match,X-User-Agent",
+        "Access-Control-Allow-Methods": "GET,HEAD,OPTIONS",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Expose-Headers": "Content-Type,Warning,ETag,X-Pages,X-ESI-Error-Limit-Remain,X-ESI-Error-Limit-Reset",
+        "Access-Control-Max-Age": "600",
+        "Allow": "GET,HEAD,OPTIONS",
+        "Cache-Control": "public",
+        "Content-Length": "0",
+        "Content-Type": "application/json; charset=UTF-8",
+        "Date": "Mon, 19 Oct 2026 10:00:00 GMT",
+        "Etag": '"4b2d0d5e9e8c6b5a1f0e3d2c1b0a9f8e7d6c5b4a3f2e1d0c9b8a7f6e"',
+        "Expires": "Mon, 19 Oct 2026 10:05:00 GMT",
+        "Last-Modified": "Mon, 19 Oct 2026 10:00:00 GMT",
+        "Strict-Transport-Security": "max-age=31536000",
+        "Vary": "Accept-Encoding",
+        "X-Esi-Error-Limit-Remain": "100",
+        "X-Esi-Error-Limit-Reset": "60",
+        "X-Esi-Request-Id": "c1f6e2a0-1b2c-4d5e-8f90-a1b2c3d4e5f6",
+        "X-Pages": "1",
+    }
+)
+
+PAYLOADS = {
+    "character": {
+        "alliance_id": 434243723,
+        "birthday": "2015-03-24T11:37:00Z",
+        "bloodline_id": 3,
+        "corporation_id": 109299958,
+        "description": "",
+        "gender": "male",
+        "name": "CCP Bartender",
+        "race_id": 2,
+        "title": "All round pretty awesome guy",
+    },
+    "orders": [
+        {
+            "duration": 90,
+            "is_buy_order": i % 2 == 0,
+            "issued": "2026-10-19T05:12:25Z",
+            "location_id": 60003760,
+            "min_volume": 1,
+            "order_id": 6000000000 + i,
+            "price": 4.99 + i,
+            "range": "region",
+            "system_id": 30000142,
+            "type_id": 34 + i % 50,
+            "volume_remain": 1000 + i,
+            "volume_total": 2000 + i,
+        }
+        for i in range(20)
+    ],
+}
+
+
+def fresh_headers():
+    # Real responses carry their own header strings, so copy them.
+    return CIMultiDict(
+        {(name + " ")[:-1]: (value + " ")[:-1] for name, value in HEADERS.items()}
+    )
+
+
+def measure(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entries = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entries
+    return (after - before) / count
+
+
+def main(count):
+    for name, payload in PAYLOADS.items():
+        raw = json.dumps(payload).encode()
+
+        def full(i):
+            return ESIHubResponse(
+                status=200, headers=dict(fresh_headers()), data=json.loads(raw)
+            )
+
+        def slim(i):
+            return ESIHubSlimResponse(
+                200, bytes(bytearray(raw)), fresh_headers()
+            ).detached()
+
+        full_size = measure(full, count)
+        slim_size = measure(slim, count)
+        print(
+            f"{name:10} ESIHubResponse {full_size:8.0f} B  "
+            f"ESIHubSlimResponse {slim_size:8.0f} B  "
+            f"{full_size / slim_size:5.1f}x smaller"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
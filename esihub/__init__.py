@@ -6,8 +6,12 @@ from .exceptions import (
     ESIHubServerError,
     ESIHubClientError,
     ESIHubValidationError,
+    ESIHubTimeoutError,
+    ESIHubConnectionError,
+    ESIHubCircuitOpenError,
+    ESIHubDeadlineExceededError,
 )
-from .models import ESIHubRequestParams, ESIHubResponse
+from .models import ESIHubRequestParams, ESIHubResponse, ESIHubSlimResponse
 
 __all__ = [
     "ESIHubClient",
@@ -17,8 +21,13 @@ __all__ = [
     "ESIHubServerError",
     "ESIHubClientError",
     "ESIHubValidationError",
+    "ESIHubTimeoutError",
+    "ESIHubConnectionError",
+    "ESIHubCircuitOpenError",
+    "ESIHubDeadlineExceededError",
     "ESIHubRequestParams",
     "ESIHubResponse",
+    "ESIHubSlimResponse",
 ]
 
 __version__ = "0.0.0"
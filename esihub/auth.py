@@ -1,20 +1,37 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 from urllib.parse import urlencode
 
 import aiohttp
 
 from .core.config import ESIHubConfig
+from .core.connection_pool import ESIConnectionPool
+from .core.jwt_validator import ESIHubJWKSCache, ESIHubJWTValidator
 from .exceptions import ESIHubAuthenticationError
 
 
 class ESIHubAuth:
-    def __init__(self, config: ESIHubConfig):
+    def __init__(
+        self,
+        config: ESIHubConfig,
+        connection_pool: Optional[ESIConnectionPool] = None,
+    ):
         self.config = config
+        self.connection_pool = connection_pool
+        self.session: Optional[aiohttp.ClientSession] = None
 
         self.auth_base_url = "https://login.eveonline.com"
         self.token_url = f"{self.auth_base_url}/v2/oauth/token"
         self.authorize_url = f"{self.auth_base_url}/v2/oauth/authorize"
         self.verify_url = f"{self.auth_base_url}/oauth/verify"
+        self.jwks_url = f"{self.auth_base_url}/oauth/jwks"
+
+        self.jwks = ESIHubJWKSCache(
+            self.get_jwks,
+            refresh_interval=self.config.get("SSO_JWKS_REFRESH_INTERVAL", 3600),
+        )
+        if self.config.get("SSO_JWKS_FILE"):
+            self.jwks.load_file(self.config.get("SSO_JWKS_FILE"))
+        self.jwt_validator = ESIHubJWTValidator(self.jwks, config)
 
     async def get_auth_url(self, scopes: str = None, state: str = None) -> str:
         params = {
@@ -28,48 +45,74 @@ class ESIHubAuth:
             params["state"] = state
         return f"{self.authorize_url}?{urlencode(params)}"
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            if self.connection_pool is None:
+                self.connection_pool = ESIConnectionPool.shared(self.config)
+            self.session = await self.connection_pool.acquire()
+        return self.session
+
+    async def close(self) -> None:
+        if self.session is not None:
+            self.session = None
+            await self.connection_pool.release()
+
     async def get_token_verify(self, token: str) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self.verify_url,
-                headers={"Authorization": f"Bearer {token}"},
-            ) as resp:
-                if resp.status != 200:
-                    raise ESIHubAuthenticationError(
-                        f"Failed to verify token: {await resp.text()}"
-                    )
-                return await resp.json()
+        session = await self._get_session()
+        async with session.get(
+            self.verify_url,
+            headers={"Authorization": f"Bearer {token}"},
+        ) as resp:
+            if resp.status != 200:
+                raise ESIHubAuthenticationError(
+                    f"Failed to verify token: {await resp.text()}"
+                )
+            return await resp.json()
+
+    async def verify_token(
+        self, token: str, scopes: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        return await self.jwt_validator.verify(token, scopes)
+
+    async def get_jwks(self) -> Dict[str, Any]:
+        session = await self._get_session()
+        async with session.get(self.jwks_url) as resp:
+            if resp.status != 200:
+                raise ESIHubAuthenticationError(
+                    f"Failed to fetch JWKS: {await resp.text()}"
+                )
+            return await resp.json()
 
     async def get_access_token(self, code: str) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.token_url,
-                data={
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "client_id": self.config.get("ESI_CLIENT_ID"),
-                    "client_secret": self.config.get("ESI_CLIENT_SECRET"),
-                },
-            ) as resp:
-                if resp.status != 200:
-                    raise ESIHubAuthenticationError(
-                        f"Failed to get access token: {await resp.text()}"
-                    )
-                return await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            self.token_url,
+            data={
+                "grant_type": "authorization_code",
+                "code": code,
+                "client_id": self.config.get("ESI_CLIENT_ID"),
+                "client_secret": self.config.get("ESI_CLIENT_SECRET"),
+            },
+        ) as resp:
+            if resp.status != 200:
+                raise ESIHubAuthenticationError(
+                    f"Failed to get access token: {await resp.text()}"
+                )
+            return await resp.json()
 
     async def refresh_token(self, refresh_token: str) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.token_url,
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": refresh_token,
-                    "client_id": self.config.get("ESI_CLIENT_ID"),
-                    "client_secret": self.config.get("ESI_CLIENT_SECRET"),
-                },
-            ) as resp:
-                if resp.status != 200:
-                    raise ESIHubAuthenticationError(
-                        f"Failed to refresh token: {await resp.text()}"
-                    )
-                return await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            self.token_url,
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+                "client_id": self.config.get("ESI_CLIENT_ID"),
+                "client_secret": self.config.get("ESI_CLIENT_SECRET"),
+            },
+        ) as resp:
+            if resp.status != 200:
+                raise ESIHubAuthenticationError(
+                    f"Failed to refresh token: {await resp.text()}"
+                )
+            return await resp.json()
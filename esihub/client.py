@@ -1,4 +1,6 @@
 import asyncio
+import time
+from contextlib import aclosing, asynccontextmanager
 from typing import (
     Any,
     Dict,
@@ -8,30 +10,62 @@ from typing import (
     TypeVar,
     Callable,
     Awaitable,
+    AsyncIterable,
     AsyncIterator,
+    Iterable,
+    Tuple,
+    Union,
 )
 
 import aiohttp
-from aiohttp import ClientSession, TCPConnector
-from pydantic import BaseModel, ValidationError
+from aiohttp import ClientSession
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from esihub.api.endpoints import generate_endpoints
 from esihub.auth import ESIHubAuth
+from esihub.core.auto_batcher import ESIHubAutoBatcher
 from esihub.core.async_profiler import ESIHubAsyncProfiler, profile
 from esihub.core.background_tasks import ESIHubBackgroundTaskManager
+from esihub.core.bulk_executor import ESIHubBulkExecutor, ESIHubBulkResult
 from esihub.core.cache import ESIHubCache
+from esihub.core.circuit_breaker import ESIHubCircuitBreaker, ESIHubCircuitBreakers
+from esihub.core.columnar import ESIHubColumnarBatch
+from esihub.core.concurrency import ESIHubAdaptiveLimiter
 from esihub.core.config import ESIHubConfig, esi_config
+from esihub.core.connection_pool import ESIConnectionPool
+from esihub.core.decoder import (
+    ESIHubLoopLagMonitor,
+    ESIHubPayloadDecoder,
+    supported_encodings,
+)
 from esihub.core.dry_run import ESIHubDryRunMode
 from esihub.core.error_handler import ESIHubErrorHandler
 from esihub.core.event_system import ESIHubEventSystem
+from esihub.core.exporter import ESIHubExporter
+from esihub.core.hedging import ESIHubHedger
+from esihub.core.json_stream import ESIHubJSONArrayDecoder
 from esihub.core.logger import configure_logging, esihub_logger
+from esihub.core.market_feed import ESIHubMarketOrderFeed
 from esihub.core.metrics import ESIHubMetrics
 from esihub.core.rate_limiter import ESIHubRateLimiter
-from esihub.exceptions import ESIHubValidationError, ESIHubError
-from esihub.models import ESIHubResponse, ESIHubRequestParams
+from esihub.core.resolver import ESIHubNameResolver
+from esihub.core.request_validator import ESIHubRequestValidator
+from esihub.core.response_models import ESIHubResponseModels
+from esihub.core.scheduler import PRIORITY_NORMAL
+from esihub.core.retry_policy import ESIHubRetryPolicy
+from esihub.core.spec_index import ESIHubSpecIndex
+from esihub.core.token_manager import ESIHubTokenManager
+from esihub.exceptions import (
+    ESIHubCircuitOpenError,
+    ESIHubConnectionError,
+    ESIHubDeadlineExceededError,
+    ESIHubError,
+    ESIHubTimeoutError,
+    ESIHubValidationError,
+)
+from esihub.models import ESIHubResponse, ESIHubRequestParams, ESIHubSlimResponse
 from esihub.utils import (
     validate_url,
-    retry_with_exponential_backoff,
     validate_input,
     load_swagger_spec,
 )
@@ -48,6 +82,8 @@ class ESIHubClient:
         rate_limiter: Optional[ESIHubRateLimiter] = None,
         error_handler: Optional[ESIHubErrorHandler] = None,
         event_system: Optional[ESIHubEventSystem] = None,
+        connection_pool: Optional[ESIConnectionPool] = None,
+        token_manager: Optional[ESIHubTokenManager] = None,
     ) -> None:
         self.config = config
         self.base_url = self.config.get("ESI_BASE_URL")
@@ -56,23 +92,49 @@ class ESIHubClient:
         if self.config.get("USE_HTTPS") and not self.base_url.startswith("https://"):
             raise ValueError("HTTPS is required")
 
-        self.auth = auth or ESIHubAuth(config)
+        self.connection_pool = connection_pool
+        self.auth = auth or ESIHubAuth(config, connection_pool=connection_pool)
+        self.token_manager = token_manager or ESIHubTokenManager(
+            self.auth, config=config
+        )
         self.cache = cache or ESIHubCache(config)
         self.rate_limiter = rate_limiter or ESIHubRateLimiter(config)
         self.error_handler = error_handler or ESIHubErrorHandler()
         self.event_system = event_system or ESIHubEventSystem()
         self.session: Optional[ClientSession] = None
-        self.semaphore = asyncio.Semaphore(
-            self.config.get("MAX_CONCURRENT_REQUESTS", 100)
-        )
+        self.default_headers = {
+            "User-Agent": self.config.get("ESI_USER_AGENT"),
+            "Accept-Encoding": self.config.get("ACCEPT_ENCODING")
+            or supported_encodings(),
+        }
 
         self.background_tasks = ESIHubBackgroundTaskManager()
         self.metrics = ESIHubMetrics()
+        self.semaphore = ESIHubAdaptiveLimiter.from_config(self.config, self.metrics)
+        self.decoder = ESIHubPayloadDecoder(self.config, self.metrics)
+        self.retry_policy = ESIHubRetryPolicy(self.config, self.metrics)
+        self.circuit_breakers = ESIHubCircuitBreakers(self.config, self.metrics)
+        self.hedger = ESIHubHedger(self.config, self.metrics)
+        self.loop_monitor = ESIHubLoopLagMonitor(
+            self.metrics, self.config.get("LOOP_LAG_INTERVAL", 0.25)
+        )
         self.dry_run_mode = ESIHubDryRunMode(self)
 
         self.profiler = ESIHubAsyncProfiler()
 
         self.swagger_spec = load_swagger_spec()
+        self.spec_index = ESIHubSpecIndex(self.swagger_spec)
+        self.response_models = ESIHubResponseModels(self.spec_index)
+        self.request_validator = ESIHubRequestValidator(
+            self.spec_index, enabled=self.config.get("REQUEST_VALIDATION", True)
+        )
+        self.auto_batchers: Dict[tuple, ESIHubAutoBatcher] = {}
+        self.market_feeds: Dict[int, ESIHubMarketOrderFeed] = {}
+        self.resolver = ESIHubNameResolver(
+            self,
+            persist_path=self.config.get("RESOLVER_CACHE_FILE"),
+            negative_ttl=self.config.get("RESOLVER_NEGATIVE_TTL", 3600),
+        )
 
         configure_logging(config)
         generate_endpoints(self)
@@ -90,106 +152,417 @@ class ESIHubClient:
         await self.close()
 
     async def initialize(self) -> None:
-        ssl_context = self._create_ssl_context()
-        connector = TCPConnector(
-            limit=self.config.get("MAX_CONNECTIONS", 100), ssl=ssl_context
-        )
-        self.session = ClientSession(
-            connector=connector,
-            headers={"User-Agent": self.config.get("ESI_USER_AGENT")},
-        )
+        if self.session is None:
+            if self.connection_pool is None:
+                if self.config.get("SHARED_TRANSPORT", True):
+                    self.connection_pool = ESIConnectionPool.shared(self.config)
+                else:
+                    self.connection_pool = ESIConnectionPool.from_config(self.config)
+            self.session = await self.connection_pool.acquire()
+            self.metrics.track_transport(self.connection_pool)
+        if self.resolver.persist_path and not len(self.resolver):
+            await asyncio.get_running_loop().run_in_executor(None, self.resolver.load)
         await self.cache.initialize()
         await self.background_tasks.start()
+        if self.config.get("LOOP_LAG_INTERVAL"):
+            await self.loop_monitor.start()
 
     async def close(self) -> None:
         if self.session:
-            await self.session.close()
+            self.session = None
+            await self.connection_pool.release()
+        if self.resolver.persist_path and len(self.resolver):
+            await asyncio.get_running_loop().run_in_executor(None, self.resolver.save)
+        await self.token_manager.close()
+        await self.auth.close()
         await self.cache.close()
         await self.background_tasks.stop()
+        await self.loop_monitor.stop()
+        self.decoder.close()
 
-    @retry_with_exponential_backoff()
     @profile
     async def request(
         self,
         method: str,
         path: str,
-        model: Optional[Type[BaseModel]] = None,
+        model: Union[Type[BaseModel], Any, bool, None] = None,
+        as_model: bool = False,
+        priority: int = PRIORITY_NORMAL,
+        tenant: Optional[Any] = None,
+        deadline: Optional[float] = None,
         **kwargs: Any,
-    ) -> ESIHubResponse:
+    ) -> Union[ESIHubResponse, ESIHubSlimResponse]:
         if not validate_input(path, r"^/[\w\-/{}]+$"):
             raise ValueError("Invalid path")
 
         if self.config.get("DRY_RUN"):
             return await self.dry_run_mode.request(method, path, **kwargs)
 
-        async with self.semaphore:
-            with self.metrics.measure_request_duration(method, path):
-                self.metrics.increment_request(method, path)
-                try:
-                    response = await self._make_request(method, path, **kwargs)
-                    if model:
-                        try:
-                            validated_data = model(**response.data)
-                            response.data = validated_data.model_dump()
-                        except ValidationError as e:
-                            raise ESIHubValidationError(
-                                f"Response validation failed: {e}"
-                            )
-                    return response
-                except Exception as e:
-                    self.metrics.increment_error(type(e).__name__)
-                    raise
+        # Malformed calls are rejected locally instead of spending ESI error
+        # budget on a 400.
+        self.request_validator.validate(method, path, kwargs)
+
+        # Memory-tier hits never touch the semaphore, the rate limiter or the
+        # retry machinery, and need no await unless there is work left to do.
+        cached = self.cache.get_memory(method, path, kwargs)
+        if cached is not None:
+            self.metrics.increment_cache_hit("memory")
+            if model:
+                return await self._validate_response(
+                    method, path, model, as_model, cached
+                )
+            if len(cached.body) >= self.decoder.threshold:
+                await self.decoder.prefetch(cached)
+            return cached
+
+        # ``deadline`` is a budget in seconds for the whole call, queueing and
+        # retries included; below this point it is an absolute loop time.
+        if deadline is None:
+            deadline = self.config.get("REQUEST_DEADLINE") or None
+        if deadline is not None:
+            deadline += asyncio.get_running_loop().time()
+
+        try:
+            return await self.retry_policy.call(
+                method,
+                lambda: self._request_once(
+                    method, path, model, as_model, priority, tenant, deadline, kwargs
+                ),
+                deadline=deadline,
+            )
+        except ESIHubDeadlineExceededError as e:
+            self.metrics.increment_deadline_shed(e.details.get("stage", "unknown"))
+            raise
+
+    async def _request_once(
+        self,
+        method: str,
+        path: str,
+        model: Union[Type[BaseModel], Any, bool, None],
+        as_model: bool,
+        priority: int,
+        tenant: Optional[Any],
+        deadline: Optional[float],
+        kwargs: Dict[str, Any],
+    ) -> Union[ESIHubResponse, ESIHubSlimResponse]:
+        # An open circuit is answered before queueing for a slot or a rate
+        # limit token, neither of which it would use.
+        breaker = self._circuit_breaker(self.spec_index.template_for(method, path))
+        if breaker is not None and breaker.blocked():
+            response = await self._reject_open_circuit(breaker, method, path, kwargs)
+            return await self._finish_response(method, path, model, as_model, response)
 
-    async def _make_request(
-        self, method: str, path: str, **kwargs: Any
-    ) -> ESIHubResponse:
         if not self.session:
             await self.initialize()
 
-        url = f"{self.base_url}/latest{path}"
-        await self.rate_limiter.acquire(path)
+        cached_response = await self.cache.get(method, path, kwargs)
+        if cached_response:
+            return await self._finish_response(
+                method, path, model, as_model, cached_response
+            )
+
+        # Waiting for another worker's cache fill happens before taking a
+        # slot, so waiters do not sit on concurrency they are not using.
+        async with self.cache.fill(method, path, kwargs, deadline) as filled:
+            if filled is not None:
+                return await self._finish_response(
+                    method, path, model, as_model, filled
+                )
+            async with self.semaphore.slot(priority, tenant, deadline):
+                with self.metrics.measure_request_duration(method, path):
+                    self.metrics.increment_request(method, path)
+                    try:
+                        response = await self._make_request(
+                            method, path, deadline=deadline, **kwargs
+                        )
+                        return await self._finish_response(
+                            method, path, model, as_model, response
+                        )
+                    except Exception as e:
+                        self.metrics.increment_error(type(e).__name__)
+                        raise
+
+    async def _finish_response(
+        self,
+        method: str,
+        path: str,
+        model: Union[Type[BaseModel], Any, bool, None],
+        as_model: bool,
+        response: ESIHubSlimResponse,
+    ) -> Union[ESIHubResponse, ESIHubSlimResponse]:
+        if model:
+            return await self._validate_response(
+                method, path, model, as_model, response
+            )
+        await self.decoder.prefetch(response)
+        return response
+
+    async def _validate_response(
+        self,
+        method: str,
+        path: str,
+        model: Union[Type[BaseModel], Any, bool],
+        as_model: bool,
+        response: ESIHubResponse,
+    ) -> ESIHubResponse:
+        body = getattr(response, "body", None)
+        if model is True:
+            adapter = self.response_models.match(method, path)
+            if adapter is None:
+                raise ESIHubValidationError(f"No response schema for {method} {path}")
+        elif isinstance(model, type) and issubclass(model, BaseModel):
+            is_list = (
+                body.lstrip()[:1] == b"[" if body else isinstance(response.data, list)
+            )
+            adapter = self.response_models.adapter(List[model] if is_list else model)
+        else:
+            adapter = self.response_models.adapter(model)
+
+        try:
+            # Generated models cannot be pickled, so never ship them to
+            # a process pool.
+            validated = await self.decoder.run(
+                len(body) if body else 0,
+                self._validate_payload,
+                adapter,
+                body,
+                None if body else response.data,
+                threaded=True,
+            )
+        except ValidationError as e:
+            raise ESIHubValidationError(f"Response validation failed: {e}")
+
+        if not as_model:
+            validated = adapter.dump_python(
+                validated, mode="json" if model is True else "python"
+            )
+        # Cache hits are detached copies, so this never touches the cache.
+        response.data = validated
+        return response
+
+    @staticmethod
+    def _validate_payload(
+        adapter: TypeAdapter, body: Optional[bytes], data: Any
+    ) -> Any:
+        if body:
+            return adapter.validate_json(body)
+        return adapter.validate_python(data)
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> ESIHubSlimResponse:
+        if not self.session:
+            await self.initialize()
+        return await self._fetch(method, path, deadline, kwargs)
 
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        deadline: Optional[float],
+        kwargs: Dict[str, Any],
+    ) -> ESIHubSlimResponse:
+        url = self._build_url(path)
+        if deadline is not None and self._deadline_passed(deadline):
+            raise ESIHubDeadlineExceededError(
+                f"Deadline exceeded before sending {method} {path}",
+                details={"stage": "rate_limit"},
+            )
+        route = self.spec_index.template_for(method, path)
+        breaker = self._circuit_breaker(route)
+        if breaker is not None and not breaker.allow():
+            return await self._reject_open_circuit(breaker, method, path, kwargs)
         try:
-            cached_response = await self.cache.get(method, path, kwargs)
-            if cached_response:
-                return cached_response
+            await self.rate_limiter.acquire(path, deadline)
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
 
+        try:
             params = ESIHubRequestParams(method=method, path=path, **kwargs)
             await self.event_system.emit("before_request", params=params)
 
             esihub_logger.info("Making request", extra={"method": method, "path": path})
 
-            async with self.session.request(method, url, **kwargs) as response:
-                response_data = await response.json()
-
-                self.rate_limiter.update_limit(path, response.headers)
-
-                if response.status >= 400:
-                    await self.error_handler.handle_error(
-                        response.status, response_data
-                    )
+            started = time.monotonic()
+            try:
+                esi_response = await self._send_hedged(
+                    method, path, route, url, params, kwargs, deadline
+                )
+            except BaseException as e:
+                if (
+                    deadline is not None
+                    and isinstance(e, asyncio.TimeoutError)
+                    and self._deadline_passed(deadline)
+                ):
+                    # Cut short by the caller's deadline, which says nothing
+                    # about the health of the route.
+                    if breaker is not None:
+                        breaker.release()
+                    raise ESIHubDeadlineExceededError(
+                        f"Deadline exceeded during {method} {path}",
+                        details={"stage": "network"},
+                    ) from e
+                self._record_outcome(route, breaker, started, e)
+                raise
+            self._record_outcome(route, breaker, started)
+            return esi_response
+        except asyncio.TimeoutError as e:
+            esihub_logger.error("Request timed out", extra={"path": path})
+            raise ESIHubTimeoutError(f"Request timed out: {method} {path}") from e
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            esihub_logger.error("Connection failed", extra={"error": str(e)})
+            raise ESIHubConnectionError(f"Request failed: {str(e)}") from e
+        except aiohttp.ClientError as e:
+            esihub_logger.error("Request failed", extra={"error": str(e)})
+            raise ESIHubError(f"Request failed: {str(e)}")
 
-                esi_response = ESIHubResponse(
-                    status=response.status,
-                    headers=dict(response.headers),
-                    data=response_data,
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        route: str,
+        url: str,
+        params: ESIHubRequestParams,
+        kwargs: Dict[str, Any],
+        deadline: Optional[float] = None,
+    ) -> ESIHubSlimResponse:
+        request_kwargs = self._with_default_headers(kwargs)
+        if deadline is not None:
+            # aiohttp reads a zero total as "no timeout", hence the floor.
+            remaining = deadline - asyncio.get_running_loop().time()
+            request_kwargs["timeout"] = aiohttp.ClientTimeout(
+                total=max(remaining, 0.001)
+            )
+        # Bodies are decompressed by the decoder rather than by aiohttp on
+        # the event loop, unless the caller asks for aiohttp to do it.
+        request_kwargs.setdefault("auto_decompress", False)
+        async with self.session.request(method, url, **request_kwargs) as response:
+            esi_response = ESIHubSlimResponse(
+                response.status,
+                await self._read_body(response, route, request_kwargs),
+                response.headers,
+                loads=self.decoder.loads,
+            )
+
+            self.rate_limiter.update_limit(path, response.headers)
+
+            if response.status >= 400:
+                try:
+                    error_data = await self.decoder.decode(esi_response.body)
+                except ValueError:
+                    error_data = {"error": esi_response.body.decode(errors="replace")}
+                await self.error_handler.handle_error(
+                    response.status, error_data, response.headers
                 )
 
+            # A 304 only answers one conditional request; cached, it would
+            # keep answering the same If-None-Match after the data changed.
+            if response.status != 304:
                 await self.cache.set(
                     method, path, kwargs, esi_response, response.headers
                 )
 
-                esihub_logger.info(
-                    "Received response", extra={"status": response.status}
-                )
-                await self.event_system.emit(
-                    "after_request", params=params, response=esi_response
-                )
+            esihub_logger.info("Received response", extra={"status": response.status})
+            await self.event_system.emit(
+                "after_request", params=params, response=esi_response
+            )
 
-                return esi_response
-        except aiohttp.ClientError as e:
-            esihub_logger.error("Request failed", extra={"error": str(e)})
-            raise ESIHubError(f"Request failed: {str(e)}")
+            return esi_response
+
+    async def _read_body(
+        self,
+        response: aiohttp.ClientResponse,
+        route: str,
+        request_kwargs: Dict[str, Any],
+    ) -> bytes:
+        wire = await response.read()
+        body = wire
+        encoding = response.headers.get("Content-Encoding")
+        if encoding and not request_kwargs["auto_decompress"]:
+            try:
+                body = await self.decoder.decompress(wire, encoding)
+            except Exception as e:
+                raise ESIHubError(
+                    f"Failed to decompress {encoding} response: {str(e)}"
+                ) from e
+        self.metrics.record_transfer(route, len(wire), len(body))
+        return body
+
+    async def _send_hedged(
+        self,
+        method: str,
+        path: str,
+        route: str,
+        url: str,
+        params: ESIHubRequestParams,
+        kwargs: Dict[str, Any],
+        deadline: Optional[float] = None,
+    ) -> ESIHubSlimResponse:
+        if not self.hedger.applies(method, route):
+            return await self._send(method, path, route, url, params, kwargs, deadline)
+        return await self.hedger.run(
+            route,
+            lambda: self._send(method, path, route, url, params, kwargs, deadline),
+            lambda: self.rate_limiter.try_acquire(path),
+        )
+
+    def _record_outcome(
+        self,
+        route: str,
+        breaker: Optional[ESIHubCircuitBreaker],
+        started: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if breaker is not None:
+            if error is None:
+                breaker.record_success()
+            else:
+                self.circuit_breakers.record_error(breaker, error)
+        self.semaphore.observe(
+            route,
+            time.monotonic() - started,
+            error,
+            self.rate_limiter.error_limit_remain,
+        )
+
+    @staticmethod
+    def _deadline_passed(deadline: float) -> bool:
+        return asyncio.get_running_loop().time() >= deadline
+
+    def _circuit_breaker(self, route: str) -> Optional[ESIHubCircuitBreaker]:
+        if not self.circuit_breakers.enabled:
+            return None
+        return self.circuit_breakers.get(route)
+
+    async def _reject_open_circuit(
+        self,
+        breaker: ESIHubCircuitBreaker,
+        method: str,
+        path: str,
+        kwargs: Dict[str, Any],
+    ) -> ESIHubSlimResponse:
+        stale = self.cache.get_stale(method, path, kwargs)
+        if stale:
+            self.metrics.increment_circuit_rejection(breaker.name, "stale")
+            esihub_logger.warning(
+                "Circuit open, serving stale response", extra={"route": breaker.name}
+            )
+            return stale
+        raise self._circuit_open_error(breaker)
+
+    def _circuit_open_error(
+        self, breaker: ESIHubCircuitBreaker
+    ) -> ESIHubCircuitOpenError:
+        self.metrics.increment_circuit_rejection(breaker.name, "failed")
+        return ESIHubCircuitOpenError(
+            f"Circuit open for {breaker.name}", details={"route": breaker.name}
+        )
 
     async def batch_request(self, requests: List[Dict[str, Any]]) -> tuple[Any]:
         async def bounded_request(req: Dict[str, Any]) -> ESIHubResponse:
@@ -197,35 +570,206 @@ class ESIHubClient:
 
         return await asyncio.gather(*(bounded_request(req) for req in requests))
 
+    async def batch_request_stream(
+        self,
+        requests: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, Union[ESIHubResponse, BaseException]]]:
+        executor = ESIHubBulkExecutor(concurrency or self.config.get("BULK_WINDOW", 50))
+
+        async def send(req: Dict[str, Any]) -> ESIHubResponse:
+            return await self.request(**req)
+
+        async for outcome in executor.stream(send, requests):
+            yield outcome.index, outcome.result if outcome.ok else outcome.error
+
     async def stream_request(
-        self, method: str, path: str, **kwargs: Any
+        self, method: str, path: str, deadline: Optional[float] = None, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        async with self._open_stream(method, path, deadline, **kwargs) as response:
+            async for chunk in response.content.iter_any():
+                yield chunk
+
+    async def stream_items(
+        self, method: str, path: str, deadline: Optional[float] = None, **kwargs: Any
     ) -> AsyncIterator[Any]:
+        decoder = ESIHubJSONArrayDecoder()
+        async with self._open_stream(method, path, deadline, **kwargs) as response:
+            async for chunk in response.content.iter_any():
+                for item in decoder.feed(chunk):
+                    yield item
+        for item in decoder.close():
+            yield item
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        method: str,
+        path: str,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        # The same pre-flight as request(): validation, the route's breaker,
+        # the deadline and the rate limiter. Streamed bodies have no cache
+        # entry, so an open circuit fails outright.
+        if not validate_input(path, r"^/[\w\-/{}]+$"):
+            raise ValueError("Invalid path")
+        self.request_validator.validate(method, path, kwargs)
+        route = self.spec_index.template_for(method, path)
+        breaker = self._circuit_breaker(route)
+        if breaker is not None and breaker.blocked():
+            raise self._circuit_open_error(breaker)
         if not self.session:
             await self.initialize()
 
-        url = f"{self.base_url}{path}"
-        await self.rate_limiter.acquire(path)
+        if deadline is None:
+            deadline = self.config.get("REQUEST_DEADLINE") or None
+        if deadline is not None:
+            deadline += asyncio.get_running_loop().time()
 
-        async with self.session.request(method, url, **kwargs) as response:
-            async for chunk in response.content.iter_any():
-                yield chunk
+        async with self.semaphore.slot(deadline=deadline):
+            with self.metrics.measure_request_duration(method, path):
+                self.metrics.increment_request(method, path)
+                if breaker is not None and not breaker.allow():
+                    raise self._circuit_open_error(breaker)
+                try:
+                    await self.rate_limiter.acquire(path, deadline)
+                except BaseException:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                try:
+                    params = ESIHubRequestParams(method=method, path=path, **kwargs)
+                    await self.event_system.emit("before_request", params=params)
+                    esihub_logger.info(
+                        "Streaming request", extra={"method": method, "path": path}
+                    )
+                    request_kwargs = self._with_default_headers(kwargs)
+                    if deadline is not None:
+                        remaining = deadline - asyncio.get_running_loop().time()
+                        request_kwargs["timeout"] = aiohttp.ClientTimeout(
+                            total=max(remaining, 0.001)
+                        )
+                    async with self.session.request(
+                        method, self._build_url(path), **request_kwargs
+                    ) as response:
+                        self.rate_limiter.update_limit(path, response.headers)
+                        if response.status >= 400:
+                            await self.error_handler.handle_error(
+                                response.status, await self._read_error(response)
+                            )
+                        yield response
+                except Exception as e:
+                    self.metrics.increment_error(type(e).__name__)
+                    deadline_hit = (
+                        deadline is not None
+                        and isinstance(e, asyncio.TimeoutError)
+                        and self._deadline_passed(deadline)
+                    )
+                    if breaker is not None:
+                        if deadline_hit:
+                            breaker.release()
+                        else:
+                            self.circuit_breakers.record_error(breaker, e)
+                    if deadline_hit:
+                        raise ESIHubDeadlineExceededError(
+                            f"Deadline exceeded during {method} {path}",
+                            details={"stage": "network"},
+                        ) from e
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise ESIHubTimeoutError(
+                            f"Request timed out: {method} {path}"
+                        ) from e
+                    if isinstance(
+                        e, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+                    ):
+                        esihub_logger.error(
+                            "Connection failed", extra={"error": str(e)}
+                        )
+                        raise ESIHubConnectionError(f"Request failed: {str(e)}") from e
+                    if isinstance(e, aiohttp.ClientError):
+                        esihub_logger.error("Request failed", extra={"error": str(e)})
+                        raise ESIHubError(f"Request failed: {str(e)}") from e
+                    raise
+                except BaseException:
+                    # Cancelled, or the consumer stopped reading early.
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                if breaker is not None:
+                    breaker.record_success()
+
+    @staticmethod
+    async def _read_error(response: aiohttp.ClientResponse) -> Dict[str, Any]:
+        try:
+            data = await response.json(content_type=None)
+        except ValueError:
+            data = None
+        return data if isinstance(data, dict) else {"error": await response.text()}
 
     async def bulk_operation(
-        self, operation: str, items: List[Any], batch_size: int = 100
+        self,
+        operation: Union[str, Callable[..., Awaitable[Any]]],
+        items: List[Any],
+        batch_size: int = 100,
+        window: int = 1,
+        return_exceptions: bool = False,
     ) -> List[Any]:
+        func = self._resolve_operation(operation)
+        batches = (items[i : i + batch_size] for i in range(0, len(items), batch_size))
+        batch_results: Dict[int, List[Any]] = {}
+
+        # Closing the stream on the first error cancels the batches still in
+        # flight and stops new ones from starting.
+        async with aclosing(ESIHubBulkExecutor(window).stream(func, batches)) as stream:
+            async for outcome in stream:
+                if outcome.ok:
+                    batch_results[outcome.index] = list(outcome.result)
+                elif return_exceptions:
+                    batch_results[outcome.index] = [outcome.error] * len(outcome.item)
+                else:
+                    raise outcome.error
+
         results = []
-        for i in range(0, len(items), batch_size):
-            batch = items[i : i + batch_size]
-            batch_results = await getattr(self, operation)(batch)
-            results.extend(batch_results)
+        for index in sorted(batch_results):
+            results.extend(batch_results[index])
         return results
 
-    def _create_ssl_context(self):
-        import ssl
+    async def bulk_stream(
+        self,
+        operation: Union[str, Callable[..., Awaitable[Any]]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        window: Optional[int] = None,
+    ) -> AsyncIterator[ESIHubBulkResult]:
+        func = self._resolve_operation(operation)
+
+        async def call(item: Any) -> Any:
+            if isinstance(item, dict):
+                return await func(**item)
+            return await func(item)
+
+        executor = ESIHubBulkExecutor(window or self.config.get("BULK_WINDOW", 50))
+        async for outcome in executor.stream(call, items):
+            yield outcome
+
+    def _resolve_operation(
+        self, operation: Union[str, Callable[..., Awaitable[Any]]]
+    ) -> Callable[..., Awaitable[Any]]:
+        if isinstance(operation, str):
+            return getattr(self, operation)
+        return operation
+
+    def _build_url(self, path: str) -> str:
+        return f"{self.base_url}/latest{path}"
+
+    def _with_default_headers(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **kwargs,
+            "headers": {**self.default_headers, **(kwargs.get("headers") or {})},
+        }
 
-        ssl_context = ssl.create_default_context()
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-        return ssl_context
+    def _create_ssl_context(self):
+        return ESIConnectionPool._create_ssl_context()
 
     async def paginated_request(
         self, method: str, path: str, **kwargs
@@ -243,6 +787,45 @@ class ESIHubClient:
             else:
                 break
 
+    def auto_batcher(self, operation_id: str, **options: Any) -> ESIHubAutoBatcher:
+        key = (operation_id, tuple(sorted(options.items())))
+        if key not in self.auto_batchers:
+            self.auto_batchers[key] = ESIHubAutoBatcher(self, operation_id, **options)
+        return self.auto_batchers[key]
+
+    def market_order_feed(self, region_id: int) -> ESIHubMarketOrderFeed:
+        if region_id not in self.market_feeds:
+            self.market_feeds[region_id] = ESIHubMarketOrderFeed(self, region_id)
+        return self.market_feeds[region_id]
+
+    async def columnar_request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> ESIHubColumnarBatch:
+        matched = self.spec_index.match(method, path)
+        schema = matched[0].response_schema() if matched else None
+        items = self.spec_index.resolve(schema.get("items", {})) if schema else {}
+        if not schema or schema.get("type") != "array" or items.get("type") != "object":
+            raise ESIHubValidationError(f"No list item schema for {method} {path}")
+
+        batch = ESIHubColumnarBatch.from_item_schema(items)
+        async for page in self.paginated_request(method, path, **kwargs):
+            batch.extend(page)
+        return batch
+
+    async def export(
+        self,
+        method: str,
+        path: str,
+        sink: Any,
+        checkpoint_path: Optional[str] = None,
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        exporter = ESIHubExporter(
+            self, sink, checkpoint_path=checkpoint_path, concurrency=concurrency
+        )
+        return await exporter.export(method, path, **kwargs)
+
     async def add_background_task(
         self, coroutine: Callable[..., Awaitable[Any]], *args, **kwargs
     ) -> None:
@@ -0,0 +1,134 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+from cachetools import TTLCache
+
+from .logger import esihub_logger
+from ..exceptions import ESIHubClientError
+from ..utils import replace_path_params
+
+RESULT_KEYS = {
+    "post_universe_names": "id",
+    "post_characters_affiliation": "character_id",
+    "post_characters_character_id_assets_locations": "item_id",
+    "post_characters_character_id_assets_names": "item_id",
+    "post_corporations_corporation_id_assets_locations": "item_id",
+    "post_corporations_corporation_id_assets_names": "item_id",
+}
+
+
+class ESIHubAutoBatcher:
+    def __init__(
+        self,
+        client,
+        operation_id: str,
+        result_key: Optional[str] = None,
+        window: float = 0.01,
+        max_batch_size: Optional[int] = None,
+        cache_ttl: int = 3600,
+        cache_size: int = 100000,
+        **path_params: Any,
+    ):
+        operation = client.spec_index.operation(operation_id)
+        body_schema = operation.body_schema or {}
+        if body_schema.get("type") != "array":
+            raise ValueError(f"{operation_id} does not take a list of IDs")
+
+        self.client = client
+        self.operation = operation
+        self.path = replace_path_params(operation.path, **path_params)
+        self.result_key = result_key or RESULT_KEYS.get(operation_id, "id")
+        self.window = window
+        self.max_batch_size = min(
+            max_batch_size or body_schema.get("maxItems", 1000),
+            body_schema.get("maxItems", 1000),
+        )
+        self.cache: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._queue: List[Any] = []
+        self._futures: Dict[Any, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def load(self, key: Any) -> Any:
+        if key in self.cache:
+            return self.cache[key]
+        future = self._futures.get(key)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if len(self._queue) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.window, self._flush
+                )
+        # The future is shared by every caller of this key, so one caller
+        # being cancelled must not cancel it for the rest.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Any]) -> List[Any]:
+        return await asyncio.gather(*(self.load(key) for key in keys))
+
+    def prime(self, key: Any, value: Any) -> None:
+        self.cache[key] = value
+
+    def clear(self, key: Any = None) -> None:
+        if key is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(key, None)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._queue:
+            chunk = self._queue[: self.max_batch_size]
+            self._queue = self._queue[self.max_batch_size :]
+            task = asyncio.ensure_future(self._dispatch(chunk))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, chunk: List[Any]) -> None:
+        try:
+            results = await self._fetch(chunk)
+        except Exception as e:
+            for key in chunk:
+                future = self._futures.pop(key, None)
+                if future and not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in chunk:
+            value = results.get(key)
+            self.cache[key] = value
+            future = self._futures.pop(key, None)
+            if future and not future.done():
+                future.set_result(value)
+
+    async def _fetch(self, chunk: List[Any]) -> Dict[Any, Any]:
+        try:
+            response = await self.client.request(
+                self.operation.method, self.path, json=chunk
+            )
+        except ESIHubClientError as e:
+            # One unresolvable ID fails the whole call; split the chunk so
+            # every other caller still gets its own result.
+            if e.status_code != 404:
+                raise
+            if len(chunk) == 1:
+                return {}
+            esihub_logger.debug("Splitting batch after 404", extra={"size": len(chunk)})
+            middle = len(chunk) // 2
+            left, right = await asyncio.gather(
+                self._fetch(chunk[:middle]), self._fetch(chunk[middle:])
+            )
+            return {**left, **right}
+
+        data = response.data if isinstance(response.data, list) else []
+        return {
+            item[self.result_key]: item
+            for item in data
+            if isinstance(item, dict) and self.result_key in item
+        }
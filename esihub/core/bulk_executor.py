@@ -0,0 +1,86 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+class ESIHubBulkResult(NamedTuple):
+    index: int
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _aiter(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class ESIHubBulkExecutor:
+    def __init__(self, window: int = 50):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+
+    async def stream(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+    ) -> AsyncIterator[ESIHubBulkResult]:
+        # Items are pulled lazily so only `window` of them are ever in flight,
+        # and results are yielded in completion order.
+        source = _aiter(items)
+        pending: Dict[asyncio.Future, Tuple[int, Any]] = {}
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.window:
+                    try:
+                        item = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(func(item))] = (index, item)
+                    index += 1
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task_index, item = pending.pop(task)
+                    if task.cancelled():
+                        yield ESIHubBulkResult(
+                            task_index, item, error=asyncio.CancelledError()
+                        )
+                    elif task.exception() is not None:
+                        yield ESIHubBulkResult(task_index, item, error=task.exception())
+                    else:
+                        yield ESIHubBulkResult(task_index, item, result=task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await source.aclose()
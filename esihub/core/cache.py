@@ -1,13 +1,17 @@
 import asyncio
-from typing import Any, Dict, Optional
+import json
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
 
-import redis
-from cachetools import TTLCache
+import redis.asyncio as redis
+from cachetools import LRUCache, TTLCache
 from multidict import CIMultiDictProxy
+from redis.exceptions import WatchError
 
 from .config import ESIHubConfig
 from .logger import esihub_logger
-from ..models import ESIHubResponse
+from ..models import ESIHubResponse, ESIHubSlimResponse
 
 
 class ESIHubCachePolicy:
@@ -17,10 +21,27 @@ class ESIHubCachePolicy:
 
 
 class ESIHubCache:
-    def __init__(self, config: ESIHubConfig):
+    FILL_LOCK_PREFIX = "esihub:fill:"
+
+    def __init__(self, config: ESIHubConfig, redis_client: Optional[Any] = None):
         self.config = config
         self.memory_cache = TTLCache(maxsize=1000, ttl=300)
-        self.redis: Optional[redis.Redis] = None
+        # Last known response per key, kept past expiry so that an open
+        # circuit breaker can still serve something.
+        self.stale_cache = LRUCache(maxsize=self.config.get("CACHE_STALE_SIZE", 1000))
+        self.redis: Optional[redis.Redis] = redis_client
+        # An injected client belongs to the caller and is left open on close.
+        self.owns_redis = False
+        self.fill_lease = self.config.get("CACHE_FILL_LEASE", 5.0)
+        self.fill_wait = self.config.get("CACHE_FILL_WAIT", 5.0)
+        self.fill_poll_interval = self.config.get("CACHE_FILL_POLL_INTERVAL", 0.05)
+        self.coherence = self.config.get("CACHE_COHERENCE", False)
+        self.coherence_channel = self.config.get(
+            "CACHE_COHERENCE_CHANNEL", "esihub:cache"
+        )
+        self.node_id = uuid.uuid4().hex
+        self.pubsub = None
+        self.listener: Optional[asyncio.Task] = None
         self.lock = asyncio.Lock()
         self.cache_enabled = self.config.get("CACHE_ENABLED", True)
         self.policies: Dict[str, ESIHubCachePolicy] = {}
@@ -31,38 +52,58 @@ class ESIHubCache:
             return
 
         redis_url = self.config.get("REDIS_URL")
-        if redis_url:
+        if self.redis is not None:
+            esihub_logger.info("Using the provided Redis client for caching.")
+        elif redis_url:
             try:
-                self.redis = await redis.from_url(redis_url)
+                self.redis = redis.from_url(redis_url)
+                self.owns_redis = True
                 await self.redis.ping()
                 esihub_logger.info("Redis cache initialized successfully.")
             except Exception as e:
                 esihub_logger.error(f"Failed to initialize Redis cache: {str(e)}")
                 self.redis = None
+                self.owns_redis = False
         else:
             esihub_logger.info("Redis URL not provided. Using memory cache only.")
 
+        if self.redis and self.coherence:
+            self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            await self.pubsub.subscribe(self.coherence_channel)
+            self.listener = asyncio.create_task(self._listen())
+
     async def get(
         self, method: str, path: str, params: Dict[str, Any]
-    ) -> Optional[ESIHubResponse]:
+    ) -> Optional[ESIHubSlimResponse]:
         if not self.cache_enabled:
             return None
 
         cache_key = self._generate_cache_key(method, path, params)
 
         # Check memory cache first
-        if cache_key in self.memory_cache:
+        entry = self.memory_cache.get(cache_key)
+        if entry is not None:
             esihub_logger.debug("Cache hit (memory)", extra={"cache_key": cache_key})
-            return self.memory_cache[cache_key]
+            return entry.detached()
 
         # Check Redis cache
         if self.redis:
             data = await self.redis.get(cache_key)
             if data:
-                esi_response = ESIHubResponse.model_validate_json(data)
-                self.memory_cache[cache_key] = esi_response
-                esihub_logger.debug("Cache hit (Redis)", extra={"cache_key": cache_key})
-                return esi_response
+                try:
+                    esi_response = ESIHubSlimResponse.from_bytes(data)
+                except (TypeError, ValueError):
+                    # Written in an older format (a dumped ESIHubResponse); the
+                    # fetch this miss causes overwrites it.
+                    esihub_logger.debug(
+                        "Unreadable cache entry", extra={"cache_key": cache_key}
+                    )
+                else:
+                    self.memory_cache[cache_key] = esi_response
+                    esihub_logger.debug(
+                        "Cache hit (Redis)", extra={"cache_key": cache_key}
+                    )
+                    return esi_response.detached()
 
         esihub_logger.debug("Cache miss", extra={"cache_key": cache_key})
         return None
@@ -72,7 +113,7 @@ class ESIHubCache:
         method: str,
         path: str,
         params: Dict[str, Any],
-        response: ESIHubResponse,
+        response: Union[ESIHubSlimResponse, ESIHubResponse],
         headers: CIMultiDictProxy[str],
     ):
         if not self.cache_enabled:
@@ -82,17 +123,123 @@ class ESIHubCache:
         policy = self.get_policy(path)
         expires_in = self._get_cache_expiry(headers, policy)
 
+        if not isinstance(response, ESIHubSlimResponse):
+            response = ESIHubSlimResponse(
+                response.status,
+                json.dumps(response.data).encode(),
+                response.headers,
+            )
+
         async with self.lock:
-            self.memory_cache[cache_key] = response
+            # Entries only keep the raw body; every hit decodes its own copy.
+            self.memory_cache[cache_key] = response.detached()
+            if self.stale_cache.maxsize:
+                self.stale_cache[cache_key] = self.memory_cache[cache_key]
             if self.redis:
-                await self.redis.setex(
-                    cache_key, expires_in, response.model_dump_json()
-                )
+                await self.redis.set(cache_key, response.to_bytes(), ex=expires_in)
+                await self._publish("set", cache_key)
 
         esihub_logger.debug(
             "Cached", extra={"cache_key": cache_key, "expires_in": expires_in}
         )
 
+    @asynccontextmanager
+    async def fill(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any],
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Optional[ESIHubSlimResponse]]:
+        # Cross-process stampede protection for GETs that missed: the first
+        # worker takes a short Redis lease and fetches, the others poll until
+        # the value shows up. Yields that value, or None when the caller
+        # should fetch itself; the lease is released on exit.
+        if not self.redis or not self.fill_lease or method.upper() != "GET":
+            yield None
+            return
+
+        lock_key = self.FILL_LOCK_PREFIX + self._generate_cache_key(
+            method, path, params
+        )
+        filled, token = await self._claim_fill(method, path, params, lock_key, deadline)
+        try:
+            yield filled
+        finally:
+            if token is not None:
+                await self._release_fill(lock_key, token)
+
+    async def _claim_fill(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any],
+        lock_key: str,
+        deadline: Optional[float],
+    ) -> Tuple[Optional[ESIHubSlimResponse], Optional[str]]:
+        loop = asyncio.get_running_loop()
+        give_up = loop.time() + self.fill_wait
+        if deadline is not None:
+            give_up = min(give_up, deadline)
+        token = uuid.uuid4().hex
+        try:
+            while True:
+                # A lease that lapsed without a value means its holder died
+                # or failed, so the next waiter simply takes it over.
+                if await self.redis.set(
+                    lock_key, token, nx=True, px=int(self.fill_lease * 1000)
+                ):
+                    # Filled between our miss and the lease?
+                    filled = await self.get(method, path, params)
+                    if filled is not None:
+                        await self._release_fill(lock_key, token)
+                        return filled, None
+                    return None, token
+                if loop.time() + self.fill_poll_interval >= give_up:
+                    esihub_logger.debug(
+                        "Gave up waiting for cache fill", extra={"lock": lock_key}
+                    )
+                    return None, None
+                await asyncio.sleep(self.fill_poll_interval)
+                filled = await self.get(method, path, params)
+                if filled is not None:
+                    return filled, None
+        except redis.RedisError as e:
+            esihub_logger.warning(f"Cache fill lock unavailable: {str(e)}")
+            return None, None
+
+    async def _release_fill(self, lock_key: str, token: str):
+        # Compare-and-delete, so that a lease that already expired and was
+        # taken over by another worker is left alone.
+        try:
+            async with self.redis.pipeline() as pipe:
+                await pipe.watch(lock_key)
+                if await pipe.get(lock_key) in (token, token.encode()):
+                    pipe.multi()
+                    pipe.delete(lock_key)
+                    await pipe.execute()
+        except WatchError:
+            pass
+        except redis.RedisError as e:
+            esihub_logger.warning(f"Failed to release cache fill lock: {str(e)}")
+
+    def get_memory(
+        self, method: str, path: str, params: Dict[str, Any]
+    ) -> Optional[ESIHubSlimResponse]:
+        if not self.cache_enabled:
+            return None
+        entry = self.memory_cache.get(self._generate_cache_key(method, path, params))
+        return entry.detached() if entry is not None else None
+
+    def get_stale(
+        self, method: str, path: str, params: Dict[str, Any]
+    ) -> Optional[ESIHubSlimResponse]:
+        if not self.cache_enabled:
+            return None
+        cache_key = self._generate_cache_key(method, path, params)
+        entry = self.memory_cache.get(cache_key) or self.stale_cache.get(cache_key)
+        return entry.detached() if entry else None
+
     async def invalidate(self, pattern: str):
         if not self.cache_enabled:
             return
@@ -104,13 +251,55 @@ class ESIHubCache:
                 esihub_logger.debug(
                     "Invalidated Redis cache", extra={"pattern": pattern}
                 )
+            await self._publish("invalidate", pattern)
 
-        # Invalidate memory cache
+        self._invalidate_memory(pattern)
+
+    def _invalidate_memory(self, pattern: str):
         for key in list(self.memory_cache.keys()):
             if pattern in key:
                 del self.memory_cache[key]
+        for key in list(self.stale_cache.keys()):
+            if pattern in key:
+                del self.stale_cache[key]
         esihub_logger.debug("Invalidated memory cache", extra={"pattern": pattern})
 
+    async def _publish(self, op: str, key: str):
+        # Other nodes drop their memory copy and fall through to Redis, which
+        # already holds the fresh value; the message itself stays tiny.
+        if not self.pubsub:
+            return
+        message = json.dumps({"node": self.node_id, "op": op, "key": key})
+        try:
+            await self.redis.publish(self.coherence_channel, message)
+        except redis.RedisError as e:
+            esihub_logger.warning(f"Failed to publish cache update: {str(e)}")
+
+    async def _listen(self):
+        while True:
+            try:
+                async for message in self.pubsub.listen():
+                    self._apply(message["data"])
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                esihub_logger.error(f"Cache coherence listener failed: {str(e)}")
+                await asyncio.sleep(1)
+
+    def _apply(self, data: Union[bytes, str]):
+        message = json.loads(data)
+        if message.get("node") == self.node_id:
+            return
+        if message["op"] == "set":
+            self.memory_cache.pop(message["key"], None)
+        elif message["op"] == "invalidate":
+            self._invalidate_memory(message["key"])
+        esihub_logger.debug(
+            "Applied remote cache update",
+            extra={"op": message["op"], "key": message["key"]},
+        )
+
     def _generate_cache_key(
         self, method: str, path: str, params: Dict[str, Any]
     ) -> str:
@@ -134,8 +323,15 @@ class ESIHubCache:
         )
 
     async def close(self):
-        if self.redis:
-            await self.redis.close()
+        if self.listener:
+            self.listener.cancel()
+            await asyncio.gather(self.listener, return_exceptions=True)
+            self.listener = None
+        if self.pubsub:
+            await self.pubsub.aclose()
+            self.pubsub = None
+        if self.redis and self.owns_redis:
+            await self.redis.aclose()
             esihub_logger.info("Redis connection closed.")
 
     def set_policy(self, path: str, policy: ESIHubCachePolicy):
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import Callable, Dict
+
+import aiohttp
+
+from .config import ESIHubConfig
+from .logger import esihub_logger
+from ..exceptions import ESIHubConnectionError, ESIHubError, ESIHubTimeoutError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class ESIHubCircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        on_state_change: Callable[[str, str], None] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self.on_state_change = on_state_change
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.probe_successes = 0
+
+    def allow(self) -> bool:
+        if self.state == OPEN:
+            if self.clock() - self.opened_at < self.recovery_timeout:
+                return False
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self.probes_in_flight >= self.half_open_probes:
+                return False
+            self.probes_in_flight += 1
+        return True
+
+    def blocked(self) -> bool:
+        # Like ``allow`` but without claiming a probe, for callers that only
+        # want to know whether queueing for a slot is worth it.
+        if self.state == OPEN:
+            return self.clock() - self.opened_at < self.recovery_timeout
+        if self.state == HALF_OPEN:
+            return self.probes_in_flight >= self.half_open_probes
+        return False
+
+    def record_success(self) -> None:
+        if self.state == HALF_OPEN:
+            self.probes_in_flight = max(0, self.probes_in_flight - 1)
+            self.probe_successes += 1
+            if self.probe_successes >= self.half_open_probes:
+                self._transition(CLOSED)
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        if self.state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self.failures += 1
+        if self.state == CLOSED and self.failures >= self.failure_threshold:
+            self._transition(OPEN)
+
+    def release(self) -> None:
+        # A probe that ended without a verdict (e.g. it was cancelled).
+        if self.state == HALF_OPEN:
+            self.probes_in_flight = max(0, self.probes_in_flight - 1)
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        self.failures = 0
+        self.probes_in_flight = 0
+        self.probe_successes = 0
+        if state == OPEN:
+            self.opened_at = self.clock()
+        esihub_logger.warning(
+            f"Circuit {self.name} {previous} -> {state}",
+            extra={"route": self.name},
+        )
+        if self.on_state_change:
+            self.on_state_change(self.name, state)
+
+
+class ESIHubCircuitBreakers:
+    def __init__(self, config: ESIHubConfig, metrics=None):
+        self.enabled = config.get("CIRCUIT_BREAKER_ENABLED", True)
+        self.failure_threshold = config.get("CIRCUIT_FAILURE_THRESHOLD", 5)
+        self.recovery_timeout = config.get("CIRCUIT_RECOVERY_TIMEOUT", 30.0)
+        self.half_open_probes = config.get("CIRCUIT_HALF_OPEN_PROBES", 1)
+        self.metrics = metrics
+        self.breakers: Dict[str, ESIHubCircuitBreaker] = {}
+
+    def get(self, route: str) -> ESIHubCircuitBreaker:
+        breaker = self.breakers.get(route)
+        if breaker is None:
+            breaker = self.breakers[route] = ESIHubCircuitBreaker(
+                route,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                half_open_probes=self.half_open_probes,
+                on_state_change=self._state_changed,
+            )
+            self._state_changed(route, CLOSED)
+        return breaker
+
+    def record_error(self, breaker: ESIHubCircuitBreaker, error: BaseException):
+        if self.is_failure(error):
+            breaker.record_failure()
+        elif isinstance(error, Exception):
+            breaker.record_success()
+        else:
+            breaker.release()
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        # Only an unhealthy backend trips the breaker: 5xx answers, timeouts
+        # and dropped connections. 4xx answers mean the route itself is up,
+        # and local failures (decoding, validation) say nothing about it.
+        if isinstance(
+            error,
+            (
+                ESIHubTimeoutError,
+                ESIHubConnectionError,
+                asyncio.TimeoutError,
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+            ),
+        ):
+            return True
+        if isinstance(error, ESIHubError):
+            return error.status_code is not None and error.status_code >= 500
+        return False
+
+    def _state_changed(self, route: str, state: str) -> None:
+        if self.metrics:
+            self.metrics.set_circuit_state(route, STATE_VALUES[state])
@@ -0,0 +1,200 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# array.array typecodes per spec type/format. Strings, nested arrays and
+# objects are kept in plain lists; enums are stored as uint8 codes.
+TYPECODES = {
+    ("integer", "int32"): "i",
+    ("integer", "int64"): "q",
+    ("integer", None): "q",
+    ("number", "double"): "d",
+    ("number", "float"): "d",
+    ("number", None): "d",
+    ("boolean", None): "b",
+}
+NUMPY_DTYPES = {"i": "int32", "q": "int64", "d": "float64", "b": "bool", "B": "uint8"}
+MISSING = {"i": 0, "q": 0, "d": float("nan"), "b": 0}
+
+Column = Union[array, List[Any]]
+
+
+class ESIHubColumnarBatch:
+    def __init__(
+        self,
+        typecodes: Dict[str, Optional[str]],
+        enums: Optional[Dict[str, List[str]]] = None,
+    ):
+        self.typecodes = typecodes
+        self.enums = enums or {}
+        self._enum_codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in self.enums.items()
+        }
+        self.columns: Dict[str, Column] = {
+            name: array(code) if code else [] for name, code in typecodes.items()
+        }
+        self._length = 0
+
+    @classmethod
+    def from_item_schema(cls, schema: Dict[str, Any]) -> "ESIHubColumnarBatch":
+        typecodes: Dict[str, Optional[str]] = {}
+        enums: Dict[str, List[str]] = {}
+        for name, prop in schema.get("properties", {}).items():
+            if prop.get("enum") and len(prop["enum"]) < 256:
+                typecodes[name] = "B"
+                enums[name] = list(prop["enum"])
+            else:
+                typecodes[name] = TYPECODES.get((prop.get("type"), prop.get("format")))
+        return cls(typecodes, enums)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> None:
+        items = items if isinstance(items, list) else list(items)
+        for name, column in self.columns.items():
+            code = self.typecodes[name]
+            if code == "B":
+                codes = self._enum_codes[name]
+                column.extend(codes.get(item.get(name), 255) for item in items)
+            elif code:
+                missing = MISSING[code]
+                column.extend(
+                    missing if item.get(name) is None else item[name] for item in items
+                )
+            else:
+                column.extend(item.get(name) for item in items)
+        self._length += len(items)
+
+    def concat(self, other: "ESIHubColumnarBatch") -> None:
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+        self._length += len(other)
+
+    def column(self, name: str) -> Column:
+        if self.typecodes[name] == "B":
+            values = self.enums[name]
+            return [
+                values[code] if code < len(values) else None
+                for code in self.columns[name]
+            ]
+        return self.columns[name]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        row = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            code = self.typecodes[name]
+            if code == "B":
+                value = (
+                    self.enums[name][value] if value < len(self.enums[name]) else None
+                )
+            elif code == "b":
+                value = bool(value)
+            row[name] = value
+        return row
+
+    def rows(self) -> Iterable[Dict[str, Any]]:
+        return (self.row(i) for i in range(self._length))
+
+    def nbytes(self) -> int:
+        return sum(
+            column.itemsize * len(column)
+            for column in self.columns.values()
+            if isinstance(column, array)
+        )
+
+    def numpy_column(self, name: str):
+        if np is None:
+            raise ImportError("numpy is required for numpy_column()")
+        code = self.typecodes[name]
+        if not code:
+            return np.array(self.columns[name], dtype=object)
+        # array.array exposes the buffer protocol, so this is zero-copy.
+        values = np.frombuffer(self.columns[name], dtype=self.columns[name].typecode)
+        return values.astype(bool) if code == "b" else values
+
+    def to_numpy(self):
+        if np is None:
+            raise ImportError("numpy is required for to_numpy()")
+        dtype = [
+            (name, NUMPY_DTYPES[code] if code else object)
+            for name, code in self.typecodes.items()
+        ]
+        result = np.empty(self._length, dtype=dtype)
+        for name in self.typecodes:
+            result[name] = self.numpy_column(name)
+        return result
+
+
+def best_bid_ask(
+    orders: ESIHubColumnarBatch,
+) -> Dict[int, Tuple[Optional[float], Optional[float]]]:
+    if np is not None:
+        type_ids, inverse, prices, is_buy = _market_arrays(orders)
+        bids = np.full(len(type_ids), -np.inf)
+        asks = np.full(len(type_ids), np.inf)
+        np.maximum.at(bids, inverse[is_buy], prices[is_buy])
+        np.minimum.at(asks, inverse[~is_buy], prices[~is_buy])
+        return {
+            int(type_id): (
+                float(bid) if bid != -np.inf else None,
+                float(ask) if ask != np.inf else None,
+            )
+            for type_id, bid, ask in zip(type_ids, bids, asks)
+        }
+
+    result: Dict[int, List[Optional[float]]] = {}
+    for type_id, price, buy in zip(
+        orders.columns["type_id"],
+        orders.columns["price"],
+        orders.columns["is_buy_order"],
+    ):
+        best = result.setdefault(type_id, [None, None])
+        if buy:
+            if best[0] is None or price > best[0]:
+                best[0] = price
+        elif best[1] is None or price < best[1]:
+            best[1] = price
+    return {type_id: (bid, ask) for type_id, (bid, ask) in result.items()}
+
+
+def depth(orders: ESIHubColumnarBatch) -> Dict[int, Tuple[int, int]]:
+    if np is not None:
+        type_ids, inverse, _, is_buy = _market_arrays(orders)
+        volumes = orders.numpy_column("volume_remain").astype("int64")
+        bid_depth = np.bincount(
+            inverse[is_buy], weights=volumes[is_buy], minlength=len(type_ids)
+        )
+        ask_depth = np.bincount(
+            inverse[~is_buy], weights=volumes[~is_buy], minlength=len(type_ids)
+        )
+        return {
+            int(type_id): (int(bid), int(ask))
+            for type_id, bid, ask in zip(type_ids, bid_depth, ask_depth)
+        }
+
+    result: Dict[int, List[int]] = {}
+    for type_id, volume, buy in zip(
+        orders.columns["type_id"],
+        orders.columns["volume_remain"],
+        orders.columns["is_buy_order"],
+    ):
+        totals = result.setdefault(type_id, [0, 0])
+        totals[0 if buy else 1] += volume
+    return {type_id: (bid, ask) for type_id, (bid, ask) in result.items()}
+
+
+def _market_arrays(orders: ESIHubColumnarBatch):
+    type_ids, inverse = np.unique(orders.numpy_column("type_id"), return_inverse=True)
+    return (
+        type_ids,
+        inverse,
+        orders.numpy_column("price"),
+        orders.numpy_column("is_buy_order"),
+    )
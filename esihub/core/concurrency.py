@@ -0,0 +1,202 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from .config import ESIHubConfig
+from .logger import esihub_logger
+from .scheduler import PRIORITY_NORMAL, ESIHubFairQueue
+from ..exceptions import ESIHubDeadlineExceededError, ESIHubError, ESIHubTimeoutError
+
+
+class ESIHubAdaptiveLimiter:
+    # A semaphore whose size follows ESI's health (AIMD): the limit grows by
+    # about one slot per window of fast successes while it is the bottleneck,
+    # and shrinks multiplicatively on timeouts, 5xx/420 answers, latency far
+    # above the route's baseline, or a nearly spent error limit. Waiters are
+    # dispatched by priority and then fairly across tenants.
+
+    def __init__(
+        self,
+        limit: int,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        adaptive: bool = True,
+        backoff: float = 0.75,
+        latency_tolerance: float = 3.0,
+        error_limit_floor: int = 20,
+        cooldown: float = 1.0,
+        metrics=None,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit or limit
+        self._limit = float(min(max(limit, min_limit), self.max_limit))
+        self.adaptive = adaptive
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.error_limit_floor = error_limit_floor
+        self.cooldown = cooldown
+        self.metrics = metrics
+        self.in_flight = 0
+        self.baselines: Dict[str, float] = {}
+        self.last_decrease = 0.0
+        self.queue = ESIHubFairQueue(metrics)
+        self._publish()
+
+    @classmethod
+    def from_config(cls, config: ESIHubConfig, metrics=None) -> "ESIHubAdaptiveLimiter":
+        limit = config.get("MAX_CONCURRENT_REQUESTS", 100)
+        max_limit = config.get("CONCURRENCY_MAX_LIMIT")
+        if not max_limit:
+            # Requests beyond the connector's pool only queue inside aiohttp,
+            # where the limiter can no longer see their latency.
+            connections = config.get("MAX_CONNECTIONS", 100)
+            max_limit = min(limit * 4, connections) if connections else limit * 4
+        return cls(
+            limit,
+            min_limit=min(limit, max_limit, config.get("CONCURRENCY_MIN_LIMIT", 4)),
+            max_limit=max_limit,
+            adaptive=config.get("ADAPTIVE_CONCURRENCY", True),
+            error_limit_floor=config.get("CONCURRENCY_ERROR_LIMIT_FLOOR", 20),
+            metrics=metrics,
+        )
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def _value(self) -> int:
+        # Same meaning as asyncio.Semaphore._value: free slots right now.
+        return max(0, self.limit - self.in_flight)
+
+    def locked(self) -> bool:
+        return self.in_flight >= self.limit
+
+    async def acquire(
+        self,
+        priority: int = PRIORITY_NORMAL,
+        tenant: Optional[Any] = None,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        # ``deadline`` is an absolute event loop time; a waiter still queued
+        # when it passes leaves the queue without ever taking a slot.
+        if self.in_flight < self.limit and not self.queue:
+            self.in_flight += 1
+            self.queue.record_immediate(tenant)
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self.queue.push(waiter, priority, tenant)
+        try:
+            async with asyncio.timeout_at(deadline):
+                try:
+                    await waiter
+                except asyncio.CancelledError:
+                    if waiter.done() and not waiter.cancelled():
+                        # The slot was granted just before the cancellation landed.
+                        self.release()
+                    else:
+                        self.queue.discard(waiter)
+                    raise
+        except TimeoutError:
+            raise ESIHubDeadlineExceededError(
+                "Deadline exceeded while waiting for a concurrency slot",
+                details={"stage": "queue"},
+            ) from None
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: int = PRIORITY_NORMAL,
+        tenant: Optional[Any] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        await self.acquire(priority, tenant, deadline)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def observe(
+        self,
+        route: str,
+        latency: float,
+        error: Optional[BaseException] = None,
+        error_limit_remain: Optional[int] = None,
+    ) -> None:
+        if not self.adaptive or isinstance(error, asyncio.CancelledError):
+            return
+        overloaded = self._is_overload(error) or (
+            error_limit_remain is not None
+            and error_limit_remain <= self.error_limit_floor
+        )
+        if error is None and not overloaded:
+            baseline = self.baselines.get(route)
+            if baseline is None:
+                self.baselines[route] = latency
+            elif latency > baseline * self.latency_tolerance:
+                overloaded = True
+            else:
+                self.baselines[route] = baseline * 0.95 + latency * 0.05
+
+        if overloaded:
+            self._decrease()
+        elif self.in_flight >= self.limit * 0.8:
+            self._set_limit(self._limit + 1 / self._limit)
+
+    @staticmethod
+    def _is_overload(error: Optional[BaseException]) -> bool:
+        if error is None:
+            return False
+        if isinstance(
+            error, (ESIHubTimeoutError, asyncio.TimeoutError, aiohttp.ClientError)
+        ):
+            return True
+        status = getattr(error, "status_code", None)
+        return isinstance(error, ESIHubError) and (
+            status == 420 or (status is not None and status >= 500)
+        )
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        # One decrease per cooldown, so that a burst of failures from the
+        # same overload does not collapse the limit to the floor.
+        if now - self.last_decrease < self.cooldown:
+            return
+        self.last_decrease = now
+        previous = self.limit
+        self._set_limit(self._limit * self.backoff)
+        esihub_logger.warning(
+            f"Concurrency limit lowered from {previous} to {self.limit}"
+        )
+
+    def _set_limit(self, limit: float) -> None:
+        self._limit = min(max(limit, self.min_limit), self.max_limit)
+        self._publish()
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.in_flight < self.limit:
+            waiter = self.queue.pop()
+            if waiter is None:
+                break
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+    def _publish(self) -> None:
+        if self.metrics:
+            self.metrics.set_concurrency_limit(self.limit)
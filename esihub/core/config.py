@@ -11,12 +11,92 @@ class ESIHubConfig:
             "ESI_BASE_URL": os.getenv("ESI_BASE_URL", "https://esi.evetech.net"),
             "ESI_USER_AGENT": os.getenv("ESI_USER_AGENT", "ESIHub/1.0"),
             "ESI_RETRY_ATTEMPTS": int(os.getenv("ESI_RETRY_ATTEMPTS", "3")),
+            "REQUEST_VALIDATION": os.getenv("REQUEST_VALIDATION", "True").lower()
+            == "true",
+            "REQUEST_DEADLINE": float(os.getenv("REQUEST_DEADLINE", "0")),
+            "RETRY_BASE_DELAY": float(os.getenv("RETRY_BASE_DELAY", "0.5")),
+            "RETRY_MAX_DELAY": float(os.getenv("RETRY_MAX_DELAY", "30")),
+            "RETRY_STATUSES": [
+                int(status)
+                for status in os.getenv("RETRY_STATUSES", "502,503,504").split(",")
+            ],
+            "RETRY_BUDGET_RATIO": float(os.getenv("RETRY_BUDGET_RATIO", "0.2")),
+            "RETRY_BUDGET_MIN_PER_SECOND": float(
+                os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "1")
+            ),
+            "RETRY_ERROR_LIMIT_FLOOR": int(os.getenv("RETRY_ERROR_LIMIT_FLOOR", "10")),
+            "CIRCUIT_BREAKER_ENABLED": os.getenv(
+                "CIRCUIT_BREAKER_ENABLED", "True"
+            ).lower()
+            == "true",
+            "CIRCUIT_FAILURE_THRESHOLD": int(
+                os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")
+            ),
+            "CIRCUIT_RECOVERY_TIMEOUT": float(
+                os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30")
+            ),
+            "CIRCUIT_HALF_OPEN_PROBES": int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1")),
+            "HEDGE_ENABLED": os.getenv("HEDGE_ENABLED", "False").lower() == "true",
+            "HEDGE_ROUTES": [
+                route for route in os.getenv("HEDGE_ROUTES", "").split(",") if route
+            ],
+            "HEDGE_DELAY": (
+                float(os.getenv("HEDGE_DELAY")) if os.getenv("HEDGE_DELAY") else None
+            ),
+            "HEDGE_MIN_DELAY": float(os.getenv("HEDGE_MIN_DELAY", "0.05")),
+            "HEDGE_PERCENTILE": float(os.getenv("HEDGE_PERCENTILE", "0.95")),
+            "HEDGE_BUDGET_RATIO": float(os.getenv("HEDGE_BUDGET_RATIO", "0.05")),
+            "HEDGE_BUDGET_BURST": int(os.getenv("HEDGE_BUDGET_BURST", "5")),
+            "CACHE_STALE_SIZE": int(os.getenv("CACHE_STALE_SIZE", "1000")),
+            "CACHE_COHERENCE": os.getenv("CACHE_COHERENCE", "False").lower() == "true",
+            "CACHE_COHERENCE_CHANNEL": os.getenv(
+                "CACHE_COHERENCE_CHANNEL", "esihub:cache"
+            ),
+            "CACHE_FILL_LEASE": float(os.getenv("CACHE_FILL_LEASE", "5")),
+            "CACHE_FILL_WAIT": float(os.getenv("CACHE_FILL_WAIT", "5")),
+            "CACHE_FILL_POLL_INTERVAL": float(
+                os.getenv("CACHE_FILL_POLL_INTERVAL", "0.05")
+            ),
             "ESI_RATE_LIMIT": int(os.getenv("ESI_RATE_LIMIT", "150")),
             "REDIS_URL": os.getenv("REDIS_URL"),
             "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO"),
             "USE_HTTPS": os.getenv("USE_HTTPS", "True").lower() == "true",
             "MAX_CONCURRENT_REQUESTS": int(os.getenv("MAX_CONCURRENT_REQUESTS", "100")),
+            "ADAPTIVE_CONCURRENCY": os.getenv("ADAPTIVE_CONCURRENCY", "True").lower()
+            == "true",
+            "CONCURRENCY_MIN_LIMIT": int(os.getenv("CONCURRENCY_MIN_LIMIT", "4")),
+            "CONCURRENCY_MAX_LIMIT": int(os.getenv("CONCURRENCY_MAX_LIMIT", "0")),
+            "CONCURRENCY_ERROR_LIMIT_FLOOR": int(
+                os.getenv("CONCURRENCY_ERROR_LIMIT_FLOOR", "20")
+            ),
             "MAX_CONNECTIONS": int(os.getenv("MAX_CONNECTIONS", "100")),
+            "MAX_CONNECTIONS_PER_HOST": int(os.getenv("MAX_CONNECTIONS_PER_HOST", "0")),
+            "DNS_CACHE_TTL": int(os.getenv("DNS_CACHE_TTL", "300")),
+            "KEEPALIVE_TIMEOUT": float(os.getenv("KEEPALIVE_TIMEOUT", "30")),
+            "SHARED_TRANSPORT": os.getenv("SHARED_TRANSPORT", "True").lower() == "true",
+            "JSON_DECODER": os.getenv("JSON_DECODER", "json"),
+            "DECODE_OFFLOAD_THRESHOLD_KB": int(
+                os.getenv("DECODE_OFFLOAD_THRESHOLD_KB", "64")
+            ),
+            "ACCEPT_ENCODING": os.getenv("ACCEPT_ENCODING", ""),
+            "DECOMPRESS_OFFLOAD_THRESHOLD_KB": int(
+                os.getenv("DECOMPRESS_OFFLOAD_THRESHOLD_KB", "8")
+            ),
+            "DECODE_EXECUTOR": os.getenv("DECODE_EXECUTOR", "thread"),
+            "DECODE_WORKERS": int(os.getenv("DECODE_WORKERS", "4")),
+            "LOOP_LAG_INTERVAL": float(os.getenv("LOOP_LAG_INTERVAL", "0.25")),
+            "BULK_WINDOW": int(os.getenv("BULK_WINDOW", "50")),
+            "RESOLVER_CACHE_FILE": os.getenv("RESOLVER_CACHE_FILE"),
+            "RESOLVER_NEGATIVE_TTL": int(os.getenv("RESOLVER_NEGATIVE_TTL", "3600")),
+            "TOKEN_REFRESH_MARGIN": int(os.getenv("TOKEN_REFRESH_MARGIN", "60")),
+            "TOKEN_REFRESH_JITTER": int(os.getenv("TOKEN_REFRESH_JITTER", "30")),
+            "TOKEN_AUTO_REFRESH": os.getenv("TOKEN_AUTO_REFRESH", "True").lower()
+            == "true",
+            "SSO_JWKS_FILE": os.getenv("SSO_JWKS_FILE"),
+            "SSO_JWKS_REFRESH_INTERVAL": int(
+                os.getenv("SSO_JWKS_REFRESH_INTERVAL", "3600")
+            ),
+            "SSO_JWT_LEEWAY": int(os.getenv("SSO_JWT_LEEWAY", "5")),
             "DRY_RUN": os.getenv("DRY_RUN", "False").lower() == "true",
         }
 
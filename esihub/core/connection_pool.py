@@ -1,32 +1,147 @@
-from typing import Optional
+import asyncio
+import ssl
+import weakref
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
 
+from esihub.core.config import ESIHubConfig
 from esihub.core.logger import esihub_logger
 
 
 class ESIConnectionPool:
-    def __init__(self, pool_size: int = 100):
+    # One pool owns one ClientSession; holders acquire/release it and the
+    # session is only closed once the last holder releases it.
+
+    _shared: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, ESIConnectionPool]]" = (weakref.WeakKeyDictionary())
+
+    def __init__(
+        self,
+        pool_size: int = 100,
+        limit_per_host: int = 0,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
         self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.ssl_context = ssl_context or self._create_ssl_context()
         self.session: Optional[aiohttp.ClientSession] = None
+        self.ref_count = 0
         self.logger = esihub_logger
 
+        self.requests_sent = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    @classmethod
+    def from_config(cls, config: ESIHubConfig) -> "ESIConnectionPool":
+        return cls(**cls._settings_from_config(config))
+
+    @classmethod
+    def shared(cls, config: ESIHubConfig) -> "ESIConnectionPool":
+        loop = asyncio.get_running_loop()
+        settings = cls._settings_from_config(config)
+        key = tuple(sorted(settings.items()))
+        pools = cls._shared.setdefault(loop, {})
+        pool = pools.get(key)
+        if pool is None:
+            pool = cls(**settings)
+            pools[key] = pool
+        return pool
+
+    @staticmethod
+    def _settings_from_config(config: ESIHubConfig) -> Dict[str, Any]:
+        return {
+            "pool_size": config.get("MAX_CONNECTIONS", 100),
+            "limit_per_host": config.get("MAX_CONNECTIONS_PER_HOST", 0),
+            "dns_cache_ttl": config.get("DNS_CACHE_TTL", 300),
+            "keepalive_timeout": config.get("KEEPALIVE_TIMEOUT", 30.0),
+        }
+
+    @staticmethod
+    def _create_ssl_context() -> ssl.SSLContext:
+        ssl_context = ssl.create_default_context()
+        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        return ssl_context
+
     async def get(self) -> aiohttp.ClientSession:
         if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=self.ssl_context,
+            )
             self.session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=self.pool_size)
+                connector=connector, trace_configs=[self._create_trace_config()]
             )
             self.logger.debug(
                 f"Created new ClientSession with pool size {self.pool_size}"
             )
         return self.session
 
-    async def release(self, session: aiohttp.ClientSession) -> None:
-        if session and not session.closed:
-            await session.close()
-            self.logger.debug("Closed ClientSession")
+    async def acquire(self) -> aiohttp.ClientSession:
+        self.ref_count += 1
+        return await self.get()
+
+    async def release(self, session: Optional[aiohttp.ClientSession] = None) -> None:
+        self.ref_count = max(0, self.ref_count - 1)
+        if self.ref_count == 0:
+            await self.close()
 
     async def close(self) -> None:
         if self.session and not self.session.closed:
             await self.session.close()
             self.logger.debug("Closed ConnectionPool")
+        self.session = None
+        for pools in self._shared.values():
+            for key, pool in list(pools.items()):
+                if pool is self:
+                    del pools[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ref_count": self.ref_count,
+            "requests_sent": self.requests_sent,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": self.reuse_ratio,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    async def _on_request_start(self, session, context, params) -> None:
+        self.requests_sent += 1
+
+    async def _on_connection_create_end(self, session, context, params) -> None:
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, context, params) -> None:
+        self.connections_reused += 1
+
+    async def _on_dns_cache_hit(self, session, context, params) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, context, params) -> None:
+        self.dns_cache_misses += 1
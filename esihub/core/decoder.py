@@ -0,0 +1,159 @@
+import asyncio
+import importlib
+import json
+import time
+import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from .config import ESIHubConfig
+from .logger import esihub_logger
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+def resolve_json_loads(decoder: Union[str, Callable[[bytes], Any]]) -> Callable:
+    if callable(decoder):
+        return decoder
+    if decoder == "json":
+        return json.loads
+    try:
+        return importlib.import_module(decoder).loads
+    except ImportError:
+        esihub_logger.warning(
+            f"JSON decoder {decoder} is not installed, falling back to json"
+        )
+        return json.loads
+
+
+def supported_encodings() -> str:
+    return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+def _decompress(encoding: str, body: bytes) -> bytes:
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        # Servers disagree on whether deflate means zlib-wrapped or raw.
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def _decode(loads: Callable[[bytes], Any], body: bytes, validate: Optional[Callable]):
+    data = loads(body)
+    return validate(data) if validate else data
+
+
+class ESIHubPayloadDecoder:
+    def __init__(self, config: ESIHubConfig, metrics=None):
+        self.loads = resolve_json_loads(config.get("JSON_DECODER", "json"))
+        self.threshold = config.get("DECODE_OFFLOAD_THRESHOLD_KB", 64) * 1024
+        self.decompress_threshold = (
+            config.get("DECOMPRESS_OFFLOAD_THRESHOLD_KB", 8) * 1024
+        )
+        self.executor_kind = config.get("DECODE_EXECUTOR", "thread")
+        self.max_workers = config.get("DECODE_WORKERS", 4)
+        self.metrics = metrics
+        self.executor: Optional[Executor] = None
+
+    async def decode(
+        self, body: bytes, validate: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        if not body:
+            return None
+        return await self.run(len(body), _decode, self.loads, body, validate)
+
+    async def decompress(self, body: bytes, encoding: str) -> bytes:
+        # Compressed bodies expand roughly tenfold, so they are moved off the
+        # loop at a lower size than JSON decoding. zlib and brotli release
+        # the GIL, so threads are enough even with a process pool configured.
+        encoding = encoding.strip().lower()
+        if not body or encoding in ("", "identity"):
+            return body
+        started = time.perf_counter()
+        data = await self.run(
+            len(body),
+            _decompress,
+            encoding,
+            body,
+            threaded=True,
+            threshold=self.decompress_threshold,
+        )
+        if self.metrics:
+            self.metrics.observe_decompression(encoding, time.perf_counter() - started)
+        return data
+
+    async def prefetch(self, response: Any) -> None:
+        # Decodes large lazily-decoded responses in the worker pool up front,
+        # so that the first access to ``data`` does not block the loop.
+        body = getattr(response, "body", None)
+        if body and len(body) >= self.threshold and not response.decoded:
+            response.data = await self.decode(body)
+
+    async def run(
+        self,
+        size: int,
+        func: Callable,
+        *args: Any,
+        threaded: bool = False,
+        threshold: Optional[int] = None,
+    ) -> Any:
+        if size < (self.threshold if threshold is None else threshold):
+            return func(*args)
+        if self.metrics:
+            self.metrics.increment_offloaded_decode()
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        if threaded and self.executor_kind == "process":
+            executor = None
+        return await loop.run_in_executor(executor, func, *args)
+
+    def _get_executor(self) -> Executor:
+        if self.executor is None:
+            if self.executor_kind == "process":
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="esihub-decode"
+                )
+        return self.executor
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+
+class ESIHubLoopLagMonitor:
+    def __init__(self, metrics, interval: float = 0.25):
+        self.metrics = metrics
+        self.interval = interval
+        self.max_lag = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self.max_lag = max(self.max_lag, lag)
+            self.metrics.observe_loop_lag(lag)
@@ -12,8 +12,8 @@ class ESIHubDryRunMode:
         esihub_logger.info(f"Dry run request: {method} {path}")
         esihub_logger.info(f"Request parameters: {kwargs}")
 
-        # Validate the request parameters here
-        self._validate_params(kwargs)
+        # Same checks as a real request, so dry runs catch malformed calls
+        self._validate_params(method, path, kwargs)
 
         # Simulate a successful response with echo
         mock_response = ESIHubResponse(
@@ -25,15 +25,11 @@ class ESIHubDryRunMode:
         esihub_logger.info(f"Dry run response: {mock_response}")
         return mock_response
 
-    def _validate_params(self, params: Dict[str, Any]) -> None:
-        # Add any parameter validation logic here
-        # For example, check if required parameters are present
-        required_params = self._get_required_params(params.get("path", ""))
-        for param in required_params:
-            if param not in params:
-                esihub_logger.warning(f"Missing required parameter: {param}")
-
-    def _get_required_params(self, path: str) -> list:
-        # This method should return a list of required parameters for the given path
-        # You would typically implement this based on the ESI API specification
-        return []
+    def _validate_params(self, method: str, path: str, params: Dict[str, Any]) -> None:
+        esihub_logger.debug(
+            f"Required parameters: {self._get_required_params(method, path)}"
+        )
+        self.client.request_validator.validate(method, path, params)
+
+    def _get_required_params(self, method: str, path: str) -> list:
+        return self.client.request_validator.required_params(method, path)
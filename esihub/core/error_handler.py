@@ -1,4 +1,6 @@
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Optional
+
+from multidict import CIMultiDict
 
 from .logger import esihub_logger
 from ..exceptions import (
@@ -12,36 +14,52 @@ from ..exceptions import (
 
 class ESIHubErrorHandler:
     @staticmethod
-    async def handle_error(status_code: int, response_data: Dict[str, Any]) -> None:
+    async def handle_error(
+        status_code: int,
+        response_data: Dict[str, Any],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
         error_message = response_data.get("error", "Unknown error")
+        headers = CIMultiDict(headers) if headers else None
         if 400 <= status_code < 500:
             if status_code == 401:
                 raise ESIHubAuthenticationError(
                     f"Authentication failed: {error_message}",
                     status_code,
                     response_data,
+                    headers,
                 )
             elif status_code == 403:
                 raise ESIHubAuthenticationError(
                     f"Insufficient permissions: {error_message}",
                     status_code,
                     response_data,
+                    headers,
                 )
             elif status_code == 420:
                 raise ESIHubRateLimitError(
-                    f"Rate limit exceeded: {error_message}", status_code, response_data
+                    f"Rate limit exceeded: {error_message}",
+                    status_code,
+                    response_data,
+                    headers,
                 )
             else:
                 raise ESIHubClientError(
-                    f"Client error: {error_message}", status_code, response_data
+                    f"Client error: {error_message}",
+                    status_code,
+                    response_data,
+                    headers,
                 )
         elif status_code >= 500:
             raise ESIHubServerError(
-                f"Server error: {error_message}", status_code, response_data
+                f"Server error: {error_message}", status_code, response_data, headers
             )
         else:
             raise ESIHubError(
-                f"Unexpected error: {error_message}", status_code, response_data
+                f"Unexpected error: {error_message}",
+                status_code,
+                response_data,
+                headers,
             )
 
     @staticmethod
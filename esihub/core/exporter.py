@@ -0,0 +1,216 @@
+import asyncio
+import gzip
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from .logger import esihub_logger
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pyarrow = None
+
+
+class ESIHubNDJSONSink:
+    # Every page is written as its own gzip member. Concatenated members are
+    # a valid gzip stream, so after a crash the file is truncated back to the
+    # last checkpointed offset and appending simply continues.
+
+    def __init__(self, path: str, compresslevel: int = 6):
+        self.path = path
+        self.compresslevel = compresslevel
+        self.file = None
+
+    def open(self, state: Dict[str, Any]) -> bool:
+        # Returns False when the checkpointed output is gone or shorter than
+        # the checkpoint, in which case the export has to start over.
+        offset = state.get("offset", 0)
+        resumable = not offset or (
+            os.path.exists(self.path) and os.path.getsize(self.path) >= offset
+        )
+        if not resumable:
+            offset = 0
+        self.file = open(self.path, "r+b" if offset else "wb")
+        self.file.truncate(offset)
+        self.file.seek(offset)
+        return resumable
+
+    def write_page(self, page: int, items: List[Any]) -> Dict[str, Any]:
+        lines = "".join(
+            json.dumps(item, separators=(",", ":")) + "\n" for item in items
+        )
+        self.file.write(gzip.compress(lines.encode(), self.compresslevel))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return {"offset": self.file.tell()}
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class ESIHubParquetSink:
+    # One Parquet file per page; a page is only visible once it has been
+    # renamed into place, so partially written pages never survive a crash.
+
+    def __init__(self, directory: str, compression: str = "zstd"):
+        if pyarrow is None:
+            raise ImportError("pyarrow is required for ESIHubParquetSink")
+        self.directory = directory
+        self.compression = compression
+
+    def open(self, state: Dict[str, Any]) -> bool:
+        os.makedirs(self.directory, exist_ok=True)
+        return True
+
+    def write_page(self, page: int, items: List[Any]) -> Dict[str, Any]:
+        path = os.path.join(self.directory, f"page-{page:05d}.parquet")
+        table = pyarrow.Table.from_pylist(items)
+        pyarrow.parquet.write_table(table, f"{path}.tmp", compression=self.compression)
+        os.replace(f"{path}.tmp", path)
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+class ESIHubExporter:
+    def __init__(
+        self,
+        client,
+        sink,
+        checkpoint_path: Optional[str] = None,
+        concurrency: int = 4,
+        max_buffered_pages: int = 8,
+    ):
+        self.client = client
+        self.sink = sink
+        self.checkpoint_path = checkpoint_path
+        self.concurrency = concurrency
+        self.max_buffered_pages = max_buffered_pages
+
+    async def export(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        # Checkpoint files are fsynced, so all their I/O stays off the loop.
+        loop = asyncio.get_running_loop()
+        checkpoint = await loop.run_in_executor(
+            None, self._load_checkpoint, method, path
+        )
+        if not await loop.run_in_executor(None, self.sink.open, checkpoint["sink"]):
+            esihub_logger.warning(
+                "Export output missing, starting over",
+                extra={"checkpoint": self.checkpoint_path},
+            )
+            checkpoint = self._fresh_checkpoint(method, path)
+        done = set(checkpoint["done"])
+        resumed_pages = len(done)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_buffered_pages)
+        producer: Optional[asyncio.Task] = None
+        items_written = 0
+        try:
+            pending = 0
+            if checkpoint["pages"] is None:
+                response = await self._fetch_page(method, path, 1, kwargs)
+                checkpoint["pages"] = int(response.headers.get("X-Pages", 1))
+                await queue.put((1, response.data or []))
+                done.add(1)
+                pending += 1
+
+            remaining = [
+                page for page in range(1, checkpoint["pages"] + 1) if page not in done
+            ]
+            pending += len(remaining)
+            producer = asyncio.create_task(
+                self._produce(method, path, remaining, kwargs, queue)
+            )
+
+            while pending:
+                page, items = await queue.get()
+                if isinstance(items, BaseException):
+                    raise items
+                checkpoint["sink"] = await loop.run_in_executor(
+                    None, self.sink.write_page, page, items
+                )
+                checkpoint["done"].append(page)
+                await loop.run_in_executor(None, self._save_checkpoint, checkpoint)
+                items_written += len(items)
+                pending -= 1
+            await producer
+        finally:
+            if producer is not None and not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+            await loop.run_in_executor(None, self.sink.close)
+
+        await loop.run_in_executor(None, self._remove_checkpoint)
+        esihub_logger.info(
+            "Export finished",
+            extra={"path": path, "pages": checkpoint["pages"], "items": items_written},
+        )
+        return {
+            "pages": checkpoint["pages"],
+            "pages_written": len(checkpoint["done"]) - resumed_pages,
+            "items_written": items_written,
+        }
+
+    async def _produce(
+        self,
+        method: str,
+        path: str,
+        pages: List[int],
+        kwargs: Dict[str, Any],
+        queue: asyncio.Queue,
+    ) -> None:
+        pages_iter = iter(pages)
+
+        async def worker():
+            for page in pages_iter:
+                try:
+                    response = await self._fetch_page(method, path, page, kwargs)
+                    await queue.put((page, response.data or []))
+                except Exception as e:
+                    await queue.put((page, e))
+                    return
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    async def _fetch_page(
+        self, method: str, path: str, page: int, kwargs: Dict[str, Any]
+    ):
+        params = {**kwargs.get("params", {}), "page": page}
+        return await self.client.request(method, path, **{**kwargs, "params": params})
+
+    @staticmethod
+    def _fresh_checkpoint(method: str, path: str) -> Dict[str, Any]:
+        return {"method": method, "path": path, "pages": None, "done": [], "sink": {}}
+
+    def _load_checkpoint(self, method: str, path: str) -> Dict[str, Any]:
+        fresh = self._fresh_checkpoint(method, path)
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return fresh
+        with open(self.checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("method") != method or checkpoint.get("path") != path:
+            esihub_logger.warning(
+                "Ignoring checkpoint for a different export",
+                extra={"checkpoint": self.checkpoint_path},
+            )
+            return fresh
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        if not self.checkpoint_path:
+            return
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _remove_checkpoint(self) -> None:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
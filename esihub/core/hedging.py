@@ -0,0 +1,143 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from .config import ESIHubConfig
+from .logger import esihub_logger
+from .retry_policy import ESIHubRetryBudget
+
+T = TypeVar("T")
+
+
+class ESIHubLatencyTracker:
+    # Keeps the last ``window`` latencies per route and recomputes the
+    # percentile only every ``refresh_every`` samples.
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        window: int = 256,
+        min_samples: int = 20,
+        refresh_every: int = 16,
+    ):
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+        self.samples: Dict[str, Deque[float]] = {}
+        self._estimates: Dict[str, float] = {}
+        self._pending: Dict[str, int] = {}
+
+    def observe(self, route: str, seconds: float) -> None:
+        samples = self.samples.get(route)
+        if samples is None:
+            samples = self.samples[route] = deque(maxlen=self.window)
+        samples.append(seconds)
+        self._pending[route] = self._pending.get(route, 0) + 1
+
+    def estimate(self, route: str) -> Optional[float]:
+        samples = self.samples.get(route)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        if route not in self._estimates or self._pending[route] >= self.refresh_every:
+            ordered = sorted(samples)
+            index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+            self._estimates[route] = ordered[index]
+            self._pending[route] = 0
+        return self._estimates[route]
+
+
+class ESIHubHedger:
+    def __init__(self, config: ESIHubConfig, metrics=None):
+        self.enabled = config.get("HEDGE_ENABLED", False)
+        self.routes = set(config.get("HEDGE_ROUTES") or ())
+        self.fixed_delay = config.get("HEDGE_DELAY")
+        self.min_delay = config.get("HEDGE_MIN_DELAY", 0.05)
+        self.latencies = ESIHubLatencyTracker(
+            percentile=config.get("HEDGE_PERCENTILE", 0.95)
+        )
+        self.budget = ESIHubRetryBudget(
+            ratio=config.get("HEDGE_BUDGET_RATIO", 0.05),
+            min_per_second=0,
+            max_tokens=config.get("HEDGE_BUDGET_BURST", 5),
+        )
+        self.metrics = metrics
+
+    def applies(self, method: str, route: str) -> bool:
+        return (
+            self.enabled
+            and method.upper() == "GET"
+            and (not self.routes or route in self.routes)
+        )
+
+    def delay_for(self, route: str) -> Optional[float]:
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        estimate = self.latencies.estimate(route)
+        return None if estimate is None else max(self.min_delay, estimate)
+
+    async def run(
+        self,
+        route: str,
+        send: Callable[[], Awaitable[T]],
+        admit: Callable[[], bool],
+    ) -> T:
+        self.budget.deposit()
+        delay = self.delay_for(route)
+        primary = asyncio.create_task(self._timed(route, send, primary=True))
+        hedge: Optional[asyncio.Task] = None
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+            # Hedges must fit both the hedge budget and the rate limiter.
+            if not self.budget.withdraw() or not admit():
+                self._count("skipped")
+                return await primary
+
+            esihub_logger.debug(
+                "Hedging slow request", extra={"route": route, "delay": delay}
+            )
+            hedge = asyncio.create_task(self._timed(route, send, primary=False))
+            self._count("sent")
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._count("won")
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+
+    async def _timed(
+        self, route: str, send: Callable[[], Awaitable[T]], primary: bool
+    ) -> T:
+        started = time.monotonic()
+        try:
+            result = await send()
+        except asyncio.CancelledError:
+            # A cancelled primary is recorded as a lower bound, so that
+            # hedging does not hide the slow tail it is reacting to.
+            if primary:
+                self.latencies.observe(route, time.monotonic() - started)
+            raise
+        except Exception:
+            self.latencies.observe(route, time.monotonic() - started)
+            raise
+        self.latencies.observe(route, time.monotonic() - started)
+        return result
+
+    def _count(self, outcome: str) -> None:
+        if self.metrics:
+            self.metrics.increment_hedge(outcome)
@@ -0,0 +1,83 @@
+import codecs
+import json
+import re
+from typing import Any, List
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_START = frozenset("-0123456789")
+DELIMITERS = frozenset(",]} \t\n\r")
+
+
+class ESIHubJSONArrayDecoder:
+    # Decodes a top-level JSON array incrementally: bytes are fed as they
+    # arrive and every complete item is returned as soon as it is parsed,
+    # so only the unparsed tail of the body is ever buffered.
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state != "done":
+            raise ValueError("Incomplete JSON array")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+
+            if self._state == "start":
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                pos += 1
+                self._state = "first"
+            elif self._state == "first" and buffer[pos] == "]":
+                pos += 1
+                self._state = "done"
+            elif self._state in ("first", "item"):
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number is only complete once a delimiter follows it:
+                # "[1." or "[1e" decodes as 1 but may continue as 1.5 or 1e3.
+                if not final and (
+                    end >= len(buffer)
+                    or (buffer[pos] in NUMBER_START and buffer[end] not in DELIMITERS)
+                ):
+                    break
+                items.append(item)
+                pos = end
+                self._state = "separator"
+            elif self._state == "separator":
+                if buffer[pos] == ",":
+                    self._state = "item"
+                elif buffer[pos] == "]":
+                    self._state = "done"
+                else:
+                    raise ValueError(f"Unexpected character {buffer[pos]!r}")
+                pos += 1
+            else:
+                raise ValueError("Unexpected data after JSON array")
+
+        self._buffer = buffer[pos:]
+        return items
@@ -0,0 +1,222 @@
+import asyncio
+import base64
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from cachetools import TTLCache
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+from .config import ESIHubConfig, esi_config
+from .logger import esihub_logger
+from ..exceptions import ESIHubAuthenticationError
+
+SSO_ISSUERS = ("login.eveonline.com", "https://login.eveonline.com")
+SSO_AUDIENCE = "EVE Online"
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _b64int(segment: str) -> int:
+    return int.from_bytes(_b64decode(segment), "big")
+
+
+class ESIHubJWKSCache:
+    def __init__(
+        self,
+        fetch_jwks: Optional[Callable[[], Awaitable[Dict[str, Any]]]] = None,
+        refresh_interval: int = 3600,
+        min_refresh_interval: int = 60,
+    ):
+        self.fetch_jwks = fetch_jwks
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.keys: Dict[str, Any] = {}
+        self.loaded_at = 0.0
+        self.attempted_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+
+    def load(self, jwks: Dict[str, Any]) -> None:
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            try:
+                keys[jwk["kid"]] = self._public_key(jwk)
+            except (KeyError, ValueError) as e:
+                esihub_logger.warning(f"Skipping unsupported JWK: {str(e)}")
+        self.keys = keys
+        self.loaded_at = time.monotonic()
+
+    def load_file(self, file_path: str) -> None:
+        with open(file_path, "r") as f:
+            self.load(json.load(f))
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self.loaded_at > self.refresh_interval
+
+    async def refresh(self, force: bool = False) -> None:
+        if self.fetch_jwks is None:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            age = now - self.loaded_at
+            if (force and age < self.min_refresh_interval) or (
+                not force and age <= self.refresh_interval
+            ):
+                return
+            # A failed fetch is not retried before min_refresh_interval, so
+            # an SSO outage does not turn every verify() into a fetch.
+            if (
+                self.attempted_at is not None
+                and now - self.attempted_at < self.min_refresh_interval
+            ):
+                return
+            self.attempted_at = now
+            try:
+                jwks = await self.fetch_jwks()
+            except Exception as e:
+                esihub_logger.warning(
+                    f"JWKS refresh failed, keeping cached keys: {str(e)}"
+                )
+                return
+            self.load(jwks)
+            esihub_logger.debug("JWKS refreshed", extra={"keys": list(self.keys)})
+
+    async def get_key(self, kid: str) -> Any:
+        if self.stale:
+            await self.refresh()
+        if kid not in self.keys:
+            # Keys may have been rotated since the last refresh.
+            await self.refresh(force=True)
+        return self.keys.get(kid)
+
+    @staticmethod
+    def _public_key(jwk: Dict[str, Any]) -> Any:
+        if jwk["kty"] == "RSA":
+            return rsa.RSAPublicNumbers(
+                _b64int(jwk["e"]), _b64int(jwk["n"])
+            ).public_key()
+        if jwk["kty"] == "EC" and jwk.get("crv") == "P-256":
+            return ec.EllipticCurvePublicNumbers(
+                _b64int(jwk["x"]), _b64int(jwk["y"]), ec.SECP256R1()
+            ).public_key()
+        raise ValueError(f"unsupported key type {jwk['kty']}")
+
+
+class ESIHubJWTValidator:
+    def __init__(
+        self,
+        jwks: ESIHubJWKSCache,
+        config: ESIHubConfig = esi_config,
+        cache_size: int = 10000,
+    ):
+        self.jwks = jwks
+        self.client_id = config.get("ESI_CLIENT_ID")
+        self.leeway = config.get("SSO_JWT_LEEWAY", 5)
+        self.verified: TTLCache = TTLCache(maxsize=cache_size, ttl=1200)
+
+    async def verify(
+        self, token: str, scopes: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        claims = self.verified.get(token)
+        if claims is None:
+            header, payload, signing_input, signature = self._split(token)
+            key = await self.jwks.get_key(header.get("kid"))
+            claims = self._verify(header, payload, signing_input, signature, key)
+            self.verified[token] = claims
+        return self._check_claims(claims, scopes)
+
+    def verify_sync(
+        self, token: str, scopes: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        claims = self.verified.get(token)
+        if claims is None:
+            header, payload, signing_input, signature = self._split(token)
+            key = self.jwks.keys.get(header.get("kid"))
+            claims = self._verify(header, payload, signing_input, signature, key)
+            self.verified[token] = claims
+        return self._check_claims(claims, scopes)
+
+    @staticmethod
+    def character_id(claims: Dict[str, Any]) -> int:
+        return int(claims["sub"].split(":")[-1])
+
+    @staticmethod
+    def _split(token: str):
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            header = json.loads(_b64decode(header_segment))
+            payload = json.loads(_b64decode(payload_segment))
+            signature = _b64decode(signature_segment)
+        except ValueError as e:
+            raise ESIHubAuthenticationError(f"Malformed token: {str(e)}")
+        signing_input = f"{header_segment}.{payload_segment}".encode()
+        return header, payload, signing_input, signature
+
+    def _verify(
+        self,
+        header: Dict[str, Any],
+        payload: Dict[str, Any],
+        signing_input: bytes,
+        signature: bytes,
+        key: Any,
+    ) -> Dict[str, Any]:
+        if key is None:
+            raise ESIHubAuthenticationError(f"Unknown signing key: {header.get('kid')}")
+        alg = header.get("alg")
+        try:
+            if alg == "RS256" and isinstance(key, rsa.RSAPublicKey):
+                key.verify(
+                    signature, signing_input, padding.PKCS1v15(), hashes.SHA256()
+                )
+            elif alg == "ES256" and isinstance(key, ec.EllipticCurvePublicKey):
+                r = int.from_bytes(signature[:32], "big")
+                s = int.from_bytes(signature[32:], "big")
+                key.verify(
+                    encode_dss_signature(r, s), signing_input, ec.ECDSA(hashes.SHA256())
+                )
+            else:
+                raise ESIHubAuthenticationError(f"Unsupported token algorithm: {alg}")
+        except InvalidSignature:
+            raise ESIHubAuthenticationError("Invalid token signature")
+
+        if payload.get("iss") not in SSO_ISSUERS:
+            raise ESIHubAuthenticationError(
+                f"Invalid token issuer: {payload.get('iss')}"
+            )
+        audience = payload.get("aud", [])
+        if isinstance(audience, str):
+            audience = [audience]
+        if SSO_AUDIENCE not in audience or (
+            self.client_id and self.client_id not in audience
+        ):
+            raise ESIHubAuthenticationError("Invalid token audience")
+
+        self._check_expiry(payload)
+        return payload
+
+    @staticmethod
+    def scopes(claims: Dict[str, Any]) -> List[str]:
+        scopes = claims.get("scp", [])
+        return [scopes] if isinstance(scopes, str) else list(scopes)
+
+    def _check_claims(
+        self, claims: Dict[str, Any], scopes: Optional[Iterable[str]]
+    ) -> Dict[str, Any]:
+        self._check_expiry(claims)
+        if scopes:
+            missing = set(scopes) - set(self.scopes(claims))
+            if missing:
+                raise ESIHubAuthenticationError(
+                    f"Token is missing scopes: {', '.join(sorted(missing))}"
+                )
+        return claims
+
+    def _check_expiry(self, claims: Dict[str, Any]) -> None:
+        if claims.get("exp", 0) + self.leeway < time.time():
+            raise ESIHubAuthenticationError("Token has expired")
@@ -0,0 +1,158 @@
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+
+from .logger import esihub_logger
+
+
+class ESIHubOrderState(NamedTuple):
+    price: float
+    volume_remain: int
+    type_id: int
+    location_id: int
+    is_buy_order: bool
+
+
+class ESIHubOrderChanges(NamedTuple):
+    region_id: int
+    new: List[Dict[str, Any]]
+    updated: List[Tuple[Dict[str, Any], ESIHubOrderState]]
+    closed: List[Tuple[int, ESIHubOrderState]]
+    pages_fetched: int
+    pages_skipped: int
+
+    @property
+    def empty(self) -> bool:
+        return not (self.new or self.updated or self.closed)
+
+
+def _state(order: Dict[str, Any]) -> ESIHubOrderState:
+    return ESIHubOrderState(
+        order["price"],
+        order["volume_remain"],
+        order["type_id"],
+        order["location_id"],
+        order["is_buy_order"],
+    )
+
+
+class ESIHubMarketOrderFeed:
+    # Keeps an order_id-indexed snapshot of a region's orders and turns each
+    # poll into a change feed. Pages are requested with their last ETag, and
+    # pages that come back 304 are neither decoded nor diffed, so a cycle
+    # costs one request per page plus work proportional to the changes.
+
+    EVENT = "market_orders_changed"
+    PATH = "/markets/{region_id}/orders/"
+
+    def __init__(self, client, region_id: int):
+        self.client = client
+        self.region_id = region_id
+        self.path = self.PATH.format(region_id=region_id)
+        self.orders: Dict[int, ESIHubOrderState] = {}
+        self.pages: Dict[int, List[int]] = {}
+        self.etags: Dict[int, str] = {}
+        self.page_count = 0
+        self.lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    async def poll(self) -> ESIHubOrderChanges:
+        async with self.lock:
+            # Every page is fetched before the snapshot is touched, so a
+            # failed cycle leaves it as it was.
+            first = await self._fetch_page(1)
+            page_count = int(first.headers.get("X-Pages") or self.page_count or 1)
+            rest = await asyncio.gather(
+                *(self._fetch_page(page) for page in range(2, page_count + 1))
+            )
+            responses = dict(enumerate([first, *rest], start=1))
+            changes = self._apply(responses, page_count)
+
+        esihub_logger.info(
+            "Market order feed updated",
+            extra={
+                "region_id": self.region_id,
+                "new": len(changes.new),
+                "updated": len(changes.updated),
+                "closed": len(changes.closed),
+                "pages_skipped": changes.pages_skipped,
+            },
+        )
+        if not changes.empty:
+            await self.client.event_system.emit(
+                self.EVENT, region_id=self.region_id, changes=changes
+            )
+        return changes
+
+    async def run(self, interval: float = 300.0) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                esihub_logger.error(
+                    f"Market order feed for region {self.region_id} failed: {str(e)}"
+                )
+            await asyncio.sleep(interval)
+
+    async def _fetch_page(self, page: int) -> Any:
+        etag = self.etags.get(page)
+        return await self.client.request(
+            "GET",
+            self.path,
+            params={"order_type": "all", "page": page},
+            headers={"If-None-Match": etag} if etag else {},
+        )
+
+    def _apply(self, responses: Dict[int, Any], page_count: int) -> ESIHubOrderChanges:
+        new: List[Dict[str, Any]] = []
+        updated: List[Tuple[Dict[str, Any], ESIHubOrderState]] = []
+        seen: Set[int] = set()
+        # Orders that left a changed page are only closed if they did not
+        # turn up on another changed page; a page they could have moved to
+        # cannot be unchanged.
+        departed: Set[int] = set()
+        skipped = 0
+
+        for page, response in responses.items():
+            if response.status == 304:
+                skipped += 1
+                continue
+            page_ids = []
+            for order in response.data or ():
+                order_id = order["order_id"]
+                page_ids.append(order_id)
+                seen.add(order_id)
+                state = _state(order)
+                previous = self.orders.get(order_id)
+                if previous is None:
+                    new.append(order)
+                elif (
+                    previous.price != state.price
+                    or previous.volume_remain != state.volume_remain
+                ):
+                    updated.append((order, previous))
+                self.orders[order_id] = state
+            departed.update(self.pages.get(page, ()))
+            self.pages[page] = page_ids
+            if response.etag:
+                self.etags[page] = response.etag
+
+        for page in [page for page in self.pages if page > page_count]:
+            departed.update(self.pages.pop(page))
+            self.etags.pop(page, None)
+        self.page_count = page_count
+
+        closed = [
+            (order_id, self.orders.pop(order_id))
+            for order_id in departed - seen
+            if order_id in self.orders
+        ]
+        return ESIHubOrderChanges(
+            self.region_id,
+            new,
+            updated,
+            closed,
+            len(responses) - skipped,
+            skipped,
+        )
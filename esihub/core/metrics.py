@@ -20,6 +20,77 @@ class ESIHubMetrics:
         self.active_requests = self._get_or_create_gauge(
             "esihub_active_requests", "Number of active requests"
         )
+        self.loop_lag = self._get_or_create_histogram(
+            "esihub_event_loop_lag_seconds",
+            "Delay between scheduled and actual event loop wake-ups",
+            [],
+            buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+        )
+        self.offloaded_decodes = self._get_or_create_counter(
+            "esihub_offloaded_decodes_total",
+            "Response bodies decoded in the worker pool",
+            [],
+        )
+        self.transfer_bytes = self._get_or_create_counter(
+            "esihub_transfer_bytes_total",
+            "Response body bytes per route template, on the wire and decoded",
+            ["route", "kind"],
+        )
+        self.decompression_seconds = self._get_or_create_histogram(
+            "esihub_decompression_seconds",
+            "Time spent decompressing response bodies",
+            ["encoding"],
+            buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5),
+        )
+        self.cache_hits = self._get_or_create_counter(
+            "esihub_cache_hits_total", "Requests answered from cache", ["tier"]
+        )
+        self.retries = self._get_or_create_counter(
+            "esihub_retries_total", "Requests retried", ["reason"]
+        )
+        self.retry_giveups = self._get_or_create_counter(
+            "esihub_retry_giveups_total",
+            "Retryable failures that were not retried",
+            ["reason", "cause"],
+        )
+        self.circuit_state = self._get_or_create_gauge(
+            "esihub_circuit_state",
+            "Circuit breaker state per route (0 closed, 1 half-open, 2 open)",
+            ["route"],
+        )
+        self.circuit_rejections = self._get_or_create_counter(
+            "esihub_circuit_rejections_total",
+            "Requests short-circuited by an open breaker",
+            ["route", "outcome"],
+        )
+        self.hedges = self._get_or_create_counter(
+            "esihub_hedged_requests_total",
+            "Hedged request attempts by outcome (sent, won, skipped)",
+            ["outcome"],
+        )
+        self.concurrency_limit = self._get_or_create_gauge(
+            "esihub_concurrency_limit", "Current adaptive in-flight request limit"
+        )
+        self.scheduler_depth = self._get_or_create_gauge(
+            "esihub_scheduler_queue_depth",
+            "Requests waiting for a concurrency slot per tenant group",
+            ["tenant"],
+        )
+        self.scheduler_wait = self._get_or_create_histogram(
+            "esihub_scheduler_wait_seconds",
+            "Time requests waited for a concurrency slot per tenant group",
+            ["tenant"],
+        )
+        self.deadline_shed = self._get_or_create_counter(
+            "esihub_deadline_shed_total",
+            "Requests dropped because their deadline could not be met, by stage",
+            ["stage"],
+        )
+        self.transport_connections = self._get_or_create_gauge(
+            "esihub_transport_connections",
+            "Connections opened or reused by the shared transport",
+            ["state"],
+        )
 
     def _get_or_create_counter(self, name, documentation, labelnames):
         try:
@@ -27,15 +98,17 @@ class ESIHubMetrics:
         except ValueError:
             return self.registry._names_to_collectors[name]
 
-    def _get_or_create_histogram(self, name, documentation, labelnames):
+    def _get_or_create_histogram(self, name, documentation, labelnames, **kwargs):
         try:
-            return Histogram(name, documentation, labelnames, registry=self.registry)
+            return Histogram(
+                name, documentation, labelnames, registry=self.registry, **kwargs
+            )
         except ValueError:
             return self.registry._names_to_collectors[name]
 
-    def _get_or_create_gauge(self, name, documentation):
+    def _get_or_create_gauge(self, name, documentation, labelnames=()):
         try:
-            return Gauge(name, documentation, registry=self.registry)
+            return Gauge(name, documentation, labelnames, registry=self.registry)
         except ValueError:
             return self.registry._names_to_collectors[name]
 
@@ -55,3 +128,57 @@ class ESIHubMetrics:
 
     def increment_error(self, error_type: str):
         self.error_counter.labels(error_type=error_type).inc()
+
+    def track_transport(self, pool):
+        self.transport_connections.labels(state="created").set_function(
+            lambda: pool.connections_created
+        )
+        self.transport_connections.labels(state="reused").set_function(
+            lambda: pool.connections_reused
+        )
+
+    def observe_loop_lag(self, lag: float):
+        self.loop_lag.observe(lag)
+
+    def increment_offloaded_decode(self):
+        self.offloaded_decodes.inc()
+
+    def record_transfer(self, route: str, wire: int, decoded: int):
+        self.transfer_bytes.labels(route=route, kind="wire").inc(wire)
+        self.transfer_bytes.labels(route=route, kind="decoded").inc(decoded)
+
+    def observe_decompression(self, encoding: str, seconds: float):
+        self.decompression_seconds.labels(encoding=encoding).observe(seconds)
+
+    def increment_retry(self, reason: str):
+        self.retries.labels(reason=reason).inc()
+
+    def increment_retry_giveup(self, reason: str, cause: str):
+        self.retry_giveups.labels(reason=reason, cause=cause).inc()
+
+    def set_circuit_state(self, route: str, state: int):
+        self.circuit_state.labels(route=route).set(state)
+
+    def increment_circuit_rejection(self, route: str, outcome: str):
+        self.circuit_rejections.labels(route=route, outcome=outcome).inc()
+
+    def increment_cache_hit(self, tier: str):
+        self.cache_hits.labels(tier=tier).inc()
+
+    def increment_hedge(self, outcome: str):
+        self.hedges.labels(outcome=outcome).inc()
+
+    def increment_deadline_shed(self, stage: str):
+        self.deadline_shed.labels(stage=stage).inc()
+
+    def set_concurrency_limit(self, limit: int):
+        self.concurrency_limit.set(limit)
+
+    def set_scheduler_depth(self, tenant: str, depth: int):
+        if depth:
+            self.scheduler_depth.labels(tenant=tenant).set(depth)
+        else:
+            self.scheduler_depth.remove(tenant)
+
+    def observe_scheduler_wait(self, tenant: str, seconds: float):
+        self.scheduler_wait.labels(tenant=tenant).observe(seconds)
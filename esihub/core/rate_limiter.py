@@ -1,11 +1,12 @@
 import asyncio
 import time
-from typing import Dict
+from typing import Dict, Optional
 
 from multidict import CIMultiDictProxy
 
 from .config import ESIHubConfig
 from .logger import esihub_logger
+from ..exceptions import ESIHubDeadlineExceededError
 
 
 class ESIHubRateLimiter:
@@ -15,40 +16,71 @@ class ESIHubRateLimiter:
         self.global_limit = self.config.get("ESI_RATE_LIMIT", 150)
         self.global_remaining = self.global_limit
         self.global_reset = 0
+        self.error_limit_remain: Optional[int] = None
         self.lock = asyncio.Lock()
 
-    async def acquire(self, endpoint: str):
-        async with self.lock:
-            await self._check_global_limit()
-
-            if endpoint not in self.limiters:
-                self.limiters[endpoint] = {
-                    "limit": self.global_limit,
-                    "remaining": self.global_limit,
-                    "reset": 0,
-                }
+    async def acquire(self, endpoint: str, deadline: Optional[float] = None):
+        # ``deadline`` is an absolute event loop time. Waits that would end
+        # past it fail straight away instead of sleeping, and no token is
+        # spent on a request that cannot make it.
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self.lock.acquire()
+        except TimeoutError:
+            raise self._deadline_exceeded() from None
+        try:
+            await self._acquire(endpoint, deadline)
+        finally:
+            self.lock.release()
+
+    async def _acquire(self, endpoint: str, deadline: Optional[float]):
+        await self._check_global_limit(deadline)
+
+        if endpoint not in self.limiters:
+            self.limiters[endpoint] = {
+                "limit": self.global_limit,
+                "remaining": self.global_limit,
+                "reset": 0,
+            }
+
+        limiter = self.limiters[endpoint]
+        current_time = time.time()
 
-            limiter = self.limiters[endpoint]
-            current_time = time.time()
+        if current_time > limiter["reset"]:
+            limiter["remaining"] = limiter["limit"]
+            limiter["reset"] = current_time + 1  # Reset every second
 
-            if current_time > limiter["reset"]:
-                limiter["remaining"] = limiter["limit"]
-                limiter["reset"] = current_time + 1  # Reset every second
+        if limiter["remaining"] <= 0:
+            wait_time = limiter["reset"] - current_time
+            self._check_deadline(deadline, wait_time)
+            esihub_logger.debug(
+                "Rate limit reached, waiting",
+                extra={"endpoint": endpoint, "wait_time": wait_time},
+            )
+            await asyncio.sleep(wait_time)
+            limiter["remaining"] = limiter["limit"]
+            limiter["reset"] = time.time() + 1
 
-            if limiter["remaining"] <= 0:
-                wait_time = limiter["reset"] - current_time
-                esihub_logger.debug(
-                    "Rate limit reached, waiting",
-                    extra={"endpoint": endpoint, "wait_time": wait_time},
-                )
-                await asyncio.sleep(wait_time)
-                limiter["remaining"] = limiter["limit"]
-                limiter["reset"] = time.time() + 1
+        limiter["remaining"] -= 1
+        self.global_remaining -= 1
 
+    def try_acquire(self, endpoint: str) -> bool:
+        # Non-blocking variant for optional traffic such as hedged requests:
+        # takes a token only if one is available right now.
+        current_time = time.time()
+        limiter = self.limiters.get(endpoint)
+        if self.lock.locked() or (
+            current_time <= self.global_reset and self.global_remaining <= 0
+        ):
+            return False
+        if limiter and current_time <= limiter["reset"] and limiter["remaining"] <= 0:
+            return False
+        if limiter:
             limiter["remaining"] -= 1
-            self.global_remaining -= 1
+        self.global_remaining -= 1
+        return True
 
-    async def _check_global_limit(self):
+    async def _check_global_limit(self, deadline: Optional[float] = None):
         current_time = time.time()
         if current_time > self.global_reset:
             self.global_remaining = self.global_limit
@@ -56,6 +88,7 @@ class ESIHubRateLimiter:
 
         if self.global_remaining <= 0:
             wait_time = self.global_reset - current_time
+            self._check_deadline(deadline, wait_time)
             esihub_logger.debug(
                 "Global rate limit reached, waiting", extra={"wait_time": wait_time}
             )
@@ -63,6 +96,18 @@ class ESIHubRateLimiter:
             self.global_remaining = self.global_limit
             self.global_reset = time.time() + 1
 
+    def _check_deadline(self, deadline: Optional[float], wait_time: float):
+        if deadline is not None:
+            if asyncio.get_running_loop().time() + wait_time >= deadline:
+                raise self._deadline_exceeded()
+
+    @staticmethod
+    def _deadline_exceeded() -> ESIHubDeadlineExceededError:
+        return ESIHubDeadlineExceededError(
+            "Deadline exceeded while waiting for the rate limiter",
+            details={"stage": "rate_limit"},
+        )
+
     def update_limit(self, endpoint: str, headers: CIMultiDictProxy[str]):
         if (
             "X-Esi-Error-Limit-Remain" in headers
@@ -83,6 +128,7 @@ class ESIHubRateLimiter:
 
         if "X-Esi-Error-Limit-Remain" in headers:
             self.global_remaining = int(headers["X-Esi-Error-Limit-Remain"])
+            self.error_limit_remain = self.global_remaining
         if "X-Esi-Error-Limit-Reset" in headers:
             self.global_reset = time.time() + int(headers["X-Esi-Error-Limit-Reset"])
 
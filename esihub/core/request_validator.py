@@ -0,0 +1,242 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from .spec_index import ESIHubOperation, ESIHubSpecIndex
+from ..exceptions import ESIHubValidationError
+
+Check = Callable[[Any], Optional[str]]
+
+BOOLEANS = frozenset({"true", "false"})
+
+
+def _nested(prefix: str, error: str) -> str:
+    # Errors from nested schemas already start with ".field" or "[index]".
+    return prefix + (error if error[0] in ".[" else f": {error}")
+
+
+class _OperationValidator:
+    __slots__ = ("path", "query", "required_query", "body", "body_required")
+
+    def __init__(self):
+        self.path: Dict[str, Check] = {}
+        self.query: Dict[str, Check] = {}
+        self.required_query: List[str] = []
+        self.body: Optional[Check] = None
+        self.body_required = False
+
+    def errors(
+        self, path_args: Dict[str, str], query: Dict[str, Any], body: Any
+    ) -> List[str]:
+        errors = []
+        for name, check in self.path.items():
+            error = check(path_args.get(name))
+            if error:
+                errors.append(_nested(f"path.{name}", error))
+        for name in self.required_query:
+            if query.get(name) is None:
+                errors.append(f"query.{name}: is required")
+        for name, value in query.items():
+            check = self.query.get(name)
+            if check is not None and value is not None:
+                error = check(value)
+                if error:
+                    errors.append(_nested(f"query.{name}", error))
+        if body is None:
+            if self.body_required:
+                errors.append("body: is required")
+        elif self.body is not None:
+            error = self.body(body)
+            if error:
+                errors.append(_nested("body", error))
+        return errors
+
+
+class ESIHubRequestValidator:
+    # Compiles each operation's parameter rules from the spec into plain
+    # closures once, so that checking a request before it is queued costs a
+    # few dict lookups and comparisons. Paths the spec does not know about
+    # are passed through untouched.
+
+    def __init__(self, spec_index: ESIHubSpecIndex, enabled: bool = True):
+        self.spec_index = spec_index
+        self.enabled = enabled
+        self._validators: Dict[str, _OperationValidator] = {}
+
+    def validate(self, method: str, path: str, kwargs: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        matched = self.spec_index.match(method, path)
+        if matched is None:
+            return
+        operation, path_args = matched
+        errors = self.validator_for(operation).errors(
+            path_args, kwargs.get("params") or {}, kwargs.get("json")
+        )
+        if errors:
+            raise ESIHubValidationError(
+                f"Invalid request for {operation.operation_id}: {'; '.join(errors)}",
+                details={"operation": operation.operation_id, "errors": errors},
+            )
+
+    def required_params(self, method: str, path: str) -> List[str]:
+        matched = self.spec_index.match(method, path)
+        if matched is None:
+            return []
+        return [
+            param["name"]
+            for param in matched[0].parameters
+            if param.get("required") and param.get("in") != "path"
+        ]
+
+    def validator_for(self, operation: ESIHubOperation) -> _OperationValidator:
+        validator = self._validators.get(operation.operation_id)
+        if validator is None:
+            validator = self._validators[operation.operation_id] = self._compile(
+                operation
+            )
+        return validator
+
+    def _compile(self, operation: ESIHubOperation) -> _OperationValidator:
+        validator = _OperationValidator()
+        for param in operation.parameters_in("path"):
+            check = self._check(param, coerce=True)
+            validator.path[param["name"]] = self._required(check)
+        for param in operation.parameters_in("query"):
+            validator.query[param["name"]] = self._check(param, coerce=True)
+            # A required parameter with a default (e.g. order_type="all") is
+            # filled in by ESI, so only the others have to be present.
+            if param.get("required") and "default" not in param:
+                validator.required_query.append(param["name"])
+        for param in operation.parameters_in("body"):
+            validator.body = self._check(param.get("schema", {}), coerce=False)
+            validator.body_required = bool(param.get("required"))
+        return validator
+
+    @staticmethod
+    def _required(check: Check) -> Check:
+        def required(value: Any) -> Optional[str]:
+            return "is required" if value is None else check(value)
+
+        return required
+
+    def _check(self, schema: Dict[str, Any], coerce: bool) -> Check:
+        # ``coerce`` accepts the string forms that path and query values
+        # take on the wire, e.g. "30000142" for an integer.
+        schema = self.spec_index.resolve(schema)
+        kind = schema.get("type")
+        if kind == "integer":
+            return self._number(schema, int, coerce)
+        if kind == "number":
+            return self._number(schema, float, coerce)
+        if kind == "boolean":
+            return self._boolean(coerce)
+        if kind == "string":
+            return self._string(schema)
+        if kind == "array":
+            return self._array(schema, coerce)
+        if kind == "object" or "properties" in schema:
+            return self._object(schema)
+        return lambda value: None
+
+    @staticmethod
+    def _number(schema: Dict[str, Any], kind: type, coerce: bool) -> Check:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        enum = set(schema["enum"]) if "enum" in schema else None
+        name = "an integer" if kind is int else "a number"
+
+        def check(value: Any) -> Optional[str]:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                if not (coerce and isinstance(value, str)):
+                    return f"must be {name}"
+                try:
+                    value = kind(value)
+                except ValueError:
+                    return f"must be {name}"
+            elif kind is int and isinstance(value, float):
+                return f"must be {name}"
+            if minimum is not None and value < minimum:
+                return f"must be >= {minimum}"
+            if maximum is not None and value > maximum:
+                return f"must be <= {maximum}"
+            if enum is not None and value not in enum:
+                return f"must be one of {', '.join(map(str, schema['enum']))}"
+            return None
+
+        return check
+
+    @staticmethod
+    def _boolean(coerce: bool) -> Check:
+        def check(value: Any) -> Optional[str]:
+            if isinstance(value, bool):
+                return None
+            if coerce and isinstance(value, str) and value.lower() in BOOLEANS:
+                return None
+            return "must be a boolean"
+
+        return check
+
+    @staticmethod
+    def _string(schema: Dict[str, Any]) -> Check:
+        enum = set(schema["enum"]) if "enum" in schema else None
+        min_length = schema.get("minLength")
+        max_length = schema.get("maxLength")
+
+        def check(value: Any) -> Optional[str]:
+            if not isinstance(value, str):
+                return "must be a string"
+            if enum is not None and value not in enum:
+                return f"must be one of {', '.join(schema['enum'])}"
+            if min_length is not None and len(value) < min_length:
+                return f"must be at least {min_length} characters"
+            if max_length is not None and len(value) > max_length:
+                return f"must be at most {max_length} characters"
+            return None
+
+        return check
+
+    def _array(self, schema: Dict[str, Any], coerce: bool) -> Check:
+        items = self._check(schema.get("items", {}), coerce)
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+        unique = schema.get("uniqueItems", False)
+
+        def check(value: Any) -> Optional[str]:
+            if coerce and isinstance(value, str):
+                value = value.split(",")
+            if not isinstance(value, (list, tuple, set)):
+                return "must be an array"
+            if min_items is not None and len(value) < min_items:
+                return f"must have at least {min_items} items"
+            if max_items is not None and len(value) > max_items:
+                return f"must have at most {max_items} items"
+            if unique and len(set(map(repr, value))) != len(value):
+                return "must not contain duplicates"
+            for index, item in enumerate(value):
+                error = items(item)
+                if error:
+                    return _nested(f"[{index}]", error)
+            return None
+
+        return check
+
+    def _object(self, schema: Dict[str, Any]) -> Check:
+        required = schema.get("required", [])
+        properties = {
+            name: self._check(prop, coerce=False)
+            for name, prop in schema.get("properties", {}).items()
+        }
+
+        def check(value: Any) -> Optional[str]:
+            if not isinstance(value, dict):
+                return "must be an object"
+            for name in required:
+                if name not in value:
+                    return f".{name}: is required"
+            for name, prop in properties.items():
+                if value.get(name) is not None:
+                    error = prop(value[name])
+                    if error:
+                        return _nested(f".{name}", error)
+            return None
+
+        return check
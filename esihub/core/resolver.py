@@ -0,0 +1,175 @@
+import asyncio
+import gzip
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cachetools import TTLCache
+
+from .logger import esihub_logger
+
+CATEGORIES = (
+    "alliance",
+    "character",
+    "constellation",
+    "corporation",
+    "inventory_type",
+    "region",
+    "solar_system",
+    "station",
+    "faction",
+)
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+
+# /universe/ids/ groups its results under plural keys.
+IDS_RESPONSE_CATEGORIES = {
+    "agents": "character",
+    "alliances": "alliance",
+    "characters": "character",
+    "constellations": "constellation",
+    "corporations": "corporation",
+    "factions": "faction",
+    "inventory_types": "inventory_type",
+    "regions": "region",
+    "stations": "station",
+    "systems": "solar_system",
+}
+
+
+class ESIHubNameResolver:
+    def __init__(
+        self,
+        client,
+        persist_path: Optional[str] = None,
+        negative_ttl: float = 3600,
+        negative_size: int = 100000,
+    ):
+        self.client = client
+        self.persist_path = persist_path
+        self._names: Dict[int, str] = {}
+        self._categories: Dict[int, int] = {}
+        self._ids: Dict[Tuple[int, str], int] = {}
+        # Names ESI did not know, keyed by (category code or None, folded
+        # name); they expire because names can start resolving later.
+        self._unresolved_names: TTLCache = TTLCache(
+            maxsize=negative_size, ttl=negative_ttl
+        )
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._names
+
+    def add(self, entity_id: int, name: str, category: str) -> None:
+        code = CATEGORY_CODES[category]
+        self._names[entity_id] = name
+        self._categories[entity_id] = code
+        self._ids[(code, name.casefold())] = entity_id
+
+    def warm(self, entries: Iterable[Tuple[int, str, str]]) -> int:
+        count = 0
+        for entity_id, name, category in entries:
+            self.add(entity_id, name, category)
+            count += 1
+        return count
+
+    def name(self, entity_id: int) -> Optional[str]:
+        return self._names.get(entity_id)
+
+    def category(self, entity_id: int) -> Optional[str]:
+        code = self._categories.get(entity_id)
+        return None if code is None else CATEGORIES[code]
+
+    def id(self, name: str, category: Optional[str] = None) -> Optional[int]:
+        folded = name.casefold()
+        if category is not None:
+            return self._ids.get((CATEGORY_CODES[category], folded))
+        for code in range(len(CATEGORIES)):
+            entity_id = self._ids.get((code, folded))
+            if entity_id is not None:
+                return entity_id
+        return None
+
+    async def resolve_names(self, ids: Iterable[int]) -> Dict[int, Optional[str]]:
+        ids = list(dict.fromkeys(ids))
+        unknown = [i for i in ids if i not in self._names]
+        if unknown:
+            batcher = self.client.auto_batcher("post_universe_names")
+            for item in await batcher.load_many(unknown):
+                if item:
+                    self.add(item["id"], item["name"], item["category"])
+        return {i: self._names.get(i) for i in ids}
+
+    async def resolve_ids(
+        self, names: Iterable[str], category: Optional[str] = None
+    ) -> Dict[str, Optional[int]]:
+        names = list(dict.fromkeys(names))
+        code = None if category is None else CATEGORY_CODES[category]
+        unknown = [
+            n
+            for n in names
+            if self.id(n, category) is None
+            and (code, n.casefold()) not in self._unresolved_names
+        ]
+        if unknown:
+            chunk_size = self._max_items("post_universe_ids", 500)
+            chunks = [
+                unknown[i : i + chunk_size] for i in range(0, len(unknown), chunk_size)
+            ]
+            responses = await asyncio.gather(
+                *(
+                    self.client.request("POST", "/universe/ids/", json=chunk)
+                    for chunk in chunks
+                )
+            )
+            for response in responses:
+                self._add_ids_response(response.data)
+            for n in unknown:
+                if self.id(n, category) is None:
+                    self._unresolved_names[(code, n.casefold())] = True
+        return {n: self.id(n, category) for n in names}
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.persist_path
+        if not path:
+            raise ValueError("No persist path configured")
+        grouped: Dict[str, List[Tuple[int, str]]] = {c: [] for c in CATEGORIES}
+        for entity_id, name in self._names.items():
+            grouped[CATEGORIES[self._categories[entity_id]]].append((entity_id, name))
+        tmp_path = f"{path}.tmp"
+        with self._open(tmp_path, "wt", compressed=path.endswith(".gz")) as f:
+            json.dump(grouped, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        esihub_logger.debug("Saved resolver index", extra={"entries": len(self)})
+
+    def load(self, path: Optional[str] = None) -> int:
+        path = path or self.persist_path
+        if not path or not os.path.exists(path):
+            return 0
+        with self._open(path, "rt", compressed=path.endswith(".gz")) as f:
+            grouped = json.load(f)
+        count = self.warm(
+            (entity_id, name, category)
+            for category, entries in grouped.items()
+            for entity_id, name in entries
+        )
+        esihub_logger.debug("Loaded resolver index", extra={"entries": count})
+        return count
+
+    def _add_ids_response(self, data) -> None:
+        if not isinstance(data, dict):
+            return
+        for key, category in IDS_RESPONSE_CATEGORIES.items():
+            for item in data.get(key) or []:
+                self.add(item["id"], item["name"], category)
+
+    def _max_items(self, operation_id: str, default: int) -> int:
+        body_schema = self.client.spec_index.operation(operation_id).body_schema
+        return (body_schema or {}).get("maxItems", default)
+
+    @staticmethod
+    def _open(path: str, mode: str, compressed: bool):
+        if compressed:
+            return gzip.open(path, mode, encoding="utf-8")
+        return open(path, mode, encoding="utf-8")
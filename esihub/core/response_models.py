@@ -0,0 +1,90 @@
+import keyword
+import re
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ConfigDict, Field, TypeAdapter, create_model
+
+from .spec_index import ESIHubSpecIndex
+
+PRIMITIVES = {
+    ("integer", None): int,
+    ("integer", "int32"): int,
+    ("integer", "int64"): int,
+    ("number", None): float,
+    ("number", "float"): float,
+    ("number", "double"): float,
+    ("boolean", None): bool,
+    ("string", None): str,
+    ("string", "date"): date,
+    ("string", "date-time"): datetime,
+}
+
+NON_IDENTIFIER = re.compile(r"\W")
+
+MODEL_CONFIG = ConfigDict(
+    extra="ignore", protected_namespaces=(), serialize_by_alias=True
+)
+
+
+class ESIHubResponseModels:
+    # Builds pydantic models from the spec's response schemas once per
+    # operationId and hands out TypeAdapters that validate raw bytes.
+
+    def __init__(self, spec_index: ESIHubSpecIndex):
+        self.spec_index = spec_index
+        self._models: Dict[str, Any] = {}
+        self._adapters: Dict[Any, TypeAdapter] = {}
+
+    def model_for(self, operation_id: str) -> Any:
+        if operation_id not in self._models:
+            operation = self.spec_index.operation(operation_id)
+            schema = operation.response_schema()
+            self._models[operation_id] = (
+                self._build_type(schema, operation_id) if schema else Any
+            )
+        return self._models[operation_id]
+
+    def adapter_for(self, operation_id: str) -> TypeAdapter:
+        return self.adapter(self.model_for(operation_id))
+
+    def adapter(self, tp: Any) -> TypeAdapter:
+        try:
+            return self._adapters[tp]
+        except KeyError:
+            adapter = self._adapters[tp] = TypeAdapter(tp)
+            return adapter
+
+    def match(self, method: str, path: str) -> Optional[TypeAdapter]:
+        match = self.spec_index.match(method, path)
+        if match is None:
+            return None
+        return self.adapter_for(match[0].operation_id)
+
+    def _build_type(self, schema: Dict[str, Any], name: str) -> Any:
+        schema = self.spec_index.resolve(schema)
+        kind = schema.get("type")
+        if kind == "array":
+            item_type = self._build_type(schema.get("items", {}), name)
+            return List[item_type]
+        if kind == "object" or "properties" in schema:
+            if "properties" not in schema:
+                return Dict[str, Any]
+            return self._build_model(schema, name)
+        return PRIMITIVES.get((kind, schema.get("format")), Any)
+
+    def _build_model(self, schema: Dict[str, Any], name: str) -> type:
+        required = set(schema.get("required", []))
+        fields: Dict[str, Tuple[Any, Any]] = {}
+        for prop, prop_schema in schema["properties"].items():
+            tp = self._build_type(prop_schema, f"{name}_{prop}")
+            default = ... if prop in required else None
+            if prop not in required:
+                tp = Optional[tp]
+            field_name = prop
+            if not prop.isidentifier() or keyword.iskeyword(prop):
+                field_name = NON_IDENTIFIER.sub("_", prop) + "_"
+            fields[field_name] = (tp, Field(default, alias=prop))
+        title = schema.get("title") or name
+        model_name = "".join(part.title() for part in title.split("_"))
+        return create_model(model_name, __config__=MODEL_CONFIG, **fields)
@@ -0,0 +1,152 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Mapping, Optional, TypeVar
+
+from .config import ESIHubConfig
+from .logger import esihub_logger
+from ..exceptions import ESIHubConnectionError, ESIHubError, ESIHubTimeoutError
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class ESIHubRetryBudget:
+    # Token bucket shared by every request of a client: each request earns
+    # ``ratio`` of a retry, plus a small time-based allowance, so retries can
+    # never add more than ``ratio`` extra load on top of normal traffic.
+
+    def __init__(
+        self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 20
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.updated = time.monotonic()
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(
+            self.max_tokens, self.tokens + (now - self.updated) * self.min_per_second
+        )
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class ESIHubRetryPolicy:
+    def __init__(self, config: ESIHubConfig, metrics=None):
+        self.max_retries = config.get("ESI_RETRY_ATTEMPTS", 3)
+        self.base_delay = config.get("RETRY_BASE_DELAY", 0.5)
+        self.max_delay = config.get("RETRY_MAX_DELAY", 30.0)
+        self.statuses = frozenset(config.get("RETRY_STATUSES", (502, 503, 504)))
+        self.error_limit_floor = config.get("RETRY_ERROR_LIMIT_FLOOR", 10)
+        self.budget = ESIHubRetryBudget(
+            ratio=config.get("RETRY_BUDGET_RATIO", 0.2),
+            min_per_second=config.get("RETRY_BUDGET_MIN_PER_SECOND", 1.0),
+        )
+        self.metrics = metrics
+
+    def is_retryable(self, method: str, error: BaseException) -> bool:
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        if isinstance(error, (ESIHubTimeoutError, ESIHubConnectionError)):
+            return True
+        return isinstance(error, ESIHubError) and error.status_code in self.statuses
+
+    async def call(
+        self,
+        method: str,
+        func: Callable[[], Awaitable[T]],
+        deadline: Optional[float] = None,
+    ) -> T:
+        attempt = 0
+        delay = self.base_delay
+        # Only the request itself earns retry budget, not its retries.
+        self.budget.deposit()
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if not self.is_retryable(method, e):
+                    raise
+                reason = self._reason(e)
+                if attempt >= self.max_retries:
+                    self._give_up(reason, "attempts")
+                    raise
+                hint = self.server_hint(getattr(e, "headers", None))
+                if hint is not None and hint > self.max_delay:
+                    self._give_up(reason, "hint")
+                    raise
+                delay = self.next_delay(delay)
+                if hint is not None:
+                    delay = max(delay, hint)
+                # A retry that cannot finish before the deadline is not sent.
+                if deadline is not None:
+                    if asyncio.get_running_loop().time() + delay >= deadline:
+                        self._give_up(reason, "deadline")
+                        if self.metrics:
+                            self.metrics.increment_deadline_shed("retry")
+                        raise
+                if not self.budget.withdraw():
+                    self._give_up(reason, "budget")
+                    raise
+
+                attempt += 1
+                if self.metrics:
+                    self.metrics.increment_retry(reason)
+                esihub_logger.warning(
+                    f"Retry {attempt}/{self.max_retries} after {delay:.2f}s. "
+                    f"Error: {str(e)}"
+                )
+                await asyncio.sleep(delay)
+
+    def next_delay(self, previous: float) -> float:
+        # Decorrelated jitter: spreads retries from many workers apart while
+        # still growing roughly exponentially.
+        return min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+    def server_hint(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        if not headers:
+            return None
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after).timestamp()
+                except (TypeError, ValueError):
+                    return None
+                return max(0.0, retry_at - time.time())
+        # Only wait for the error window to reset once it is nearly spent.
+        remain = headers.get("X-Esi-Error-Limit-Remain")
+        reset = headers.get("X-Esi-Error-Limit-Reset")
+        if remain is not None and reset is not None:
+            try:
+                if int(remain) <= self.error_limit_floor:
+                    return max(0.0, float(reset))
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def _reason(error: BaseException) -> str:
+        if isinstance(error, ESIHubTimeoutError):
+            return "timeout"
+        if isinstance(error, ESIHubConnectionError):
+            return "connection"
+        return str(getattr(error, "status_code", None) or type(error).__name__)
+
+    def _give_up(self, reason: str, cause: str) -> None:
+        if self.metrics:
+            self.metrics.increment_retry_giveup(reason, cause)
+        esihub_logger.warning(f"Giving up on {reason} ({cause})")
@@ -0,0 +1,131 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
+
+DEFAULT_TENANT = "default"
+OTHER_TENANTS = "other"
+PRUNE_THRESHOLD = 1024
+
+
+class _Entry:
+    __slots__ = ("waiter", "tenant", "label", "enqueued_at")
+
+    def __init__(self, waiter: asyncio.Future, tenant: str, label: str):
+        self.waiter = waiter
+        self.tenant = tenant
+        self.label = label
+        self.enqueued_at = time.monotonic()
+
+
+class _PriorityClass:
+    # Weighted fair queuing across tenants: every queued request gets a
+    # virtual finish tag of max(virtual time, tenant's last tag) + 1/weight,
+    # and the smallest tag is dispatched first. Idle tenants restart at the
+    # current virtual time, so nobody can bank credit while idle.
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int, _Entry]] = []
+        self.virtual_time = 0.0
+        self.last_finish: Dict[str, float] = {}
+        self.prune_at = PRUNE_THRESHOLD
+
+
+class ESIHubFairQueue:
+    def __init__(self, metrics=None):
+        self.metrics = metrics
+        self.weights: Dict[str, float] = {}
+        self.depths: Dict[str, int] = {}
+        self.label_depths: Dict[str, int] = {}
+        self._classes: Dict[int, _PriorityClass] = {}
+        self._entries: Dict[asyncio.Future, _Entry] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_weight(self, tenant: Any, weight: float) -> None:
+        self.weights[self._tenant(tenant)] = weight
+
+    def push(self, waiter: asyncio.Future, priority: int, tenant: Any) -> None:
+        tenant = self._tenant(tenant)
+        queue = self._classes.get(priority)
+        if queue is None:
+            queue = self._classes[priority] = _PriorityClass()
+        start = max(queue.virtual_time, queue.last_finish.get(tenant, 0.0))
+        finish = start + 1 / self.weights.get(tenant, 1.0)
+        queue.last_finish[tenant] = finish
+        entry = _Entry(waiter, tenant, self._label(tenant))
+        heapq.heappush(queue.heap, (finish, next(self._sequence), entry))
+        self._entries[waiter] = entry
+        self._set_depth(entry, 1)
+
+    def pop(self) -> Optional[asyncio.Future]:
+        for priority in sorted(self._classes):
+            queue = self._classes[priority]
+            while queue.heap:
+                finish, _, entry = heapq.heappop(queue.heap)
+                if self._entries.pop(entry.waiter, None) is None:
+                    continue
+                self._set_depth(entry, -1)
+                queue.virtual_time = finish
+                self._forget_idle(queue)
+                if self.metrics:
+                    self.metrics.observe_scheduler_wait(
+                        entry.label, time.monotonic() - entry.enqueued_at
+                    )
+                return entry.waiter
+            if not queue.heap:
+                del self._classes[priority]
+        return None
+
+    def discard(self, waiter: asyncio.Future) -> None:
+        # The heap entry is skipped lazily when it reaches the top.
+        entry = self._entries.pop(waiter, None)
+        if entry is not None:
+            self._set_depth(entry, -1)
+
+    def record_immediate(self, tenant: Any) -> None:
+        if self.metrics:
+            self.metrics.observe_scheduler_wait(self._label(self._tenant(tenant)), 0.0)
+
+    @staticmethod
+    def _tenant(tenant: Any) -> str:
+        return DEFAULT_TENANT if tenant is None else str(tenant)
+
+    def _label(self, tenant: str) -> str:
+        # Tenants are usually character or corporation IDs, so only the
+        # default tenant and weighted ones get their own metric series.
+        if tenant == DEFAULT_TENANT or tenant in self.weights:
+            return tenant
+        return OTHER_TENANTS
+
+    @staticmethod
+    def _adjust(depths: Dict[str, int], key: str, delta: int) -> int:
+        depth = depths.get(key, 0) + delta
+        if depth:
+            depths[key] = depth
+        else:
+            depths.pop(key, None)
+        return depth
+
+    def _set_depth(self, entry: _Entry, delta: int) -> None:
+        self._adjust(self.depths, entry.tenant, delta)
+        depth = self._adjust(self.label_depths, entry.label, delta)
+        if self.metrics:
+            self.metrics.set_scheduler_depth(entry.label, depth)
+
+    @staticmethod
+    def _forget_idle(queue: _PriorityClass) -> None:
+        # Pruning walks every tracked tenant, so it only runs once the dict
+        # has doubled since the last prune; that keeps pop amortized O(1).
+        if len(queue.last_finish) > queue.prune_at:
+            for tenant, finish in list(queue.last_finish.items()):
+                if finish <= queue.virtual_time:
+                    del queue.last_finish[tenant]
+            queue.prune_at = max(PRUNE_THRESHOLD, 2 * len(queue.last_finish))
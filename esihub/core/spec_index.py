@@ -0,0 +1,110 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+
+class ESIHubOperation:
+    def __init__(
+        self, spec_index: "ESIHubSpecIndex", method: str, path: str, details: Dict
+    ):
+        self.method = method.upper()
+        self.path = path
+        self.operation_id = details["operationId"]
+        self.details = details
+        self.parameters: List[Dict[str, Any]] = [
+            spec_index.resolve(param) for param in details.get("parameters", [])
+        ]
+
+    def parameters_in(self, location: str) -> List[Dict[str, Any]]:
+        return [param for param in self.parameters if param.get("in") == location]
+
+    @property
+    def body_schema(self) -> Optional[Dict[str, Any]]:
+        for param in self.parameters_in("body"):
+            return param.get("schema")
+        return None
+
+    def response_schema(self, status: str = "200") -> Optional[Dict[str, Any]]:
+        return self.details.get("responses", {}).get(status, {}).get("schema")
+
+    def __repr__(self) -> str:
+        return f"ESIHubOperation({self.method} {self.path} {self.operation_id})"
+
+
+class ESIHubSpecIndex:
+    def __init__(self, spec: Dict[str, Any], match_cache_size: int = 4096):
+        self.spec = spec
+        self.operations: Dict[str, ESIHubOperation] = {}
+        self._literal_paths: Dict[str, Dict[str, ESIHubOperation]] = {}
+        self._templates: List[Tuple[re.Pattern, Dict[str, ESIHubOperation]]] = []
+        self._match_cache: LRUCache = LRUCache(maxsize=match_cache_size)
+
+        templates = []
+        for path, methods in spec.get("paths", {}).items():
+            by_method = {}
+            for method, details in methods.items():
+                if "operationId" in details:
+                    operation = ESIHubOperation(self, method, path, details)
+                    self.operations[operation.operation_id] = operation
+                    by_method[operation.method] = operation
+            if "{" in path:
+                templates.append((path.count("{"), path, by_method))
+            else:
+                self._literal_paths[path] = by_method
+
+        # Fewer placeholders first so that e.g. /characters/affiliation/ can
+        # never be shadowed by /characters/{character_id}/.
+        for _, path, by_method in sorted(templates, key=lambda t: t[:2]):
+            self._templates.append((self._compile_template(path), by_method))
+
+    def operation(self, operation_id: str) -> ESIHubOperation:
+        try:
+            return self.operations[operation_id]
+        except KeyError:
+            raise KeyError(f"Unknown operationId: {operation_id}")
+
+    def match(
+        self, method: str, path: str
+    ) -> Optional[Tuple[ESIHubOperation, Dict[str, str]]]:
+        key = (method.upper(), path)
+        if key in self._match_cache:
+            return self._match_cache[key]
+
+        result = None
+        by_method = self._literal_paths.get(path)
+        if by_method and key[0] in by_method:
+            result = (by_method[key[0]], {})
+        else:
+            for pattern, by_method in self._templates:
+                if key[0] not in by_method:
+                    continue
+                found = pattern.match(path)
+                if found:
+                    result = (by_method[key[0]], found.groupdict())
+                    break
+
+        self._match_cache[key] = result
+        return result
+
+    def template_for(self, method: str, path: str) -> str:
+        matched = self.match(method, path)
+        return matched[0].path if matched else path
+
+    def resolve(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        ref = item.get("$ref")
+        if not ref:
+            return item
+        node: Any = self.spec
+        for part in ref.lstrip("#/").split("/"):
+            node = node[part]
+        return self.resolve(node)
+
+    @staticmethod
+    def _compile_template(path: str) -> re.Pattern:
+        parts = re.split(r"\{(\w+)\}", path)
+        pattern = "".join(
+            re.escape(part) if i % 2 == 0 else f"(?P<{part}>[^/]+)"
+            for i, part in enumerate(parts)
+        )
+        return re.compile(f"^{pattern}$")
@@ -0,0 +1,211 @@
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Set
+
+from .config import ESIHubConfig, esi_config
+from .logger import esihub_logger
+from ..models import ESIHubToken
+
+
+class ESIHubTokenStore(ABC):
+    @abstractmethod
+    async def get(self, character_id: int) -> Optional[ESIHubToken]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, token: ESIHubToken) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, character_id: int) -> None:
+        raise NotImplementedError
+
+
+class ESIHubMemoryTokenStore(ESIHubTokenStore):
+    def __init__(self):
+        self.tokens: Dict[int, ESIHubToken] = {}
+
+    async def get(self, character_id: int) -> Optional[ESIHubToken]:
+        return self.tokens.get(character_id)
+
+    async def set(self, token: ESIHubToken) -> None:
+        self.tokens[token.character_id] = token
+
+    async def delete(self, character_id: int) -> None:
+        self.tokens.pop(character_id, None)
+
+
+class ESIHubRedisTokenStore(ESIHubTokenStore):
+    def __init__(self, redis_client: Any, prefix: str = "esihub:token:"):
+        self.redis = redis_client
+        self.prefix = prefix
+
+    async def get(self, character_id: int) -> Optional[ESIHubToken]:
+        data = await self.redis.get(f"{self.prefix}{character_id}")
+        if data:
+            return ESIHubToken.model_validate_json(data)
+        return None
+
+    async def set(self, token: ESIHubToken) -> None:
+        await self.redis.set(
+            f"{self.prefix}{token.character_id}", token.model_dump_json()
+        )
+
+    async def delete(self, character_id: int) -> None:
+        await self.redis.delete(f"{self.prefix}{character_id}")
+
+
+class ESIHubTokenManager:
+    def __init__(
+        self,
+        auth,
+        store: Optional[ESIHubTokenStore] = None,
+        config: ESIHubConfig = esi_config,
+    ):
+        self.auth = auth
+        self.store = store or ESIHubMemoryTokenStore()
+        self.refresh_margin = config.get("TOKEN_REFRESH_MARGIN", 60)
+        self.refresh_jitter = config.get("TOKEN_REFRESH_JITTER", 30)
+        self.background_refresh = config.get("TOKEN_AUTO_REFRESH", True)
+        self.tokens: Dict[int, ESIHubToken] = {}
+        self._refreshing: Dict[int, asyncio.Task] = {}
+        self._forced: Set[int] = set()
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._background: set = set()
+
+    async def add_token(
+        self, character_id: int, token_response: Dict[str, Any]
+    ) -> ESIHubToken:
+        token = self._token_from_response(character_id, token_response)
+        await self._store_token(token)
+        return token
+
+    async def get_access_token(self, character_id: int) -> str:
+        token = self.tokens.get(character_id)
+        if token is None or not self._is_fresh(token):
+            token = await self.store.get(character_id)
+            if token is None:
+                raise KeyError(f"No token registered for character {character_id}")
+            if self._is_fresh(token):
+                self.tokens[character_id] = token
+                self._schedule_refresh(token)
+            else:
+                token = await self.refresh(character_id)
+        return token.access_token
+
+    async def auth_headers(self, character_id: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {await self.get_access_token(character_id)}"}
+
+    async def refresh(self, character_id: int, force: bool = False) -> ESIHubToken:
+        current = self.tokens.get(character_id)
+        while True:
+            task = self._refreshing.get(character_id)
+            if task is None:
+                task = asyncio.create_task(self._refresh(character_id, force))
+                self._refreshing[character_id] = task
+                if force:
+                    self._forced.add(character_id)
+                task.add_done_callback(lambda _: self._refresh_done(character_id))
+                break
+            if not force or character_id in self._forced:
+                break
+            # A plain refresh in flight may settle for the very token a forced
+            # caller is rejecting; only a newer one satisfies it.
+            token = await asyncio.shield(task)
+            if current is None or token.expires_at > current.expires_at:
+                return token
+        return await asyncio.shield(task)
+
+    async def remove(self, character_id: int) -> None:
+        self.tokens.pop(character_id, None)
+        timer = self._timers.pop(character_id, None)
+        if timer:
+            timer.cancel()
+        await self.store.delete(character_id)
+
+    async def close(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        tasks = list(self._background) + list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _refresh(self, character_id: int, force: bool) -> ESIHubToken:
+        current = self.tokens.get(character_id)
+        token = await self.store.get(character_id) or current
+        if token is None:
+            raise KeyError(f"No token registered for character {character_id}")
+        # Another worker sharing the store may already have refreshed it.
+        if self._is_fresh(token) and (
+            not force or current is None or token.expires_at > current.expires_at
+        ):
+            self.tokens[character_id] = token
+            self._schedule_refresh(token)
+            return token
+
+        esihub_logger.debug("Refreshing token", extra={"character_id": character_id})
+        response = await self.auth.refresh_token(token.refresh_token)
+        token = self._token_from_response(
+            character_id, {"refresh_token": token.refresh_token, **response}
+        )
+        await self._store_token(token)
+        return token
+
+    def _refresh_done(self, character_id: int) -> None:
+        self._refreshing.pop(character_id, None)
+        self._forced.discard(character_id)
+
+    async def _store_token(self, token: ESIHubToken) -> None:
+        await self.store.set(token)
+        self.tokens[token.character_id] = token
+        self._schedule_refresh(token)
+
+    def _schedule_refresh(self, token: ESIHubToken) -> None:
+        if not self.background_refresh:
+            return
+        timer = self._timers.pop(token.character_id, None)
+        if timer:
+            timer.cancel()
+        delay = (
+            token.expires_at
+            - self.refresh_margin
+            - random.uniform(0, self.refresh_jitter)
+            - time.time()
+        )
+        loop = asyncio.get_running_loop()
+        self._timers[token.character_id] = loop.call_later(
+            max(0.0, delay), self._background_refresh, token.character_id
+        )
+
+    def _background_refresh(self, character_id: int) -> None:
+        self._timers.pop(character_id, None)
+        task = asyncio.ensure_future(self.refresh(character_id, force=True))
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if task.cancelled():
+            return
+        if task.exception():
+            esihub_logger.error(
+                f"Background token refresh failed: {str(task.exception())}"
+            )
+
+    def _is_fresh(self, token: ESIHubToken) -> bool:
+        return token.expires_at - self.refresh_margin > time.time()
+
+    @staticmethod
+    def _token_from_response(
+        character_id: int, token_response: Dict[str, Any]
+    ) -> ESIHubToken:
+        return ESIHubToken(
+            character_id=character_id,
+            access_token=token_response["access_token"],
+            refresh_token=token_response["refresh_token"],
+            expires_at=time.time() + int(token_response.get("expires_in", 1199)),
+        )
@@ -1,8 +1,15 @@
 class ESIHubError(Exception):
-    def __init__(self, message: str, status_code: int = None, details: dict = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int = None,
+        details: dict = None,
+        headers: dict = None,
+    ):
         self.message = message
         self.status_code = status_code
         self.details = details or {}
+        self.headers = headers or {}
         super().__init__(self.message)
 
 
@@ -24,3 +31,19 @@ class ESIHubClientError(ESIHubError):
 
 class ESIHubValidationError(ESIHubError):
     pass
+
+
+class ESIHubTimeoutError(ESIHubError):
+    pass
+
+
+class ESIHubConnectionError(ESIHubError):
+    pass
+
+
+class ESIHubCircuitOpenError(ESIHubError):
+    pass
+
+
+class ESIHubDeadlineExceededError(ESIHubError):
+    pass
@@ -1,5 +1,9 @@
-from typing import Dict, Any, Optional
+import json
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
 
+from multidict import CIMultiDict, CIMultiDictProxy
 from pydantic import BaseModel, Field
 
 
@@ -11,7 +15,155 @@ class ESIHubRequestParams(BaseModel):
     headers: Optional[Dict[str, str]] = Field(default_factory=dict)
 
 
-class ESIHubResponse(BaseModel):
+class _ESIHubResponseMeta(type(BaseModel)):
+    # Pydantic's metaclass is not an ABCMeta, so this provides the register()
+    # half of one: registered classes pass isinstance checks on the model.
+    _virtual: Dict[type, Tuple[type, ...]] = {}
+
+    def register(cls, subclass: type) -> type:
+        _ESIHubResponseMeta._virtual[cls] = _ESIHubResponseMeta._virtual.get(
+            cls, ()
+        ) + (subclass,)
+        return subclass
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        return super().__instancecheck__(instance) or isinstance(
+            instance, _ESIHubResponseMeta._virtual.get(cls, ())
+        )
+
+
+class ESIHubResponse(BaseModel, metaclass=_ESIHubResponseMeta):
     status: int
     headers: Dict[str, str]
     data: Any
+
+
+_UNSET = object()
+
+
+@ESIHubResponse.register
+class ESIHubSlimResponse:
+    # A compact stand-in for ESIHubResponse: it keeps the raw body and a
+    # reference to the response's headers, and decodes the body on first
+    # access.
+
+    __slots__ = ("status", "body", "headers", "_data", "_loads")
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+        data: Any = _UNSET,
+        loads: Callable[[bytes], Any] = json.loads,
+    ):
+        self.status = status
+        self.body = body
+        if not isinstance(headers, (CIMultiDict, CIMultiDictProxy)):
+            headers = CIMultiDict(headers or {})
+        self.headers = headers
+        self._data = data
+        self._loads = loads
+
+    @property
+    def data(self) -> Any:
+        if self._data is _UNSET:
+            self._data = self._loads(self.body) if self.body else None
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+
+    @property
+    def decoded(self) -> bool:
+        return self._data is not _UNSET
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def expires(self) -> Optional[datetime]:
+        return self._parse_date(self.headers.get("Expires"))
+
+    @property
+    def last_modified(self) -> Optional[datetime]:
+        return self._parse_date(self.headers.get("Last-Modified"))
+
+    @property
+    def pages(self) -> int:
+        return int(self.headers.get("X-Pages") or 1)
+
+    def detached(self) -> "ESIHubSlimResponse":
+        # Shares the body but drops any decoded data, so that long-lived
+        # copies (cache entries) only pay for the raw bytes. Every copy
+        # decodes its own data, which keeps callers from mutating each
+        # other's results at the cost of a parse per cache hit.
+        copy = ESIHubSlimResponse.__new__(ESIHubSlimResponse)
+        copy.status = self.status
+        copy.body = self.body
+        copy.headers = self.headers
+        copy._data = _UNSET if self.body else self._data
+        copy._loads = self._loads
+        return copy
+
+    def model_copy(
+        self, update: Optional[Dict[str, Any]] = None
+    ) -> "ESIHubSlimResponse":
+        copy = self.detached()
+        copy._data = self._data
+        for name, value in (update or {}).items():
+            setattr(copy, name, value)
+        return copy
+
+    def model_dump(self) -> Dict[str, Any]:
+        return {"status": self.status, "headers": dict(self.headers), "data": self.data}
+
+    def model_dump_json(self) -> str:
+        return json.dumps(self.model_dump())
+
+    @classmethod
+    def model_validate_json(cls, raw: Union[str, bytes]) -> "ESIHubSlimResponse":
+        payload = json.loads(raw)
+        return cls(payload["status"], headers=payload["headers"], data=payload["data"])
+
+    def to_bytes(self) -> bytes:
+        meta = json.dumps([self.status, list(self.headers.items())]).encode()
+        return meta + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "ESIHubSlimResponse":
+        meta, _, body = raw.partition(b"\n")
+        status, headers = json.loads(meta)
+        if not all(isinstance(item, list) and len(item) == 2 for item in headers):
+            raise ValueError("unsupported cache entry format")
+        return cls(status, body, CIMultiDict(headers))
+
+    def to_response(self) -> ESIHubResponse:
+        return ESIHubResponse(
+            status=self.status, headers=dict(self.headers), data=self.data
+        )
+
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[datetime]:
+        return parsedate_to_datetime(value) if value else None
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ESIHubSlimResponse, ESIHubResponse)):
+            return (self.status, dict(self.headers), self.data) == (
+                other.status,
+                dict(other.headers),
+                other.data,
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ESIHubSlimResponse(status={self.status}, bytes={len(self.body)})"
+
+
+class ESIHubToken(BaseModel):
+    character_id: int
+    access_token: str
+    refresh_token: str
+    expires_at: float
@@ -38,7 +38,7 @@ setup(
     python_requires=">=3.11",
     install_requires=[
         "aiohttp",
-        "pydantic",
+        "pydantic>=2.11",
         "prometheus_client",
         "cryptography",
     ],
@@ -50,6 +50,9 @@ setup(
             "isort>=5.10.0",
             "mypy>=1.0.0",
         ],
+        "columnar": ["numpy"],
+        "parquet": ["pyarrow"],
+        "brotli": ["brotli"],
     },
     include_package_data=True,
     package_data={
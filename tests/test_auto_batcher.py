@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from esihub import ESIHubClient, ESIHubClientError, ESIHubResponse
+from esihub.core.config import ESIHubConfig
+
+
+@pytest.fixture
+def esihub_client():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True})
+    return ESIHubClient(config)
+
+
+def fake_names(calls, unknown=()):
+    async def request(method, path, json):
+        calls.append(list(json))
+        if any(i in unknown for i in json):
+            raise ESIHubClientError("Client error: Not found", 404, {})
+        data = [{"id": i, "name": f"name-{i}", "category": "character"} for i in json]
+        return ESIHubResponse(status=200, headers={}, data=data)
+
+    return request
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_batched_deduped_and_cached(esihub_client):
+    calls = []
+    esihub_client.request = fake_names(calls)
+    batcher = esihub_client.auto_batcher("post_universe_names")
+
+    results = await asyncio.gather(*(batcher.load(i % 5000) for i in range(10000)))
+
+    assert [len(c) for c in calls] == [1000] * 5
+    assert results[4999]["name"] == "name-4999"
+    assert results[9999] is results[4999]
+
+    assert (await batcher.load(42))["id"] == 42
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_cancelled_loader_does_not_cancel_others(esihub_client):
+    calls = []
+    esihub_client.request = fake_names(calls)
+    batcher = esihub_client.auto_batcher("post_universe_names")
+
+    first = asyncio.ensure_future(batcher.load(7))
+    second = asyncio.ensure_future(batcher.load(7))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)["id"] == 7
+    assert first.cancelled()
+    assert len(calls) == 1
+    assert batcher._futures == {}
+
+
+@pytest.mark.asyncio
+async def test_unknown_id_does_not_fail_others(esihub_client):
+    calls = []
+    esihub_client.request = fake_names(calls, unknown={3})
+    batcher = esihub_client.auto_batcher("post_universe_names")
+
+    results = await batcher.load_many(range(8))
+
+    assert results[3] is None
+    assert [r["id"] for r in results if r] == [0, 1, 2, 4, 5, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_affiliation_result_key(esihub_client):
+    async def request(method, path, json):
+        assert path == "/characters/affiliation/"
+        data = [{"character_id": i, "corporation_id": 98000001} for i in json]
+        return ESIHubResponse(status=200, headers={}, data=data)
+
+    esihub_client.request = request
+    batcher = esihub_client.auto_batcher("post_characters_affiliation")
+
+    assert (await batcher.load(2112625428))["corporation_id"] == 98000001
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from esihub import ESIHubClient
+from esihub.core.bulk_executor import ESIHubBulkExecutor
+from esihub.core.config import ESIHubConfig
+
+
+async def numbers(count):
+    for i in range(count):
+        yield i
+
+
+@pytest.mark.asyncio
+async def test_window_bounds_in_flight_and_keeps_failures():
+    in_flight = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (item % 3))
+        in_flight -= 1
+        if item == 5:
+            raise ValueError("boom")
+        return item * 2
+
+    results = [r async for r in ESIHubBulkExecutor(window=4).stream(work, numbers(20))]
+
+    assert peak <= 4
+    assert len(results) == 20
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1 and failed[0].index == 5
+    assert sorted(r.result for r in results if r.ok) == [
+        i * 2 for i in range(20) if i != 5
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_item_does_not_block_window():
+    async def work(item):
+        await asyncio.sleep(0.2 if item == 0 else 0)
+        return item
+
+    order = [
+        r.index async for r in ESIHubBulkExecutor(window=2).stream(work, range(10))
+    ]
+
+    assert order[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_partial_failure():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True})
+    client = ESIHubClient(config)
+
+    async def resolve(batch):
+        if 3 in batch:
+            raise ValueError("bad batch")
+        return [i * 10 for i in batch]
+
+    results = await client.bulk_operation(
+        resolve, list(range(6)), batch_size=2, return_exceptions=True
+    )
+
+    assert results[:2] == [0, 10]
+    assert all(isinstance(r, ValueError) for r in results[2:4])
+    assert results[4:] == [40, 50]
+    with pytest.raises(ValueError):
+        await client.bulk_operation(resolve, list(range(6)), batch_size=2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_stops_on_first_error():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True})
+    client = ESIHubClient(config)
+    started, cancelled = [], []
+
+    async def write(batch):
+        started.append(batch[0])
+        if batch[0] == 0:
+            raise ValueError("bad batch")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(batch[0])
+            raise
+        return batch
+
+    with pytest.raises(ValueError):
+        await client.bulk_operation(write, list(range(10)), batch_size=1, window=2)
+
+    assert started == [0, 1]
+    assert cancelled == [1]
@@ -0,0 +1,198 @@
+import asyncio
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import ESIHubClient, ESIHubSlimResponse
+from esihub.core.cache import ESIHubCache
+from esihub.core.config import ESIHubConfig
+
+
+def make_cache(server, **options):
+    config = ESIHubConfig()
+    config.update({"CACHE_FILL_POLL_INTERVAL": 0.01, **options})
+    return ESIHubCache(config, fakeredis.aioredis.FakeRedis(server=server))
+
+
+@pytest.mark.asyncio
+async def test_fill_lock_lets_one_worker_fetch():
+    server = fakeredis.FakeServer()
+    first, second = make_cache(server), make_cache(server)
+    response = ESIHubSlimResponse(200, b'{"players": 1}', {})
+
+    async def wait_for_fill():
+        async with second.fill("GET", "/status/", {}) as filled:
+            return filled
+
+    async with first.fill("GET", "/status/", {}) as filled:
+        assert filled is None
+        waiter = asyncio.create_task(wait_for_fill())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await first.set("GET", "/status/", {}, response, {})
+
+    assert (await waiter).data == {"players": 1}
+    assert await first.redis.keys(f"{ESIHubCache.FILL_LOCK_PREFIX}*") == []
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_taken_over():
+    server = fakeredis.FakeServer()
+    first = make_cache(server, CACHE_FILL_LEASE=0.1)
+    second = make_cache(server, CACHE_FILL_LEASE=0.1)
+
+    # The first worker takes the lease and dies without releasing it.
+    holder = first.fill("GET", "/status/", {})
+    assert await holder.__aenter__() is None
+
+    async with second.fill("GET", "/status/", {}) as filled:
+        assert filled is None
+        lock_key = f"{ESIHubCache.FILL_LOCK_PREFIX}GET:/status/:[]"
+        owner = await second.redis.get(lock_key)
+
+    # The stale holder must not release the lease the second worker took.
+    await first.redis.set(lock_key, owner)
+    await holder.__aexit__(None, None, None)
+    assert await first.redis.get(lock_key) == owner
+
+
+@pytest.fixture
+async def esihub_server():
+    state = {"hits": 0}
+
+    async def status(request):
+        state["hits"] += 1
+        await asyncio.sleep(0.1)
+        return web.json_response({"players": state["hits"]})
+
+    app = web.Application()
+    app.router.add_get("/latest/status/", status)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_clients_sharing_redis_fetch_once(esihub_server):
+    redis_server = fakeredis.FakeServer()
+    clients = []
+    for _ in range(4):
+        config = ESIHubConfig()
+        config.update(
+            {
+                "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+                "USE_HTTPS": False,
+                "CACHE_FILL_POLL_INTERVAL": 0.01,
+            }
+        )
+        redis_client = fakeredis.aioredis.FakeRedis(server=redis_server)
+        client = ESIHubClient(config, cache=ESIHubCache(config, redis_client))
+        await client.initialize()
+        clients.append(client)
+    try:
+        responses = await asyncio.gather(
+            *(client.request("GET", "/status/") for client in clients)
+        )
+    finally:
+        for client in clients:
+            await client.close()
+
+    assert esihub_server.state["hits"] == 1
+    assert all(response.data == {"players": 1} for response in responses)
+    # Injected clients belong to the caller and stay open.
+    assert await redis_client.ping()
+
+
+@pytest.mark.asyncio
+async def test_fill_waiters_do_not_hold_a_slot(esihub_server):
+    redis_server = fakeredis.FakeServer()
+    clients = []
+    for _ in range(2):
+        config = ESIHubConfig()
+        config.update(
+            {
+                "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+                "USE_HTTPS": False,
+                "CACHE_FILL_POLL_INTERVAL": 0.01,
+            }
+        )
+        redis_client = fakeredis.aioredis.FakeRedis(server=redis_server)
+        client = ESIHubClient(config, cache=ESIHubCache(config, redis_client))
+        await client.initialize()
+        clients.append(client)
+    fetcher, waiter = clients
+    try:
+        fetching = asyncio.create_task(fetcher.request("GET", "/status/"))
+        await asyncio.sleep(0.02)
+        waiting = asyncio.create_task(waiter.request("GET", "/status/"))
+        await asyncio.sleep(0.03)
+        assert fetcher.semaphore.in_flight == 1
+        assert waiter.semaphore.in_flight == 0
+        responses = await asyncio.gather(fetching, waiting)
+    finally:
+        for client in clients:
+            await client.close()
+
+    assert esihub_server.state["hits"] == 1
+    assert [response.data for response in responses] == [{"players": 1}] * 2
+
+
+async def wait_until(condition, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_coherence_channel_keeps_memory_tiers_in_sync():
+    server = fakeredis.FakeServer()
+    first = make_cache(server, CACHE_COHERENCE=True)
+    second = make_cache(server, CACHE_COHERENCE=True)
+    await first.initialize()
+    await second.initialize()
+    try:
+        await first.set(
+            "GET", "/status/", {}, ESIHubSlimResponse(200, b'{"players": 1}', {}), {}
+        )
+        assert (await second.get("GET", "/status/", {})).data == {"players": 1}
+
+        await first.set(
+            "GET", "/status/", {}, ESIHubSlimResponse(200, b'{"players": 2}', {}), {}
+        )
+        await wait_until(lambda: not second.memory_cache)
+        assert (await second.get("GET", "/status/", {})).data == {"players": 2}
+        assert first.memory_cache
+
+        await first.invalidate("/status/")
+        await wait_until(lambda: not second.memory_cache)
+        assert second.get_stale("GET", "/status/", {}) is None
+    finally:
+        await first.close()
+        await second.close()
+
+
+@pytest.mark.asyncio
+async def test_old_format_entries_are_misses():
+    server = fakeredis.FakeServer()
+    cache = make_cache(server)
+    await cache.initialize()
+    try:
+        key = cache._generate_cache_key("GET", "/status/", {})
+        await cache.redis.set(
+            key, b'{"status": 200, "headers": {}, "data": {"players": 1}}'
+        )
+        assert await cache.get("GET", "/status/", {}) is None
+
+        await cache.set(
+            "GET", "/status/", {}, ESIHubSlimResponse(200, b'{"players": 2}', {}), {}
+        )
+        cache.memory_cache.clear()
+        assert (await cache.get("GET", "/status/", {})).data == {"players": 2}
+    finally:
+        await cache.close()
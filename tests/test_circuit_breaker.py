@@ -0,0 +1,142 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import (
+    ESIHubCircuitOpenError,
+    ESIHubClient,
+    ESIHubConnectionError,
+    ESIHubError,
+    ESIHubServerError,
+    ESIHubValidationError,
+)
+from esihub.core.circuit_breaker import ESIHubCircuitBreaker, ESIHubCircuitBreakers
+from esihub.core.config import ESIHubConfig
+
+
+def test_breaker_state_machine():
+    now = [0.0]
+    breaker = ESIHubCircuitBreaker(
+        "/route/", failure_threshold=2, recovery_timeout=10, clock=lambda: now[0]
+    )
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.blocked()
+    assert not breaker.allow()
+
+    now[0] = 10
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert breaker.blocked()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_local_errors_do_not_open_the_breaker():
+    config = ESIHubConfig()
+    config.update({"CIRCUIT_FAILURE_THRESHOLD": 2})
+    breakers = ESIHubCircuitBreakers(config)
+    breaker = breakers.get("/route/")
+
+    for error in (
+        ESIHubError("Failed to decompress br response: bad data"),
+        ESIHubValidationError("Response validation failed"),
+        ValueError("Expecting value"),
+    ):
+        for _ in range(2):
+            breakers.record_error(breaker, error)
+    assert breaker.state == "closed"
+
+    for _ in range(2):
+        breakers.record_error(breaker, ESIHubConnectionError("Connection reset"))
+    assert breaker.state == "open"
+
+
+@pytest.fixture
+async def esihub_server():
+    state = {"failing": False, "hits": 0}
+
+    async def types(request):
+        state["hits"] += 1
+        if state["failing"]:
+            return web.json_response({"error": "Bad gateway"}, status=502)
+        return web.json_response({"type_id": int(request.match_info["type_id"])})
+
+    app = web.Application()
+    app.router.add_get("/latest/universe/types/{type_id}/", types)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def esihub_client(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+            "ESI_RETRY_ATTEMPTS": 0,
+            "CIRCUIT_FAILURE_THRESHOLD": 2,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_or_serves_stale(esihub_client, esihub_server):
+    await esihub_client.request("GET", "/universe/types/1/")
+    esihub_client.cache.memory_cache.clear()
+    esihub_server.state["failing"] = True
+
+    for _ in range(2):
+        with pytest.raises(ESIHubServerError):
+            await esihub_client.request("GET", "/universe/types/2/")
+    hits = esihub_server.state["hits"]
+
+    stale = await esihub_client.request("GET", "/universe/types/1/")
+    assert stale.data == {"type_id": 1}
+    with pytest.raises(ESIHubCircuitOpenError):
+        await esihub_client.request("GET", "/universe/types/3/")
+
+    assert esihub_server.state["hits"] == hits
+    assert esihub_client.semaphore.in_flight == 0
+    breaker = esihub_client.circuit_breakers.breakers["/universe/types/{type_id}/"]
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_queueing(esihub_client, esihub_server):
+    await esihub_client.request("GET", "/universe/types/1/")
+    esihub_client.cache.memory_cache.clear()
+    esihub_server.state["failing"] = True
+    for _ in range(2):
+        with pytest.raises(ESIHubServerError):
+            await esihub_client.request("GET", "/universe/types/2/")
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("an open circuit must not queue")
+
+    esihub_client.semaphore.slot = unexpected
+    esihub_client.rate_limiter.acquire = unexpected
+
+    stale = await esihub_client.request("GET", "/universe/types/1/")
+    assert stale.data == {"type_id": 1}
+    with pytest.raises(ESIHubCircuitOpenError):
+        await esihub_client.request("GET", "/universe/types/3/")
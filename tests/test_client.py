@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from esihub import ESIHubClient, ESIHubResponse
+from esihub import ESIHubClient, ESIHubResponse, ESIHubSlimResponse
 from esihub.core.config import ESIHubConfig
 
 
@@ -51,6 +52,7 @@ async def test_request_success(esihub_client):
         assert response.status == 200
         assert response.data == {"data": "test"}
 
+
 @pytest.mark.asyncio
 async def test_batch_request(esihub_client):
     with patch.object(esihub_client, "_make_request") as mock_make_request:
@@ -89,3 +91,41 @@ async def test_paginated_request(esihub_client):
 
         assert len(pages) == 3
         assert pages == [{"page": 1}, {"page": 2}, {"page": 3}]
+
+
+@pytest.mark.asyncio
+async def test_batch_request_stream(esihub_client):
+    pulled = 0
+
+    def requests():
+        nonlocal pulled
+        for i in range(200):
+            pulled += 1
+            yield {"method": "GET", "path": f"/test{i}/", "data": i}
+
+    seen = {}
+    async for index, response in esihub_client.batch_request_stream(
+        requests(), concurrency=5
+    ):
+        seen[index] = response.data
+        assert pulled <= len(seen) + 5
+
+    assert len(seen) == 200
+    assert seen[42] == {"data": 42}
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_semaphore_and_limiter(esihub_client):
+    esihub_client.config.set("DRY_RUN", False)
+    response = ESIHubSlimResponse(200, b'{"players": 1}', {})
+    await esihub_client.cache.set("GET", "/status/", {}, response, {})
+    for _ in range(10):
+        await esihub_client.semaphore.acquire()
+
+    with patch.object(esihub_client.rate_limiter, "acquire") as mock_acquire:
+        cached = await asyncio.wait_for(
+            esihub_client.request("GET", "/status/"), timeout=1
+        )
+
+    assert cached.data == {"players": 1}
+    mock_acquire.assert_not_called()
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from esihub import ESIHubClient, ESIHubResponse
+from esihub.core import columnar
+from esihub.core.config import ESIHubConfig
+from esihub.core.spec_index import ESIHubSpecIndex
+from esihub.utils import load_swagger_spec
+
+
+def make_orders(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "order_id": 6000000000 + i,
+            "type_id": rng.choice([34, 35, 36]),
+            "location_id": 60003760,
+            "system_id": 30000142,
+            "volume_total": 1000,
+            "volume_remain": rng.randint(1, 1000),
+            "min_volume": 1,
+            "price": round(rng.uniform(1, 10), 2),
+            "is_buy_order": rng.random() < 0.5,
+            "duration": 90,
+            "issued": "2024-07-01T12:00:00Z",
+            "range": rng.choice(["station", "region", "5"]),
+        }
+        for i in range(count)
+    ]
+
+
+def expected_aggregates(orders):
+    best, depth = {}, {}
+    for order in orders:
+        bid, ask = best.get(order["type_id"], (None, None))
+        bids, asks = depth.get(order["type_id"], (0, 0))
+        if order["is_buy_order"]:
+            bid = order["price"] if bid is None else max(bid, order["price"])
+            bids += order["volume_remain"]
+        else:
+            ask = order["price"] if ask is None else min(ask, order["price"])
+            asks += order["volume_remain"]
+        best[order["type_id"]] = (bid, ask)
+        depth[order["type_id"]] = (bids, asks)
+    return best, depth
+
+
+def orders_item_schema():
+    operation = ESIHubSpecIndex(load_swagger_spec()).operation(
+        "get_markets_region_id_orders"
+    )
+    return operation.response_schema()["items"]
+
+
+@pytest.fixture
+def esihub_client():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True})
+    return ESIHubClient(config)
+
+
+@pytest.mark.asyncio
+async def test_columnar_request_concatenates_pages(esihub_client):
+    orders = make_orders(2500)
+    pages = [orders[0:1000], orders[1000:2000], orders[2000:]]
+
+    async def request(method, path, **kwargs):
+        page = kwargs["params"]["page"]
+        return ESIHubResponse(
+            status=200, headers={"X-Pages": "3"}, data=pages[page - 1]
+        )
+
+    esihub_client.request = request
+    batch = await esihub_client.columnar_request("GET", "/markets/10000002/orders/")
+
+    assert len(batch) == 2500
+    assert batch.columns["order_id"].typecode == "q"
+    assert batch.columns["range"].typecode == "B"
+    assert batch.row(1234) == orders[1234]
+    if columnar.np is not None:
+        assert batch.to_numpy()["price"][1234] == orders[1234]["price"]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_market_aggregates(monkeypatch, use_numpy):
+    if use_numpy and columnar.np is None:
+        pytest.skip("numpy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(columnar, "np", None)
+    orders = make_orders(500, seed=1)
+    batch = columnar.ESIHubColumnarBatch.from_item_schema(orders_item_schema())
+    batch.extend(orders)
+
+    best, depth = expected_aggregates(orders)
+    assert columnar.best_bid_ask(batch) == best
+    assert columnar.depth(batch) == depth
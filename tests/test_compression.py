@@ -0,0 +1,86 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import ESIHubClient
+from esihub.core.config import ESIHubConfig
+from esihub.core.decoder import ESIHubPayloadDecoder
+from esihub.core.metrics import ESIHubMetrics
+
+brotli = pytest.importorskip("brotli")
+
+ORDERS = [{"order_id": i, "price": 9.9, "type_id": 34} for i in range(2000)]
+
+
+@pytest.mark.asyncio
+async def test_decompress_offloads_large_bodies():
+    config = ESIHubConfig()
+    config.update({"DECOMPRESS_OFFLOAD_THRESHOLD_KB": 1})
+    metrics = ESIHubMetrics()
+    decoder = ESIHubPayloadDecoder(config, metrics)
+    raw = json.dumps(ORDERS).encode()
+    try:
+        assert await decoder.decompress(gzip.compress(raw), "gzip") == raw
+        assert await decoder.decompress(brotli.compress(raw), "br") == raw
+        assert await decoder.decompress(zlib.compress(b"[]"), "deflate") == b"[]"
+        assert await decoder.decompress(raw, "identity") == raw
+    finally:
+        decoder.close()
+
+    assert metrics.offloaded_decodes._value.get() == 2
+
+
+@pytest.fixture
+async def esihub_server():
+    raw = json.dumps(ORDERS).encode()
+    state = {"accept_encoding": None}
+
+    async def orders(request):
+        accepted = request.headers.get("Accept-Encoding", "")
+        state["accept_encoding"] = accepted
+        if "br" in accepted:
+            return web.Response(
+                body=brotli.compress(raw),
+                headers={"Content-Encoding": "br"},
+                content_type="application/json",
+            )
+        return web.Response(body=raw, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/latest/markets/{region_id}/orders/", orders)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_client_negotiates_compression_and_records_bytes(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+            "DECOMPRESS_OFFLOAD_THRESHOLD_KB": 1,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    try:
+        response = await client.request("GET", "/markets/10000002/orders/")
+    finally:
+        await client.close()
+
+    assert "br" in esihub_server.state["accept_encoding"]
+    assert response.data == ORDERS
+    transfer = client.metrics.transfer_bytes
+    route = "/markets/{region_id}/orders/"
+    wire = transfer.labels(route=route, kind="wire")._value.get()
+    decoded = transfer.labels(route=route, kind="decoded")._value.get()
+    assert decoded == len(json.dumps(ORDERS))
+    assert wire * 5 < decoded
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from esihub import ESIHubClientError, ESIHubServerError, ESIHubTimeoutError
+from esihub.core.concurrency import ESIHubAdaptiveLimiter
+from esihub.core.config import ESIHubConfig
+from esihub.core.metrics import ESIHubMetrics
+
+
+@pytest.mark.asyncio
+async def test_limiter_behaves_like_a_semaphore():
+    limiter = ESIHubAdaptiveLimiter(2)
+    await limiter.acquire()
+    await limiter.acquire()
+    assert limiter.locked() and limiter._value == 0
+
+    waiter = asyncio.create_task(limiter.acquire())
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    limiter.release()
+    assert await waiter
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_under_load_and_backs_off_on_overload():
+    metrics = ESIHubMetrics()
+    limiter = ESIHubAdaptiveLimiter(
+        10, min_limit=2, max_limit=20, cooldown=0, metrics=metrics
+    )
+    limiter.in_flight = 10
+    for _ in range(50):
+        limiter.observe("/status/", 0.1)
+    assert limiter.limit > 10
+    assert metrics.concurrency_limit._value.get() == limiter.limit
+
+    grown = limiter.limit
+    limiter.observe("/status/", 5.0, ESIHubTimeoutError("Timed out"))
+    assert limiter.limit == int(grown * 0.75)
+
+    limiter.observe("/status/", 0.1, ESIHubClientError("Not found", 404))
+    limiter.observe("/status/", 2.0)
+    limiter.observe("/status/", 0.1, error_limit_remain=5)
+    for _ in range(20):
+        limiter.observe("/status/", 0.1, ESIHubServerError("Bad gateway", 502))
+    assert limiter.limit == 2
+
+
+def test_fixed_limit_when_not_adaptive():
+    limiter = ESIHubAdaptiveLimiter(10, adaptive=False)
+    limiter.in_flight = 10
+
+    limiter.observe("/status/", 0.1)
+    limiter.observe("/status/", 5.0, ESIHubTimeoutError("Timed out"))
+
+    assert limiter.limit == 10
+
+
+def test_max_limit_is_capped_by_the_connection_pool():
+    config = ESIHubConfig()
+    config.update({"MAX_CONCURRENT_REQUESTS": 100, "MAX_CONNECTIONS": 100})
+    assert ESIHubAdaptiveLimiter.from_config(config).max_limit == 100
+
+    config.update({"MAX_CONNECTIONS": 0})
+    assert ESIHubAdaptiveLimiter.from_config(config).max_limit == 400
+
+    config.update({"MAX_CONNECTIONS": 100, "CONCURRENCY_MAX_LIMIT": 250})
+    assert ESIHubAdaptiveLimiter.from_config(config).max_limit == 250
@@ -0,0 +1,56 @@
+import pytest
+
+from esihub import ESIHubClient
+from esihub.core.config import ESIHubConfig
+from esihub.core.connection_pool import ESIConnectionPool
+
+
+@pytest.fixture
+def esihub_config():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True, "MAX_CONNECTIONS_PER_HOST": 20})
+    return config
+
+
+@pytest.mark.asyncio
+async def test_clients_share_transport(esihub_config):
+    first = ESIHubClient(esihub_config)
+    second = ESIHubClient(esihub_config)
+    await first.initialize()
+    await second.initialize()
+
+    assert first.session is second.session
+    assert first.connection_pool is second.connection_pool
+    assert first.connection_pool.ref_count == 2
+    assert first.session.connector.limit_per_host == 20
+
+    session = first.session
+    await first.close()
+    assert not session.closed
+    await second.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_private_transport(esihub_config):
+    esihub_config.set("SHARED_TRANSPORT", False)
+    first = ESIHubClient(esihub_config)
+    second = ESIHubClient(esihub_config)
+    await first.initialize()
+    await second.initialize()
+
+    assert first.session is not second.session
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats():
+    pool = ESIConnectionPool(pool_size=10)
+    session = await pool.acquire()
+    assert session is await pool.get()
+    assert pool.stats()["reuse_ratio"] == 0.0
+
+    await pool.release(session)
+    assert session.closed
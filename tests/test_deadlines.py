@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import ESIHubClient, ESIHubDeadlineExceededError, ESIHubServerError
+from esihub.core.concurrency import ESIHubAdaptiveLimiter
+from esihub.core.config import ESIHubConfig
+from esihub.core.metrics import ESIHubMetrics
+from esihub.core.rate_limiter import ESIHubRateLimiter
+from esihub.core.retry_policy import ESIHubRetryPolicy
+
+
+@pytest.mark.asyncio
+async def test_expired_waiter_leaves_the_queue():
+    limiter = ESIHubAdaptiveLimiter(1)
+    await limiter.acquire()
+    deadline = asyncio.get_running_loop().time() + 0.05
+
+    with pytest.raises(ESIHubDeadlineExceededError) as exc_info:
+        await limiter.acquire(deadline=deadline)
+
+    assert exc_info.value.details == {"stage": "queue"}
+    assert len(limiter.queue) == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_fails_fast_without_spending_a_token():
+    rate_limiter = ESIHubRateLimiter(ESIHubConfig())
+    rate_limiter.global_remaining = 0
+    rate_limiter.global_reset = time.time() + 10
+    deadline = asyncio.get_running_loop().time() + 1
+
+    started = time.monotonic()
+    with pytest.raises(ESIHubDeadlineExceededError) as exc_info:
+        await rate_limiter.acquire("/status/", deadline)
+
+    assert time.monotonic() - started < 0.5
+    assert exc_info.value.details == {"stage": "rate_limit"}
+    assert rate_limiter.global_remaining == 0
+    assert not rate_limiter.lock.locked()
+
+
+@pytest.mark.asyncio
+async def test_retry_that_cannot_meet_the_deadline_is_not_sent():
+    config = ESIHubConfig()
+    config.update({"RETRY_BASE_DELAY": 1.0})
+    metrics = ESIHubMetrics()
+    policy = ESIHubRetryPolicy(config, metrics)
+    calls = []
+
+    async def func():
+        calls.append(1)
+        raise ESIHubServerError("Unavailable", status_code=503)
+
+    deadline = asyncio.get_running_loop().time() + 0.5
+    with pytest.raises(ESIHubServerError):
+        await policy.call("GET", func, deadline=deadline)
+
+    assert len(calls) == 1
+    assert metrics.deadline_shed.labels(stage="retry")._value.get() == 1
+
+
+@pytest.fixture
+async def esihub_server():
+    state = {"hits": 0}
+
+    async def status(request):
+        state["hits"] += 1
+        await asyncio.sleep(2)
+        return web.json_response({"players": 1})
+
+    app = web.Application()
+    app.router.add_get("/latest/status/", status)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_request_deadline_covers_the_network(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+            "CIRCUIT_FAILURE_THRESHOLD": 1,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    try:
+        started = time.monotonic()
+        with pytest.raises(ESIHubDeadlineExceededError) as exc_info:
+            await client.request("GET", "/status/", deadline=0.2)
+        elapsed = time.monotonic() - started
+        breaker = client.circuit_breakers.get("/status/")
+    finally:
+        await client.close()
+
+    assert elapsed < 1
+    assert exc_info.value.details == {"stage": "network"}
+    assert esihub_server.state["hits"] == 1
+    assert breaker.state == "closed"
+    shed = client.metrics.deadline_shed.labels(stage="network")._value.get()
+    assert shed >= 1
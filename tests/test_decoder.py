@@ -0,0 +1,70 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from esihub.core.config import ESIHubConfig
+from esihub.core.decoder import ESIHubLoopLagMonitor, ESIHubPayloadDecoder
+from esihub.core.metrics import ESIHubMetrics
+
+
+def make_decoder(**options):
+    config = ESIHubConfig()
+    config.update({"DECODE_OFFLOAD_THRESHOLD_KB": 1, **options})
+    return ESIHubPayloadDecoder(config, ESIHubMetrics())
+
+
+@pytest.mark.asyncio
+async def test_small_payloads_decode_inline():
+    decoder = make_decoder()
+    threads = []
+
+    def loads(body):
+        threads.append(threading.current_thread())
+        return json.loads(body)
+
+    decoder.loads = loads
+
+    assert await decoder.decode(b'{"a": 1}') == {"a": 1}
+    assert threads == [threading.main_thread()]
+    assert decoder.executor is None
+    assert await decoder.decode(b"") is None
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_decode_in_worker():
+    decoder = make_decoder()
+    items = [{"order_id": i} for i in range(500)]
+    threads = []
+
+    def validate(data):
+        threads.append(threading.current_thread())
+        return len(data)
+
+    try:
+        result = await decoder.decode(json.dumps(items).encode(), validate)
+    finally:
+        decoder.close()
+
+    assert result == 500
+    assert threads[0] is not threading.main_thread()
+
+
+def test_unknown_decoder_falls_back_to_json():
+    decoder = make_decoder(JSON_DECODER="esihub_missing_json_module")
+
+    assert decoder.loads is json.loads
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_records_blocking():
+    monitor = ESIHubLoopLagMonitor(ESIHubMetrics(), interval=0.01)
+    await monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.05)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert monitor.max_lag >= 0.03
@@ -0,0 +1,142 @@
+import gzip
+import json
+
+import pytest
+
+from esihub import ESIHubClient, ESIHubResponse, ESIHubServerError
+from esihub.core import exporter
+from esihub.core.config import ESIHubConfig
+from esihub.core.exporter import ESIHubNDJSONSink, ESIHubParquetSink
+
+PAGES = {
+    page: [{"order_id": page * 1000 + i, "price": float(i)} for i in range(50)]
+    for page in range(1, 7)
+}
+
+
+@pytest.fixture
+def esihub_client():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True})
+    client = ESIHubClient(config)
+    client.failing_pages = set()
+
+    async def request(method, path, **kwargs):
+        page = kwargs["params"]["page"]
+        if page in client.failing_pages:
+            raise ESIHubServerError("Server error: Bad gateway", 502, {})
+        return ESIHubResponse(status=200, headers={"X-Pages": "6"}, data=PAGES[page])
+
+    client.request = request
+    return client
+
+
+def read_ndjson(path):
+    with gzip.open(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(esihub_client, tmp_path):
+    path = tmp_path / "orders.ndjson.gz"
+
+    stats = await esihub_client.export(
+        "GET", "/markets/10000002/orders/", ESIHubNDJSONSink(str(path))
+    )
+
+    assert stats == {"pages": 6, "pages_written": 6, "items_written": 300}
+    rows = read_ndjson(path)
+    assert sorted(r["order_id"] for r in rows) == sorted(
+        item["order_id"] for page in PAGES.values() for item in page
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_resumes_after_failure(esihub_client, tmp_path):
+    path = tmp_path / "orders.ndjson.gz"
+    checkpoint = tmp_path / "orders.checkpoint"
+    esihub_client.failing_pages = {4}
+
+    with pytest.raises(ESIHubServerError):
+        await esihub_client.export(
+            "GET",
+            "/markets/10000002/orders/",
+            ESIHubNDJSONSink(str(path)),
+            checkpoint_path=str(checkpoint),
+            concurrency=1,
+        )
+    assert json.loads(checkpoint.read_text())["done"] == [1, 2, 3]
+    # Simulate a torn write after the last checkpoint.
+    with open(path, "ab") as f:
+        f.write(b"\x1f\x8b partial")
+
+    esihub_client.failing_pages = set()
+    stats = await esihub_client.export(
+        "GET",
+        "/markets/10000002/orders/",
+        ESIHubNDJSONSink(str(path)),
+        checkpoint_path=str(checkpoint),
+    )
+
+    assert stats["pages_written"] == 3
+    assert not checkpoint.exists()
+    assert len(read_ndjson(path)) == 300
+
+
+@pytest.mark.asyncio
+async def test_export_restarts_when_output_is_gone(esihub_client, tmp_path):
+    path = tmp_path / "orders.ndjson.gz"
+    checkpoint = tmp_path / "orders.checkpoint"
+    esihub_client.failing_pages = {4}
+
+    with pytest.raises(ESIHubServerError):
+        await esihub_client.export(
+            "GET",
+            "/markets/10000002/orders/",
+            ESIHubNDJSONSink(str(path)),
+            checkpoint_path=str(checkpoint),
+            concurrency=1,
+        )
+    path.unlink()
+
+    esihub_client.failing_pages = set()
+    stats = await esihub_client.export(
+        "GET",
+        "/markets/10000002/orders/",
+        ESIHubNDJSONSink(str(path)),
+        checkpoint_path=str(checkpoint),
+    )
+
+    assert stats["pages_written"] == 6
+    assert len(read_ndjson(path)) == 300
+
+
+@pytest.mark.asyncio
+async def test_export_handles_empty_pages(esihub_client, tmp_path):
+    path = tmp_path / "orders.ndjson.gz"
+
+    async def request(method, path, **kwargs):
+        page = kwargs["params"]["page"]
+        data = {1: PAGES[1], 2: [], 3: None}[page]
+        return ESIHubResponse(status=200, headers={"X-Pages": "3"}, data=data)
+
+    esihub_client.request = request
+    stats = await esihub_client.export(
+        "GET", "/markets/10000002/orders/", ESIHubNDJSONSink(str(path))
+    )
+
+    assert stats == {"pages": 3, "pages_written": 3, "items_written": 50}
+    assert len(read_ndjson(path)) == 50
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(esihub_client, tmp_path):
+    if exporter.pyarrow is None:
+        pytest.skip("pyarrow is not installed")
+
+    await esihub_client.export(
+        "GET", "/markets/10000002/orders/", ESIHubParquetSink(str(tmp_path / "orders"))
+    )
+
+    table = exporter.pyarrow.parquet.read_table(str(tmp_path / "orders"))
+    assert table.num_rows == 300
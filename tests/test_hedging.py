@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import ESIHubClient
+from esihub.core.config import ESIHubConfig
+from esihub.core.hedging import ESIHubHedger, ESIHubLatencyTracker
+
+
+def test_latency_tracker_percentile():
+    tracker = ESIHubLatencyTracker(min_samples=10)
+    for i in range(9):
+        tracker.observe("/route/", 0.01)
+    assert tracker.estimate("/route/") is None
+
+    for i in range(91):
+        tracker.observe("/route/", 5.0 if i >= 85 else 0.01)
+
+    assert tracker.estimate("/route/") == 5.0
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_extra_requests():
+    config = ESIHubConfig()
+    config.update({"HEDGE_ENABLED": True, "HEDGE_DELAY": 0.01, "HEDGE_BUDGET_BURST": 2})
+    hedger = ESIHubHedger(config)
+    calls = []
+
+    async def send():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    for _ in range(4):
+        assert await hedger.run("/route/", send, lambda: True) == "ok"
+
+    assert len(calls) == 6
+
+
+@pytest.fixture
+async def esihub_server():
+    state = {"hits": 0}
+
+    async def status(request):
+        state["hits"] += 1
+        if state["hits"] == 1:
+            await asyncio.sleep(2)
+        return web.json_response({"players": state["hits"]})
+
+    app = web.Application()
+    app.router.add_get("/latest/status/", status)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_get_is_hedged(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+            "HEDGE_ENABLED": True,
+            "HEDGE_DELAY": 0.05,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    try:
+        started = time.monotonic()
+        response = await client.request("GET", "/status/")
+        elapsed = time.monotonic() - started
+    finally:
+        await client.close()
+
+    assert response.data == {"players": 2}
+    assert elapsed < 1
+    assert esihub_server.state["hits"] == 2
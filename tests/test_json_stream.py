@@ -0,0 +1,154 @@
+import json
+import random
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import (
+    ESIHubCircuitOpenError,
+    ESIHubClient,
+    ESIHubClientError,
+    ESIHubServerError,
+)
+from esihub.core.config import ESIHubConfig
+from esihub.core.json_stream import ESIHubJSONArrayDecoder
+
+ITEMS = [
+    {"order_id": i, "price": i * 1.5, "name": "Æther ☃", "tags": [i, None, True]}
+    for i in range(300)
+] + [12345, "plain", None, -0.5e-3]
+
+
+def decode_in_chunks(body: bytes, seed: int):
+    rng = random.Random(seed)
+    decoder = ESIHubJSONArrayDecoder()
+    items, pos = [], 0
+    while pos < len(body):
+        size = rng.randint(1, 64)
+        items.extend(decoder.feed(body[pos : pos + size]))
+        pos += size
+    items.extend(decoder.close())
+    return items
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_decoder_handles_arbitrary_chunk_boundaries(seed):
+    body = json.dumps(ITEMS, ensure_ascii=False, indent=seed % 2).encode()
+
+    assert decode_in_chunks(body, seed) == ITEMS
+
+
+def test_decoder_yields_items_before_body_ends():
+    decoder = ESIHubJSONArrayDecoder()
+
+    assert decoder.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert decoder.feed(b": 2}, 3") == [{"b": 2}]
+    assert decoder.feed(b"]") == [3]
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"[1.", b"5, 2]"], [1.5, 2]),
+        ([b"[1e", b"3, 2]"], [1e3, 2]),
+        ([b"[-", b"1.5E", b"-2]"], [-1.5e-2]),
+    ],
+)
+def test_decoder_waits_for_numbers_split_across_chunks(chunks, expected):
+    decoder = ESIHubJSONArrayDecoder()
+    items = []
+    for chunk in chunks:
+        items.extend(decoder.feed(chunk))
+    items.extend(decoder.close())
+
+    assert items == expected
+
+
+@pytest.mark.parametrize("body", [b"", b"[1, 2", b'{"a": 1}', b"[1 2]"])
+def test_decoder_rejects_invalid_input(body):
+    decoder = ESIHubJSONArrayDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(body)
+        decoder.close()
+
+
+@pytest.fixture
+async def esihub_server():
+    async def orders(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        body = json.dumps(ITEMS).encode()
+        for i in range(0, len(body), 1000):
+            await response.write(body[i : i + 1000])
+        return response
+
+    async def missing(request):
+        return web.json_response({"error": "Type not found"}, status=404)
+
+    async def failing(request):
+        state["hits"] += 1
+        return web.json_response({"error": "Bad gateway"}, status=502)
+
+    state = {"hits": 0}
+    app = web.Application()
+    app.router.add_get("/latest/markets/10000002/orders/", orders)
+    app.router.add_get("/latest/markets/10000003/orders/", failing)
+    app.router.add_get("/latest/universe/types/0/", missing)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def esihub_client(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_items(esihub_client):
+    items = [
+        item
+        async for item in esihub_client.stream_items("GET", "/markets/10000002/orders/")
+    ]
+
+    assert items == ITEMS
+
+
+@pytest.mark.asyncio
+async def test_stream_request_raises_esi_errors(esihub_client):
+    with pytest.raises(ESIHubClientError) as error:
+        async for _ in esihub_client.stream_request("GET", "/universe/types/0/"):
+            pass
+
+    assert error.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_respects_open_circuit(esihub_client, esihub_server):
+    path = "/markets/10000003/orders/"
+    for _ in range(esihub_client.circuit_breakers.failure_threshold):
+        with pytest.raises(ESIHubServerError):
+            async for _ in esihub_client.stream_items("GET", path):
+                pass
+    hits = esihub_server.state["hits"]
+
+    with pytest.raises(ESIHubCircuitOpenError):
+        async for _ in esihub_client.stream_items("GET", path):
+            pass
+
+    assert esihub_server.state["hits"] == hits
+    assert esihub_client.semaphore.in_flight == 0
@@ -0,0 +1,136 @@
+import base64
+import json
+import time
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from esihub.auth import ESIHubAuth
+from esihub.core.config import ESIHubConfig
+from esihub.core.jwt_validator import ESIHubJWKSCache
+from esihub.exceptions import ESIHubAuthenticationError
+
+
+def b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def b64int(value: int) -> str:
+    return b64(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+RSA_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+EC_KEY = ec.generate_private_key(ec.SECP256R1())
+
+
+def make_token(alg="RS256", kid="JWT-Signature-Key", **claims):
+    payload = {
+        "scp": ["esi-skills.read_skills.v1", "esi-wallet.read_character_wallet.v1"],
+        "sub": "CHARACTER:EVE:2112625428",
+        "aud": ["test_client_id", "EVE Online"],
+        "iss": "https://login.eveonline.com",
+        "exp": int(time.time()) + 1200,
+        **claims,
+    }
+    header = b64(json.dumps({"alg": alg, "kid": kid, "typ": "JWT"}).encode())
+    body = b64(json.dumps(payload).encode())
+    signing_input = f"{header}.{body}".encode()
+    if alg == "RS256":
+        signature = RSA_KEY.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+    else:
+        r, s = decode_dss_signature(
+            EC_KEY.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+        )
+        signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    return f"{header}.{body}.{b64(signature)}"
+
+
+@pytest.fixture
+def auth(tmp_path):
+    rsa_numbers = RSA_KEY.public_key().public_numbers()
+    ec_numbers = EC_KEY.public_key().public_numbers()
+    jwks = {
+        "keys": [
+            {
+                "kty": "RSA",
+                "kid": "JWT-Signature-Key",
+                "alg": "RS256",
+                "e": b64int(rsa_numbers.e),
+                "n": b64int(rsa_numbers.n),
+            },
+            {
+                "kty": "EC",
+                "kid": "JWT-Signature-Key-EC",
+                "crv": "P-256",
+                "x": b64int(ec_numbers.x),
+                "y": b64int(ec_numbers.y),
+            },
+        ]
+    }
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(json.dumps(jwks))
+
+    config = ESIHubConfig()
+    config.update({"ESI_CLIENT_ID": "test_client_id", "SSO_JWKS_FILE": str(jwks_file)})
+    return ESIHubAuth(config)
+
+
+@pytest.mark.asyncio
+async def test_verify_token_locally(auth):
+    claims = await auth.verify_token(make_token(), scopes=["esi-skills.read_skills.v1"])
+
+    assert auth.jwt_validator.character_id(claims) == 2112625428
+    assert auth.session is None
+
+
+@pytest.mark.asyncio
+async def test_verify_es256_token(auth):
+    claims = auth.jwt_validator.verify_sync(
+        make_token(alg="ES256", kid="JWT-Signature-Key-EC")
+    )
+
+    assert claims["iss"] == "https://login.eveonline.com"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "token",
+    [
+        make_token(exp=int(time.time()) - 60),
+        make_token(iss="https://evil.example.com"),
+        make_token(aud=["other_client", "EVE Online"]),
+        make_token()[:-4] + "AAAA",
+    ],
+)
+async def test_rejects_invalid_tokens(auth, token):
+    with pytest.raises(ESIHubAuthenticationError):
+        await auth.verify_token(token)
+
+
+@pytest.mark.asyncio
+async def test_rejects_missing_scopes(auth):
+    with pytest.raises(ESIHubAuthenticationError):
+        await auth.verify_token(make_token(), scopes=["esi-assets.read_assets.v1"])
+
+
+@pytest.mark.asyncio
+async def test_sso_outage_keeps_cached_keys(auth):
+    calls = []
+
+    async def fetch_jwks():
+        calls.append(1)
+        raise OSError("SSO unavailable")
+
+    jwks = ESIHubJWKSCache(fetch_jwks, refresh_interval=0, min_refresh_interval=60)
+    jwks.keys = auth.jwks.keys
+    auth.jwt_validator.jwks = jwks
+
+    claims = await auth.jwt_validator.verify(make_token())
+    assert claims["sub"] == "CHARACTER:EVE:2112625428"
+    await auth.jwt_validator.verify(make_token(alg="ES256", kid="JWT-Signature-Key-EC"))
+    with pytest.raises(ESIHubAuthenticationError):
+        await auth.jwt_validator.verify(make_token(kid="rotated"))
+
+    assert len(calls) == 1
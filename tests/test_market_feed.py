@@ -0,0 +1,112 @@
+import hashlib
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from esihub import ESIHubClient
+from esihub.core.config import ESIHubConfig
+
+
+def order(order_id, price=10.0, volume_remain=100):
+    return {
+        "order_id": order_id,
+        "price": price,
+        "volume_remain": volume_remain,
+        "volume_total": 100,
+        "type_id": 34,
+        "location_id": 60003760,
+        "is_buy_order": False,
+    }
+
+
+@pytest.fixture
+async def esihub_server():
+    state = {"pages": [], "not_modified": 0}
+
+    async def orders(request):
+        pages = state["pages"]
+        page = int(request.query.get("page", 1))
+        body = json.dumps(pages[page - 1] if page <= len(pages) else []).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        headers = {"ETag": etag, "X-Pages": str(len(pages))}
+        if request.headers.get("If-None-Match") == etag:
+            state["not_modified"] += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, headers=headers, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/latest/markets/{region_id}/orders/", orders)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def esihub_client(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_feed_reports_changes_and_skips_unchanged_pages(
+    esihub_client, esihub_server
+):
+    events = []
+
+    @esihub_client.event_system.on("market_orders_changed")
+    async def on_changes(region_id, changes):
+        events.append(changes)
+
+    feed = esihub_client.market_order_feed(10000002)
+    esihub_server.state["pages"] = [
+        [order(1), order(2)],
+        [order(3), order(4)],
+        [order(5)],
+    ]
+    changes = await feed.poll()
+    assert [o["order_id"] for o in changes.new] == [1, 2, 3, 4, 5]
+    assert len(feed) == 5
+
+    # 1 is repriced, 2 is filled, 3 moves to page 1, 6 is new, page 3 is as it was.
+    esihub_server.state["pages"] = [
+        [order(1, price=9.5), order(3)],
+        [order(4), order(6)],
+        [order(5)],
+    ]
+    changes = await feed.poll()
+    assert [o["order_id"] for o in changes.new] == [6]
+    assert [(o["order_id"], old.price) for o, old in changes.updated] == [(1, 10.0)]
+    assert [order_id for order_id, _ in changes.closed] == [2]
+    assert (changes.pages_fetched, changes.pages_skipped) == (2, 1)
+    assert esihub_server.state["not_modified"] == 1
+
+    # The region shrinks to two pages, which are otherwise unchanged.
+    esihub_server.state["pages"] = esihub_server.state["pages"][:2]
+    changes = await feed.poll()
+    assert changes.new == [] and changes.updated == []
+    assert [order_id for order_id, _ in changes.closed] == [5]
+    assert changes.pages_skipped == 2
+    assert sorted(feed.orders) == [1, 3, 4, 6]
+
+    unchanged = await feed.poll()
+    assert unchanged.empty
+    assert len(events) == 3
+
+    # Polled again well within the cache TTL, a change must still show up.
+    esihub_server.state["pages"][0] = [order(1, price=9.0), order(3)]
+    changes = await feed.poll()
+    assert [(o["order_id"], old.price) for o, old in changes.updated] == [(1, 9.5)]
+    assert len(events) == 4
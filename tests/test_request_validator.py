@@ -0,0 +1,79 @@
+import pytest
+
+from esihub import ESIHubClient, ESIHubValidationError
+from esihub.core.config import ESIHubConfig
+from esihub.core.request_validator import ESIHubRequestValidator
+from esihub.core.spec_index import ESIHubSpecIndex
+from esihub.utils import load_swagger_spec
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return ESIHubRequestValidator(ESIHubSpecIndex(load_swagger_spec()))
+
+
+def errors_for(validator, method, path, **kwargs):
+    try:
+        validator.validate(method, path, kwargs)
+    except ESIHubValidationError as e:
+        return e.details["errors"]
+    return []
+
+
+def test_query_and_path_parameters(validator):
+    assert (
+        errors_for(
+            validator, "GET", "/markets/10000002/orders/", params={"order_type": "sell"}
+        )
+        == []
+    )
+    assert errors_for(
+        validator, "GET", "/markets/10000002/orders/", params={"order_type": "bid"}
+    ) == ["query.order_type: must be one of buy, sell, all"]
+    assert errors_for(validator, "GET", "/markets/10000002/history/") == [
+        "query.type_id: is required"
+    ]
+    assert (
+        errors_for(
+            validator, "GET", "/markets/10000002/history/", params={"type_id": "34"}
+        )
+        == []
+    )
+    assert errors_for(validator, "GET", "/characters/0/") == [
+        "path.character_id: must be >= 1"
+    ]
+    errors = errors_for(
+        validator,
+        "GET",
+        "/characters/90000001/search/",
+        params={"categories": "character,ship", "search": "Jita"},
+    )
+    assert errors[0].startswith("query.categories[1]: must be one of agent, ")
+
+
+def test_body_and_unknown_paths(validator):
+    assert errors_for(validator, "POST", "/universe/names/", json=[34, 35]) == []
+    assert errors_for(validator, "POST", "/universe/names/") == ["body: is required"]
+    assert errors_for(validator, "POST", "/universe/names/", json=[34, "x"]) == [
+        "body[1]: must be an integer"
+    ]
+    assert errors_for(validator, "POST", "/universe/names/", json=[34, 34]) == [
+        "body: must not contain duplicates"
+    ]
+    assert errors_for(validator, "GET", "/not/in/the/spec/", params={"x": 1}) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dry_run", [True, False])
+async def test_client_rejects_before_queueing(dry_run):
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": dry_run})
+    client = ESIHubClient(config)
+
+    with pytest.raises(ESIHubValidationError):
+        await client.request(
+            "GET", "/markets/10000002/orders/", params={"order_type": "bid"}
+        )
+
+    assert client.session is None
+    assert client.semaphore.in_flight == 0
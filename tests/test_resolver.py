@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from esihub import ESIHubClient, ESIHubResponse
+from esihub.core.config import ESIHubConfig
+from esihub.core.resolver import ESIHubNameResolver
+
+
+@pytest.fixture
+def esihub_client():
+    config = ESIHubConfig()
+    config.update({"DRY_RUN": True})
+    return ESIHubClient(config)
+
+
+@pytest.mark.asyncio
+async def test_only_unknown_ids_go_over_the_network(esihub_client):
+    calls = []
+
+    async def request(method, path, json):
+        calls.append((path, list(json)))
+        if path == "/universe/names/":
+            data = [
+                {"id": i, "name": f"Pilot {i}", "category": "character"} for i in json
+            ]
+        else:
+            data = {"systems": [{"id": 30000142, "name": "Jita"}]}
+        return ESIHubResponse(status=200, headers={}, data=data)
+
+    esihub_client.request = request
+    resolver = esihub_client.resolver
+    resolver.warm([(30002187, "Amarr", "solar_system")])
+
+    names = await resolver.resolve_names([30002187, 90000001, 90000002])
+    assert names == {
+        30002187: "Amarr",
+        90000001: "Pilot 90000001",
+        90000002: "Pilot 90000002",
+    }
+    assert calls == [("/universe/names/", [90000001, 90000002])]
+
+    ids = await resolver.resolve_ids(["jita", "Amarr"], category="solar_system")
+    assert ids == {"jita": 30000142, "Amarr": 30002187}
+    assert calls[-1] == ("/universe/ids/", ["jita"])
+
+    assert resolver.id("JITA") == 30000142
+    assert resolver.category(90000001) == "character"
+
+
+@pytest.mark.asyncio
+async def test_unresolved_names_expire_per_category(esihub_client):
+    calls = []
+
+    async def request(method, path, json):
+        calls.append(list(json))
+        return ESIHubResponse(status=200, headers={}, data={})
+
+    esihub_client.request = request
+    resolver = ESIHubNameResolver(esihub_client, negative_ttl=0.05)
+
+    assert await resolver.resolve_ids(["Nowhere"], "solar_system") == {"Nowhere": None}
+    await resolver.resolve_ids(["nowhere"], "solar_system")
+    assert len(calls) == 1
+
+    await resolver.resolve_ids(["Nowhere"], "station")
+    assert len(calls) == 2
+
+    await asyncio.sleep(0.06)
+    await resolver.resolve_ids(["Nowhere"], "solar_system")
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_index_persists_to_file(esihub_client, tmp_path):
+    path = str(tmp_path / "names.json.gz")
+    esihub_client.resolver.warm(
+        [(30000142, "Jita", "solar_system"), (34, "Tritanium", "inventory_type")]
+    )
+    esihub_client.resolver.save(path)
+
+    other = ESIHubClient(esihub_client.config)
+    assert other.resolver.load(path) == 2
+    assert other.resolver.name(34) == "Tritanium"
+    assert other.resolver.id("tritanium", "inventory_type") == 34
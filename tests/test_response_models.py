@@ -0,0 +1,102 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import BaseModel
+
+from esihub import ESIHubClient, ESIHubValidationError
+from esihub.core.config import ESIHubConfig
+
+ORDERS = [
+    {
+        "duration": 90,
+        "is_buy_order": False,
+        "issued": "2016-09-03T05:12:25Z",
+        "location_id": 60005599,
+        "min_volume": 1,
+        "order_id": 4623824223,
+        "price": 9.9,
+        "range": "region",
+        "system_id": 30000053,
+        "type_id": 34,
+        "volume_remain": 1296000,
+        "volume_total": 2000000,
+    }
+]
+
+
+class Order(BaseModel):
+    order_id: int
+    price: float
+
+
+@pytest.fixture
+async def esihub_server():
+    async def orders(request):
+        return web.json_response(ORDERS)
+
+    async def broken(request):
+        return web.json_response([{"order_id": "not a number"}])
+
+    app = web.Application()
+    app.router.add_get("/latest/markets/10000002/orders/", orders)
+    app.router.add_get("/latest/markets/10000043/orders/", broken)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def esihub_client(esihub_server):
+    config = ESIHubConfig()
+    config.update(
+        {
+            "ESI_BASE_URL": str(esihub_server.make_url("")).rstrip("/"),
+            "USE_HTTPS": False,
+        }
+    )
+    client = ESIHubClient(config)
+    await client.initialize()
+    yield client
+    await client.close()
+
+
+def test_models_are_generated_once_per_operation(esihub_client):
+    models = esihub_client.response_models
+
+    adapter = models.adapter_for("get_markets_region_id_orders")
+
+    assert models.adapter_for("get_markets_region_id_orders") is adapter
+    assert models.model_for("get_status").model_fields["players"].is_required()
+
+
+@pytest.mark.asyncio
+async def test_spec_model_validates_list_responses(esihub_client):
+    response = await esihub_client.request(
+        "GET", "/markets/10000002/orders/", model=True
+    )
+    assert response.data == ORDERS
+
+    response = await esihub_client.request(
+        "GET", "/markets/10000002/orders/", model=True, as_model=True
+    )
+    assert response.data[0].order_id == 4623824223
+    assert response.data[0].issued.year == 2016
+
+
+@pytest.mark.asyncio
+async def test_user_model_wraps_list_responses(esihub_client):
+    response = await esihub_client.request(
+        "GET", "/markets/10000002/orders/", model=Order, as_model=True
+    )
+
+    assert response.data == [Order(order_id=4623824223, price=9.9)]
+    # The cached response still holds the plain decoded payload.
+    cached = await esihub_client.request("GET", "/markets/10000002/orders/")
+    assert cached.data == ORDERS
+
+
+@pytest.mark.asyncio
+async def test_invalid_payload_raises(esihub_client):
+    with pytest.raises(ESIHubValidationError):
+        await esihub_client.request("GET", "/markets/10000043/orders/", model=True)
@@ -0,0 +1,128 @@
+import pytest
+
+from esihub import (
+    ESIHubClientError,
+    ESIHubConnectionError,
+    ESIHubServerError,
+    ESIHubTimeoutError,
+)
+from esihub.core import retry_policy
+from esihub.core.config import ESIHubConfig
+from esihub.core.metrics import ESIHubMetrics
+from esihub.core.retry_policy import ESIHubRetryBudget, ESIHubRetryPolicy
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry_policy.asyncio, "sleep", sleep)
+    return delays
+
+
+def make_policy(**options):
+    config = ESIHubConfig()
+    config.update({"RETRY_BASE_DELAY": 0.1, "RETRY_MAX_DELAY": 5.0, **options})
+    return ESIHubRetryPolicy(config, ESIHubMetrics())
+
+
+def failing(*errors, result="ok"):
+    calls = []
+
+    async def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return func, calls
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_with_jitter(sleeps):
+    policy = make_policy()
+    func, calls = failing(
+        ESIHubServerError("Bad gateway", 502),
+        ESIHubTimeoutError("Timed out"),
+        ESIHubConnectionError("Connection reset by peer"),
+    )
+
+    assert await policy.call("GET", func) == "ok"
+    assert len(calls) == 4
+    assert all(0.1 <= delay <= 5.0 for delay in sleeps)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, error",
+    [
+        ("GET", ESIHubClientError("Not found", 404)),
+        ("GET", ESIHubServerError("Internal error", 500)),
+        ("POST", ESIHubServerError("Bad gateway", 502)),
+    ],
+)
+async def test_does_not_retry_permanent_errors(sleeps, method, error):
+    func, calls = failing(error)
+
+    with pytest.raises(type(error)):
+        await make_policy().call(method, func)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_honours_server_hints(sleeps):
+    policy = make_policy()
+    func, _ = failing(
+        ESIHubServerError("Unavailable", 503, headers={"Retry-After": "3"}),
+        ESIHubServerError(
+            "Bad gateway",
+            502,
+            headers={"X-Esi-Error-Limit-Remain": "5", "X-Esi-Error-Limit-Reset": "4"},
+        ),
+    )
+
+    await policy.call("GET", func)
+
+    assert sleeps[0] >= 3 and sleeps[1] >= 4
+
+    func, calls = failing(
+        ESIHubServerError("Unavailable", 503, headers={"Retry-After": "120"})
+    )
+    with pytest.raises(ESIHubServerError):
+        await policy.call("GET", func)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_limits_amplification(sleeps):
+    policy = make_policy(ESI_RETRY_ATTEMPTS=10)
+    policy.budget = ESIHubRetryBudget(ratio=0.1, min_per_second=0, max_tokens=2)
+    func, calls = failing(*[ESIHubServerError("Bad gateway", 502)] * 10)
+
+    with pytest.raises(ESIHubServerError):
+        await policy.call("GET", func)
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_only_first_attempt_earns_budget(sleeps):
+    policy = make_policy(ESI_RETRY_ATTEMPTS=10)
+    policy.budget = ESIHubRetryBudget(ratio=0.5, min_per_second=0, max_tokens=10)
+    policy.budget.tokens = 1.0
+    func, calls = failing(*[ESIHubServerError("Bad gateway", 502)] * 2)
+
+    with pytest.raises(ESIHubServerError):
+        await policy.call("GET", func)
+
+    assert len(calls) == 2
+
+
+def test_malformed_error_limit_headers_are_ignored():
+    policy = make_policy()
+    headers = {"X-Esi-Error-Limit-Remain": "n/a", "X-Esi-Error-Limit-Reset": "4"}
+
+    assert policy.server_hint(headers) is None
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from esihub.core.concurrency import ESIHubAdaptiveLimiter
+from esihub.core.metrics import ESIHubMetrics
+from esihub.core.scheduler import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_NORMAL,
+    ESIHubFairQueue,
+)
+
+
+async def dispatch_order(limiter, requests):
+    order = []
+
+    async def worker(name, priority, tenant):
+        async with limiter.slot(priority, tenant):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await limiter.acquire()
+    tasks = []
+    for name, priority, tenant in requests:
+        tasks.append(asyncio.create_task(worker(name, priority, tenant)))
+        await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_fairly_within_a_priority():
+    limiter = ESIHubAdaptiveLimiter(1, adaptive=False)
+    limiter.queue.set_weight("crawler", 1)
+    requests = [(f"a{i}", PRIORITY_BULK, "crawler") for i in range(4)]
+    requests += [(f"b{i}", PRIORITY_BULK, 2112625428) for i in range(2)]
+
+    order = await dispatch_order(limiter, requests)
+
+    assert order == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_priority_and_weights():
+    limiter = ESIHubAdaptiveLimiter(1, adaptive=False)
+    limiter.queue.set_weight("web", 2)
+    requests = [(f"bulk{i}", PRIORITY_BULK, "crawler") for i in range(2)]
+    requests += [(f"ui{i}", PRIORITY_INTERACTIVE, "web") for i in range(2)]
+    requests += [(f"c{i}", PRIORITY_BULK, "corp") for i in range(2)]
+    requests += [(f"w{i}", PRIORITY_BULK, "web") for i in range(4)]
+
+    order = await dispatch_order(limiter, requests)
+
+    assert order[:2] == ["ui0", "ui1"]
+    bulk = order[2:]
+    assert bulk.index("w1") < bulk.index("bulk1")
+    assert bulk.index("w1") < bulk.index("c1")
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_and_cancellation():
+    metrics = ESIHubMetrics()
+    limiter = ESIHubAdaptiveLimiter(1, adaptive=False, metrics=metrics)
+    limiter.queue.set_weight("corp", 1)
+    await limiter.acquire()
+    waiters = [asyncio.create_task(limiter.acquire(tenant="corp")) for _ in range(3)]
+    await asyncio.sleep(0)
+    depth = metrics.scheduler_depth.labels(tenant="corp")
+    assert depth._value.get() == 3
+
+    waiters[0].cancel()
+    await asyncio.gather(waiters[0], return_exceptions=True)
+    assert depth._value.get() == 2
+
+    limiter.release()
+    await waiters[1]
+    assert limiter.in_flight == 1 and len(limiter.queue) == 1
+    limiter.release()
+    await waiters[2]
+
+
+@pytest.mark.asyncio
+async def test_unweighted_tenants_share_one_series():
+    metrics = ESIHubMetrics()
+    limiter = ESIHubAdaptiveLimiter(1, adaptive=False, metrics=metrics)
+    await limiter.acquire()
+    waiters = [
+        asyncio.create_task(limiter.acquire(tenant=character_id))
+        for character_id in range(90000001, 90000101)
+    ]
+    await asyncio.sleep(0)
+
+    def series():
+        return {
+            sample.labels["tenant"]: sample.value
+            for sample in metrics.scheduler_depth.collect()[0].samples
+        }
+
+    assert series() == {"other": 100}
+    for waiter in waiters:
+        limiter.release()
+        await waiter
+    assert series() == {}
+
+
+def test_idle_tenant_pruning_is_amortized(monkeypatch):
+    queue = ESIHubFairQueue()
+    walked = []
+    forget_idle = ESIHubFairQueue._forget_idle
+
+    def counting(priority_class):
+        if len(priority_class.last_finish) > priority_class.prune_at:
+            walked.append(len(priority_class.last_finish))
+        forget_idle(priority_class)
+
+    monkeypatch.setattr(ESIHubFairQueue, "_forget_idle", staticmethod(counting))
+    loop = asyncio.new_event_loop()
+    try:
+        # Every tenant has a second request queued, so none of them is idle
+        # while the first round is dispatched.
+        for _ in range(2):
+            for tenant in range(3000):
+                queue.push(loop.create_future(), PRIORITY_NORMAL, tenant)
+        while queue.pop() is not None:
+            pass
+    finally:
+        loop.close()
+
+    assert sum(walked) <= 2 * 6000
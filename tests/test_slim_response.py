@@ -0,0 +1,67 @@
+import json
+
+import pytest
+from multidict import CIMultiDict
+
+from esihub.core.cache import ESIHubCache
+from esihub.core.config import ESIHubConfig
+from esihub.models import ESIHubResponse, ESIHubSlimResponse
+
+HEADERS = CIMultiDict(
+    {
+        "Content-Type": "application/json",
+        "etag": '"abc"',
+        "Expires": "Mon, 19 Oct 2026 10:05:00 GMT",
+        "X-Pages": "3",
+        "X-Esi-Request-Id": "c1f6e2a0",
+    }
+)
+BODY = json.dumps([{"order_id": 1}, {"order_id": 2}]).encode()
+
+
+def test_slim_response_is_lazy_and_compatible():
+    response = ESIHubSlimResponse(200, BODY, HEADERS)
+
+    assert not response.decoded
+    assert isinstance(response, ESIHubResponse)
+    assert response.headers is HEADERS
+    assert response.headers["X-ESI-Request-Id"] == "c1f6e2a0"
+    assert response.etag == '"abc"'
+    assert response.pages == 3
+    assert response.expires.year == 2026
+    assert response.data == [{"order_id": 1}, {"order_id": 2}]
+    assert response.decoded
+    assert response.to_response() == ESIHubResponse(
+        status=200, headers=response.headers, data=response.data
+    )
+    assert (
+        ESIHubSlimResponse.model_validate_json(response.model_dump_json()) == response
+    )
+    assert not hasattr(response, "__dict__")
+
+
+def test_slim_response_bytes_round_trip():
+    response = ESIHubSlimResponse(200, BODY, HEADERS)
+
+    restored = ESIHubSlimResponse.from_bytes(response.to_bytes())
+
+    assert restored.body == BODY
+    assert restored.etag == '"abc"'
+    assert restored.headers["x-esi-request-id"] == "c1f6e2a0"
+    assert restored == response
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_stay_undecoded():
+    cache = ESIHubCache(ESIHubConfig())
+    response = ESIHubSlimResponse(200, BODY, HEADERS)
+    response.data
+    await cache.set("GET", "/markets/10000002/orders/", {}, response, HEADERS)
+
+    hit = await cache.get("GET", "/markets/10000002/orders/", {})
+    hit.data.append({"order_id": 3})
+
+    entry = next(iter(cache.memory_cache.values()))
+    assert not entry.decoded
+    again = await cache.get("GET", "/markets/10000002/orders/", {})
+    assert len(again.data) == 2
@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+import fakeredis.aioredis
+import pytest
+
+from esihub.core.config import ESIHubConfig
+from esihub.core.token_manager import (
+    ESIHubMemoryTokenStore,
+    ESIHubRedisTokenStore,
+    ESIHubTokenManager,
+    ESIHubTokenStore,
+)
+from esihub.models import ESIHubToken
+
+
+class FakeAuth:
+    def __init__(self):
+        self.calls = 0
+
+    async def refresh_token(self, refresh_token):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {
+            "access_token": f"access-{self.calls}",
+            "refresh_token": refresh_token,
+            "expires_in": 1199,
+        }
+
+
+@pytest.fixture
+def esihub_config():
+    config = ESIHubConfig()
+    config.update({"TOKEN_AUTO_REFRESH": False})
+    return config
+
+
+@pytest.mark.asyncio
+async def test_cached_token_is_not_refreshed(esihub_config):
+    auth = FakeAuth()
+    manager = ESIHubTokenManager(auth, config=esihub_config)
+    await manager.add_token(
+        1, {"access_token": "a", "refresh_token": "r", "expires_in": 1199}
+    )
+
+    assert await manager.get_access_token(1) == "a"
+    assert auth.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_collapse(esihub_config):
+    auth = FakeAuth()
+    manager = ESIHubTokenManager(auth, config=esihub_config)
+    await manager.add_token(
+        1, {"access_token": "a", "refresh_token": "r", "expires_in": 0}
+    )
+
+    tokens = await asyncio.gather(*(manager.get_access_token(1) for _ in range(50)))
+
+    assert set(tokens) == {"access-1"}
+    assert auth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_with_redis_store():
+    config = ESIHubConfig()
+    config.update({"TOKEN_REFRESH_MARGIN": 60, "TOKEN_REFRESH_JITTER": 0})
+    auth = FakeAuth()
+    store = ESIHubRedisTokenStore(fakeredis.aioredis.FakeRedis())
+    manager = ESIHubTokenManager(auth, store=store, config=config)
+    await manager.add_token(
+        7, {"access_token": "a", "refresh_token": "r", "expires_in": 60}
+    )
+
+    await asyncio.sleep(0.05)
+
+    stored = await store.get(7)
+    assert auth.calls == 1
+    assert stored.access_token == "access-1"
+    assert stored.expires_at > time.time() + 1000
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_token_refreshed_by_other_worker_is_adopted(esihub_config):
+    auth = FakeAuth()
+    store = ESIHubRedisTokenStore(fakeredis.aioredis.FakeRedis())
+    manager = ESIHubTokenManager(auth, store=store, config=esihub_config)
+    await manager.add_token(
+        3, {"access_token": "old", "refresh_token": "r", "expires_in": 0}
+    )
+    await store.set(
+        ESIHubToken(
+            character_id=3,
+            access_token="new",
+            refresh_token="r",
+            expires_at=time.time() + 1199,
+        )
+    )
+
+    assert await manager.get_access_token(3) == "new"
+    assert auth.calls == 0
+
+
+class SlowTokenStore(ESIHubMemoryTokenStore):
+    async def get(self, character_id):
+        await asyncio.sleep(0.01)
+        return await super().get(character_id)
+
+
+@pytest.mark.asyncio
+async def test_forced_refresh_is_not_absorbed_by_plain_refresh(esihub_config):
+    auth = FakeAuth()
+    manager = ESIHubTokenManager(auth, store=SlowTokenStore(), config=esihub_config)
+    await manager.add_token(
+        1, {"access_token": "a", "refresh_token": "r", "expires_in": 1199}
+    )
+
+    plain, forced = await asyncio.gather(
+        manager.refresh(1), manager.refresh(1, force=True)
+    )
+
+    assert plain.access_token == "a"
+    assert forced.access_token == "access-1"
+    assert auth.calls == 1
+
+
+def test_token_store_is_abstract():
+    with pytest.raises(TypeError):
+        ESIHubTokenStore()